@@ -5,7 +5,7 @@ echo "Installing python dependencies."
 cd scripts
 
 process_id=$!
-pip install fastapi python-dotenv python-docx pymongo pymongo[srv] openpyxl datetime uvicorn &
+pip install fastapi "pydantic>=2" python-dotenv python-docx "pymongo[srv]>=4.9" openpyxl xlsxwriter numpy datetime uvicorn &
 wait $process_id
 
 echo ""
@@ -21,11 +21,21 @@
  # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
 """
 
-from fastapi import FastAPI
+import asyncio
+import datetime
+import logging
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
+from database import Database
+from dependency import Dependency
+from excel_profiler import ExcelProfiler
+from report_cache import ReportCache
+from executor import Executor
 from inventories.master.inventoryMaster import InventoryMaster
+from inventories.master.inventoryValuation import InventoryValuation
 from inventories.request.inventoryRequest import InventoryRequest
 from inventories.demand.inventoryDemand import InventoryDemand
 
@@ -44,6 +54,21 @@ class DependencyData(BaseModel):
     kepala_dinas_ketenagakerjaan: str
 
 
+class RequestFilterData(BaseModel):
+    username: list[str] = []
+    tanggal_awal: str | None = None
+    tanggal_akhir: str | None = None
+    status: list[int] = []
+
+    @field_validator("tanggal_awal", "tanggal_akhir")
+    @classmethod
+    def validateTanggal(cls, tanggal):
+        if(tanggal != None):
+            datetime.datetime.strptime(tanggal, "%Y-%m-%d")
+
+        return tanggal
+
+
 app = FastAPI()
 
 origins = [
@@ -67,6 +92,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("shutdown")
+async def shutdown():
+    Executor.shutdown()
+
+    Database.close()
+    await Database.closeAsync()
+
+if(Dependency.excelProfile):
+    ExcelProfiler.enable()
+
+    # Logged next to the uvicorn access log so every summary stays beside the request it belongs to
+    excelProfileLogger = logging.getLogger("uvicorn.error")
+
+    @app.middleware("http")
+    async def excelProfile(request: Request, callNext):
+        ExcelProfiler.start()
+        response = await callNext(request)
+
+        summary = ExcelProfiler.summary()
+        if(summary):
+            excelProfileLogger.info("%s %s", request.url.path, summary)
+            response.headers["Server-Timing"] = ExcelProfiler.server_timing(summary)
+
+        return response
+
 @app.get("/test")
 def test():
     try:
@@ -77,23 +127,45 @@ def test():
 # ---------------------------------- MASTER ---------------------------------- #
 
 @app.get("/__api/inventory/master/get/dependency")
-def inventoryMasterGetDependencyData():
+async def inventoryMasterGetDependencyData():
     try:
-        return {"success": True, "result": {"dependencyData": InventoryMaster.getDependencyData()}}
+        return {"success": True, "result": {"dependencyData": await InventoryMaster.getDependencyDataAsync()}}
 
     except:
         return {"success": False}
 
 
 @app.get("/__api/inventory/master/get/translated-dependency")
-def inventoryMasterGetDependencyData():
+async def inventoryMasterGetDependencyData():
     try:
+        await InventoryMaster.getDependencyDataAsync()
+
         return {"success": True, "result": {"dependencyData": InventoryMaster.getTranslatedDependencyData()}}
 
     except:
         return {"success": False}
 
 
+@app.get("/__api/inventory/master/get/valuation")
+async def inventoryMasterGetValuation():
+    try:
+        inventoryValuationDocument = await InventoryMaster.getValuationDocumentAsync()
+
+        return {"success": True, "result": {"valuation": await Executor.run(InventoryValuation.getValuation, inventoryValuationDocument)}}
+
+    except:
+        return {"success": False}
+
+
+@app.get("/__api/inventory/master/get/report-cache")
+async def inventoryMasterGetReportCache():
+    try:
+        return {"success": True, "result": {"reportCache": ReportCache.statistics()}}
+
+    except:
+        return {"success": False}
+
+
 @app.post("/__api/inventory/master/update/dependency")
 def inventoryMasterUpdateDependencyData(dependencyData: DependencyData):
     return InventoryMaster.updateDependencyData(dependencyData)
@@ -110,9 +182,11 @@ def inventoryMasterUpdateOption():
 
 
 @app.post("/__api/inventory/master/download/raw/{currentDate}")
-def inventoryMasterRawDownload(currentDate):
+async def inventoryMasterRawDownload(currentDate):
     try:
-        InventoryMaster.writeRaw(currentDate)
+        inventoryMasterDocument = await InventoryMaster.getMasterDocumentAsync()
+
+        await Executor.run(InventoryMaster.writeRaw, currentDate, inventoryMasterDocument)
 
         return {"success": True}
     except:
@@ -120,9 +194,11 @@ def inventoryMasterRawDownload(currentDate):
 
     
 @app.post("/__api/inventory/master/download/inventory/{currentDate}")
-def inventoryMasterInventoryDownload(currentDate):
+async def inventoryMasterInventoryDownload(currentDate):
     try:
-        InventoryMaster.writeInventory(currentDate)
+        inventoryValuationDocument, _ = await asyncio.gather(InventoryMaster.getValuationDocumentAsync(), InventoryMaster.getDependencyDataAsync())
+
+        await Executor.run(InventoryMaster.writeInventory, currentDate, inventoryValuationDocument)
 
         return {"success": True}
     except:
@@ -130,9 +206,23 @@ def inventoryMasterInventoryDownload(currentDate):
 
 
 @app.post("/__api/inventory/master/download/stock/{currentDate}")
-def inventoryMasterStockDownload(currentDate):
+async def inventoryMasterStockDownload(currentDate):
     try:
-        InventoryMaster.writeStock(currentDate)
+        inventoryValuationDocument, _ = await asyncio.gather(InventoryMaster.getValuationDocumentAsync(), InventoryMaster.getDependencyDataAsync())
+
+        await Executor.run(InventoryMaster.writeStock, currentDate, inventoryValuationDocument)
+
+        return {"success": True}
+    except:
+        return {"success": False}
+
+
+@app.post("/__api/inventory/master/download/all/{currentDate}")
+async def inventoryMasterAllDownload(currentDate):
+    try:
+        inventoryMasterDocument, inventoryValuationDocument, _ = await asyncio.gather(InventoryMaster.getMasterDocumentAsync(), InventoryMaster.getValuationDocumentAsync(), InventoryMaster.getDependencyDataAsync())
+
+        await Executor.run(InventoryMaster.writeAll, currentDate, inventoryMasterDocument, inventoryValuationDocument)
 
         return {"success": True}
     except:
@@ -142,11 +232,13 @@ def inventoryMasterStockDownload(currentDate):
 # ---------------------------------- REQUEST --------------------------------- #
 
 @app.post("/__api/inventory/request/update/option")
-def inventoryRequestUpdateOption():
+async def inventoryRequestUpdateOption():
     try:
-        InventoryRequest.updateUserData()
+        requestChangeDocument = await InventoryRequest.getRequestChangeDocumentAsync()
+
+        await Executor.run(InventoryRequest.updateUserDataIncremental, requestChangeDocument)
 
-        InventoryRequest.updateOptionData()
+        await Executor.run(InventoryRequest.updateOptionData)
 
         return {"success": True}
     except:
@@ -154,9 +246,23 @@ def inventoryRequestUpdateOption():
 
 
 @app.post("/__api/inventory/request/download/raw/{currentDate}")
-def inventoryRequestRawDownload(currentDate):
+async def inventoryRequestRawDownload(currentDate):
+    try:
+        inventoryRequestDocument, inventoryMasterDocument = await asyncio.gather(InventoryRequest.getRequestDocumentAsync(), InventoryMaster.getMasterDocumentAsync())
+
+        await Executor.run(InventoryRequest.writeRaw, currentDate, inventoryRequestDocument, inventoryMasterDocument)
+
+        return {"success": True}
+    except:
+        return {"success": False}
+
+
+@app.post("/__api/inventory/request/download/filter/{currentDate}")
+async def inventoryRequestFilterDownload(currentDate, requestFilterData: RequestFilterData):
     try:
-        InventoryRequest.writeRaw(currentDate)
+        inventoryRequestDocument, inventoryMasterDocument = await asyncio.gather(InventoryRequest.getFilterDocumentAsync(requestFilterData.username, requestFilterData.tanggal_awal, requestFilterData.tanggal_akhir, requestFilterData.status), InventoryMaster.getMasterDocumentAsync())
+
+        await Executor.run(InventoryRequest.writeFilter, currentDate, inventoryRequestDocument, inventoryMasterDocument)
 
         return {"success": True}
     except:
@@ -164,9 +270,23 @@ def inventoryRequestRawDownload(currentDate):
 
 
 @app.post("/__api/inventory/request/download/user/{userId}/date/{dateId}")
-def inventoryRequestUserDownload(userId, dateId):
+async def inventoryRequestUserDownload(userId, dateId):
+    try:
+        inventoryMasterDocument = await InventoryMaster.getMasterDocumentAsync()
+
+        await Executor.run(InventoryRequest.writeUser, int(userId), int(dateId), inventoryMasterDocument)
+
+        return {"success": True}
+    except:
+        return {"success": False}
+
+
+@app.post("/__api/inventory/request/download/user/all/{currentDate}")
+async def inventoryRequestUserAllDownload(currentDate):
     try:
-        InventoryRequest.writeUser(int(userId), int(dateId))
+        inventoryMasterDocument = await InventoryMaster.getMasterDocumentAsync()
+
+        await Executor.run(InventoryRequest.writeUserAll, currentDate, inventoryMasterDocument)
 
         return {"success": True}
     except:
@@ -185,9 +305,11 @@ def inventoryDemandUpdateOption():
 
 
 @app.post("/__api/inventory/demand/download/raw/{currentDate}")
-def inventoryDemandRawDownload(currentDate):
+async def inventoryDemandRawDownload(currentDate):
     try:
-        InventoryDemand.writeRaw(currentDate)
+        inventoryDemandDocument, inventoryMasterDocument = await asyncio.gather(InventoryDemand.getDemandDocumentAsync(), InventoryMaster.getMasterDocumentAsync())
+
+        await Executor.run(InventoryDemand.writeRaw, currentDate, inventoryDemandDocument, inventoryMasterDocument)
 
         return {"success": True}
     except:
@@ -0,0 +1,76 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The Benchmark file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+import os
+import time
+import tracemalloc
+
+from dependency import Dependency
+from report_cache import ReportCache
+from inventories.master.inventoryMaster import InventoryMaster
+
+class Benchmark:
+    backends = ["openpyxl", "xlsxwriter"]
+
+    reports = [
+        ["Mentah", InventoryMaster.writeRaw],
+        ["Inventarisasi", InventoryMaster.writeInventory],
+        ["Stok", InventoryMaster.writeStock]
+    ]
+
+    repeat = 3
+
+
+    def run(writeReport, currentDate):
+        wallTimeArray = []
+        for _ in range(Benchmark.repeat):
+            startTime = time.perf_counter()
+            writeReport(currentDate)
+            wallTimeArray.append(time.perf_counter() - startTime)
+
+        tracemalloc.start()
+        writeReport(currentDate)
+        peakMemory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        return min(wallTimeArray), peakMemory
+
+
+    def main():
+        # The report cache would turn every run after the first into a file link
+        ReportCache.enabled = False
+
+        print(f"{'Report':<16}{'Backend':<12}{'Wall Time (s)':>16}{'Peak Memory (MB)':>20}")
+
+        for reportName, writeReport in Benchmark.reports:
+            for backend in Benchmark.backends:
+                Dependency.excelBackend = backend
+                currentDate = f"Benchmark {backend}"
+
+                wallTime, peakMemory = Benchmark.run(writeReport, currentDate)
+                os.remove(f"../{Dependency.inventoryMasterFolderPath}/{reportName} {currentDate}.xlsx")
+
+                print(f"{reportName:<16}{backend:<12}{wallTime:>16.3f}{peakMemory / 1024 / 1024:>20.2f}")
+
+
+Benchmark.main() # Make sure you are on /scripts directory
@@ -21,16 +21,106 @@
  # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
 """
 
+import threading
+
 from pymongo import MongoClient
 
+try:
+    from pymongo import AsyncMongoClient
+
+except ImportError:
+    AsyncMongoClient = None
+
+from dependency import Dependency
+
 class Database():
+    clients = {}
+    collections = {}
+    asyncClients = {}
+    asyncCollections = {}
+    lock = threading.Lock()
+
+    def clientOptions():
+        return {
+            "maxPoolSize": Dependency.mongoDBMaxPoolSize,
+            "minPoolSize": Dependency.mongoDBMinPoolSize,
+            "connectTimeoutMS": Dependency.mongoDBConnectTimeout,
+            "serverSelectionTimeoutMS": Dependency.mongoDBServerSelectionTimeout,
+            "socketTimeoutMS": Dependency.mongoDBSocketTimeout
+        }
+
+
+    def getClient(mongoDBURI: str):
+        client = Database.clients.get(mongoDBURI)
+
+        if(client == None):
+            with Database.lock:
+                client = Database.clients.get(mongoDBURI)
+
+                if(client == None):
+                    client = MongoClient(mongoDBURI, **Database.clientOptions())
+
+                    Database.clients[mongoDBURI] = client
+
+        return client
+
+
     def getCluster(mongoDBURI: str):
-        return MongoClient(mongoDBURI)
+        return Database.getClient(mongoDBURI)
 
 
     def getDatabase(mongoDBURI: str, database: str):
-        return MongoClient(mongoDBURI)[database]
+        return Database.getClient(mongoDBURI)[database]
 
     
     def getCollection(mongoDBURI: str, database: str, collection: str):
-        return MongoClient(mongoDBURI)[database][collection]
\ No newline at end of file
+        key = (mongoDBURI, database, collection)
+
+        databaseCollection = Database.collections.get(key)
+        if(databaseCollection == None):
+            databaseCollection = Database.getClient(mongoDBURI)[database][collection]
+            Database.collections[key] = databaseCollection
+
+        return databaseCollection
+
+
+    def close():
+        with Database.lock:
+            for client in Database.clients.values():
+                client.close()
+
+            Database.clients = {}
+            Database.collections = {}
+
+
+    # The async clients belong to the event loop of the app, so they are only created and used from that loop
+    def getAsyncClient(mongoDBURI: str):
+        client = Database.asyncClients.get(mongoDBURI)
+
+        if(client == None):
+            if(AsyncMongoClient == None):
+                raise TypeError("The async data path requires pymongo 4.9 or newer")
+
+            client = AsyncMongoClient(mongoDBURI, **Database.clientOptions())
+            Database.asyncClients[mongoDBURI] = client
+
+        return client
+
+
+    def getAsyncCollection(mongoDBURI: str, database: str, collection: str):
+        key = (mongoDBURI, database, collection)
+
+        databaseCollection = Database.asyncCollections.get(key)
+        if(databaseCollection == None):
+            databaseCollection = Database.getAsyncClient(mongoDBURI)[database][collection]
+            Database.asyncCollections[key] = databaseCollection
+
+        return databaseCollection
+
+
+    async def closeAsync():
+        for client in Database.asyncClients.values():
+            await client.close()
+
+        Database.asyncClients = {}
+        Database.asyncCollections = {}
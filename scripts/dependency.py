@@ -28,7 +28,18 @@ class Dependency():
 
     #region Main
     mongoDBURI = environtmentValues.get("CLUSTER_URI")
+    mongoDBMaxPoolSize = int(environtmentValues.get("CLUSTER_MAX_POOL_SIZE", 100))
+    mongoDBMinPoolSize = int(environtmentValues.get("CLUSTER_MIN_POOL_SIZE", 0))
+    mongoDBConnectTimeout = int(environtmentValues.get("CLUSTER_CONNECT_TIMEOUT_MS", 20000))
+    mongoDBServerSelectionTimeout = int(environtmentValues.get("CLUSTER_SERVER_SELECTION_TIMEOUT_MS", 30000))
+    mongoDBSocketTimeout = int(environtmentValues.get("CLUSTER_SOCKET_TIMEOUT_MS")) if environtmentValues.get("CLUSTER_SOCKET_TIMEOUT_MS") else None
     mainFilePath = "spreadsheets"
+    excelBackend = environtmentValues.get("EXCEL_BACKEND", "openpyxl")
+    excelProfile = environtmentValues.get("EXCEL_PROFILE", "false").lower() == "true"
+    renderMaxWorkers = int(environtmentValues.get("RENDER_MAX_WORKERS", 2))
+    reportCacheEnabled = environtmentValues.get("REPORT_CACHE", "true").lower() == "true"
+    reportCacheFolderPath = f"{mainFilePath}/cache"
+    reportCacheMaxSize = int(environtmentValues.get("REPORT_CACHE_MAX_SIZE_MB", 200)) * 1024 * 1024
 
     #endregion Main
     
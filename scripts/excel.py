@@ -25,40 +25,298 @@
 import openpyxl
 import openpyxl.utils.cell
 
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.drawing.image import Image as ExcelImage
 from openpyxl.styles import *
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.utils import get_column_letter
 from math import ceil
+from io import BytesIO
+from copy import copy
+
+from excel_backend import ExcelBackend, OpenpyxlBackend
+
+class Style():
+    fonts = {}
+    fills = {}
+    borders = {}
+    alignments = {}
+
+
+    def key(**attributes: any):
+        return tuple(sorted(attributes.items()))
+
+
+    def font(**attributes: any):
+        key = Style.key(**attributes)
+
+        font = Style.fonts.get(key)
+        if(font == None):
+            font = Font(**Excel.font_attributes(**attributes))
+            Style.fonts[key] = font
+
+        return font
+
+
+    def fill(**attributes: any):
+        key = ("fill",) + Style.key(**attributes)
+
+        pattern_fill = Style.fills.get(key)
+        if(pattern_fill == None):
+            pattern_fill = PatternFill(**Excel.fill_attributes(**attributes))
+            Style.fills[key] = pattern_fill
+
+        return pattern_fill
+
+
+    def shade(**attributes: any):
+        key = ("shade",) + Style.key(**attributes)
+
+        pattern_fill = Style.fills.get(key)
+        if(pattern_fill == None):
+            pattern_fill = PatternFill(**Excel.shade_attributes(**attributes))
+            Style.fills[key] = pattern_fill
+
+        return pattern_fill
+
+
+    def border(side: str, **attributes: any):
+        if(type(side) != str):
+            raise TypeError("Side data type needs to be a string")
+
+        key = (side.lower(),) + Style.key(**attributes)
+
+        border = Style.borders.get(key)
+        if(border == None):
+            border = Excel.border_set(side, Side(**Excel.border_attributes(**attributes)))
+            Style.borders[key] = border
+
+        return border
+
+
+    def side_thick_border(side: str):
+        key = ("side_thick", side)
+
+        border = Style.borders.get(key)
+        if(border == None):
+            if(side == "left"):
+                border = Border(left=Side(style='thick'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+
+            elif(side == "right"):
+                border = Border(left=Side(style='thin'), right=Side(style='thick'), top=Side(style='thin'), bottom=Side(style='thin'))
+
+            else:
+                raise TypeError("Side value can only be left, right")
+
+            Style.borders[key] = border
+
+        return border
+
+
+    def alignment(**attributes: any):
+        key = Style.key(**attributes)
+
+        alignment = Style.alignments.get(key)
+        if(alignment == None):
+            alignment = Alignment(**Excel.alignment_attributes(**attributes))
+            Style.alignments[key] = alignment
+
+        return alignment
+
+
+    def resolve(**attributes: any):
+        cell_style = {}
+        for attribute, value in attributes.items():
+            if(attribute == "number_format"):
+                cell_style["number_format"] = value
+
+            elif(type(value) != dict):
+                cell_style[attribute] = value
+
+            elif(attribute == "font"):
+                cell_style["font"] = Style.font(**value)
+
+            elif(attribute == "fill"):
+                cell_style["fill"] = Style.fill(**value)
+
+            elif(attribute == "border"):
+                value = dict(value)
+                cell_style["border"] = Style.border(value.pop("side", "all"), **value)
+
+            elif(attribute == "alignment"):
+                cell_style["alignment"] = Style.alignment(**value)
+
+            else:
+                raise TypeError("Style attribute can only be font, fill, border, alignment, number_format")
+
+        return cell_style
+
+
+class RowStyle():
+    def __init__(self, style_spec: dict):
+        self.columns = {}
+        for column_range, attributes in style_spec.items():
+            if(type(column_range) == int):
+                start_column, end_column = column_range, column_range
+
+            elif(type(column_range) == str):
+                column_range = column_range.split(":")
+                start_column = Excel.check_and_convert_string_value(column_range[0])
+                end_column = Excel.check_and_convert_string_value(column_range[-1])
+
+            else:
+                raise TypeError("Column range must be a type of string or integer")
+
+            cell_style = Style.resolve(**attributes)
+            for column in range(start_column, end_column + 1):
+                self.columns.setdefault(column, {}).update(cell_style)
+
+
+class WidthTracker():
+    def __init__(self):
+        self.columns = {}
+        self.merged = {}
+
+
+    def value_width(value: any):
+        if(type(value) in (int, str)):
+            return len(str(value))
+
+        return 0
+
+
+    def update(self, start_column: int, end_column: int, value: any, count: int = 1):
+        width = WidthTracker.value_width(value)
+        if(width == 0):
+            return
+
+        width = ceil(width / (end_column - start_column + 1))
+        for column in range(start_column, end_column + 1):
+            widths = self.columns.setdefault(column, {})
+
+            # A value written past the tracker was never counted, so removing it must not go below zero
+            width_count = widths.get(width, 0) + count
+            if(width_count > 0):
+                widths[width] = width_count
+
+            else:
+                widths.pop(width, None)
+
+
+    def replace(self, row: int, column: int, old_value: any, new_value: any):
+        start_column, end_column = self.merged.get((row, column), (column, column))
+
+        self.update(start_column, end_column, old_value, -1)
+        self.update(start_column, end_column, new_value)
+
+
+    def merge(self, row: int, start_column: int, end_column: int, value: any):
+        self.update(start_column, start_column, value, -1)
+        self.update(start_column, end_column, value)
+
+        self.merged[(row, start_column)] = (start_column, end_column)
+
+
+    def unmerge(self, row: int, start_column: int, value: any):
+        if((row, start_column) in self.merged):
+            start_column, end_column = self.merged.pop((row, start_column))
+
+            self.update(start_column, end_column, value, -1)
+            self.update(start_column, start_column, value)
+
+
+    def width(self, column: int):
+        widths = self.columns.get(column)
+        if(widths):
+            return max(widths)
+
+        return 0
+
 
 class Excel():
+    style_collections = {
+        "font": ("_fonts", "fontId"),
+        "fill": ("_fills", "fillId"),
+        "border": ("_borders", "borderId"),
+        "alignment": ("_alignments", "alignmentId")
+    }
+
     def __init__(self, file_path: str, active_sheet: int = 1):
-        self.file_path = file_path
-        self.workbook = openpyxl.load_workbook(self.file_path, data_only=True)
+        self.setup(openpyxl.load_workbook(file_path, data_only=True), file_path)
 
         wb_sheet = self.workbook.sheetnames
 
         self.active_sheet = self.workbook[wb_sheet[active_sheet - 1]]
 
 
+    def setup(self, workbook: any, file_path: str = None, write_only: bool = False, backend: any = OpenpyxlBackend):
+        self.file_path = file_path
+        self.backend = backend
+        self.workbook = workbook
+        self.write_only = write_only
+        self.style_arrays = {}
+        self.style_indexes = {}
+        self.width_trackers = {}
+        self.wrap_columns = {}
+        self.row_counts = {}
+
+
     def create_file(file_path: str):
         wb = openpyxl.Workbook()
         wb.save(file_path)
 
 
-    def save(self):
-        self.workbook.save(self.file_path)
+    def new(file_path: str = None, write_only: bool = False, backend: str = None):
+        backend = ExcelBackend.get(backend)
+
+        excel = Excel.__new__(Excel)
+        excel.setup(backend.workbook(write_only), file_path, write_only, backend)
+
+        if(write_only):
+            excel.active_sheet = excel.workbook.create_sheet("Sheet")
+
+        else:
+            excel.active_sheet = excel.workbook.active
+
+        return excel
+
+
+    def stream(file_path: str = None, backend: str = None):
+        return Excel.new(file_path, write_only = True, backend = backend)
+
+
+    def save(self, target: any = None):
+        if(target == None):
+            target = self.file_path
+
+        if(target == None):
+            raise TypeError("Save target can only be a file path or a file-like object")
+
+        self.backend.save(self.workbook, target)
+
+        return target
+
+
+    def to_bytes(self):
+        return self.save(BytesIO()).getvalue()
 
 
     def create_sheet(self, new_sheet_name: str):
-        self.workbook.create_sheet(new_sheet_name)
+        return self.workbook.create_sheet(new_sheet_name)
 
 
-    def change_sheet(self, active_sheet: int or str):
+    def change_sheet(self, active_sheet: any):
         if(type(active_sheet) == int):
             self.active_sheet = self.workbook[self.workbook.sheetnames[active_sheet - 1]]
 
         elif(type(active_sheet) == str):
             self.active_sheet = self.workbook[active_sheet]
 
+        else:
+            # A worksheet returned by create_sheet, which skips the lookup by name
+            self.active_sheet = active_sheet
+
 
     def change_sheet_name(self, old_sheet_name, new_sheet_name):
         self.workbook[old_sheet_name].title = new_sheet_name
@@ -82,96 +340,87 @@ class Excel():
 
     def set_width(self, column, width):
         self.active_sheet.column_dimensions[column].width = width * 111 / 1000
+
+
+    def add_image(self, image: any, range: any):
+        column, row = Excel.convert_range(range)
+
+        self.active_sheet.add_image(ExcelImage(image), f"{get_column_letter(column)}{row}")
     
 
-    def adjust_width(self, start_range: any, end_range: any, extra_width: int = 0, width_limit: int = 0):
-        start_column, start_row = Excel.convert_range(start_range)
-        end_column, end_row = Excel.convert_range(end_range)
+    def width_tracker(self):
+        width_tracker = self.width_trackers.get(self.active_sheet)
 
-        cell_array = {}
-        for row in range(start_row, end_row + 1):
-            
-            temp_cell_array = []
-            for column in range(start_column, end_column + 1):
+        if(width_tracker == None):
+            width_tracker = WidthTracker() if self.write_only else self.scan_width()
+            self.width_trackers[self.active_sheet] = width_tracker
 
-                cell = self.active_sheet.cell(row = row, column = column)
+        return width_tracker
 
-                if(type(cell).__name__ == "Cell"):
-                    if(type(cell.value) in (int, str)):
-                        temp_cell_array.append([len(str(cell.value)), column])
 
-                    elif(type(cell.value) not in (int, str)):
-                        temp_cell_array.append([0, column])
+    def scan_width(self, start_row: int = 1, end_row: int = None):
+        width_tracker = WidthTracker()
 
-                elif(type(cell).__name__ == "MergedCell"):
-                    temp_cell_array.append([0, column])
+        for (row, column), cell in self.active_sheet._cells.items():
+            if(row >= start_row and (end_row == None or row <= end_row)):
+                width_tracker.update(column, column, cell.value)
 
+        for merged_cell in self.active_sheet.merged_cells.ranges:
+            if(merged_cell.min_row >= start_row and (end_row == None or merged_cell.min_row <= end_row)):
+                value = self.active_sheet.cell(row = merged_cell.min_row, column = merged_cell.min_col).value
+                width_tracker.merge(merged_cell.min_row, merged_cell.min_col, merged_cell.max_col, value)
 
-            cell_array[row] = temp_cell_array
+        return width_tracker
 
-    
-        merged_cell_range = [str(merged_cell).split(":") for merged_cell in self.active_sheet.merged_cells]
-        
-        for merged_cell in merged_cell_range:
-            start_column, start_row = Excel.convert_range(merged_cell[0])
-            end_column, end_row = Excel.convert_range(merged_cell[1])
 
-            first_row = None
-            cell_value = None
-            for row in range(start_row, end_row + 1):
-                if(row in cell_array):
-                    if first_row == None:
-                        first_row = row
+    def apply_width(self, width_tracker: WidthTracker, start_column: int, end_column: int, extra_width: int = 0, width_limit: int = 0):
+        limited_column = []
+        for column in range(start_column, end_column + 1):
+            width = width_tracker.width(column)
 
-                    column_count = 0
-                    for column in range(start_column, end_column + 1):
-                        for cell in cell_array.get(row):
-                            if cell[1] == column:
-                                if row == first_row:
-                                    if cell_value == None:
-                                        cell_value = cell[0]
+            if(width_limit > 0):
+                if(width > width_limit):
+                    width = width_limit
 
-                                column_count += 1
+                    limited_column.append(column)
 
+            self.active_sheet.column_dimensions[get_column_letter(column)].width = (width + 1 + extra_width)
 
-                    for column in range(start_column, end_column + 1):
-                        for cell in cell_array.get(row):
-                            if cell[1] == column:
-                                if row == first_row:
-                                    cell[0] = ceil(cell_value / column_count)
+        return limited_column
 
-        
-        rotated_cell_array = []
-        for item_object in cell_array.items():
-            rotated_cell_array.append(item_object[1])
-         
-                
-        rotated_cell_array = [list(elem) for elem in zip(*rotated_cell_array[::-1])]
 
-        width_dict = {}
-        for column in rotated_cell_array:
-            width_array = []
+    def adjust_width(self, start_range: any, end_range: any, extra_width: int = 0, width_limit: int = 0):
+        start_column, start_row = Excel.convert_range(start_range)
+        end_column, end_row = Excel.convert_range(end_range)
 
-            column_number = column[0][1]
-            
-            cell_column_letter =  get_column_letter(column_number)
-            for cell in column:
-                width_array.append(cell[0])
+        # The tracked widths cover the whole sheet, a smaller row range is measured on its own
+        if(start_row <= 1 and end_row >= self.active_sheet.max_row):
+            width_tracker = self.width_tracker()
 
+        else:
+            width_tracker = self.scan_width(start_row, end_row)
 
-            max_width_value = max(width_array)
+        limited_column = self.apply_width(width_tracker, start_column, end_column, extra_width, width_limit)
 
-            if(width_limit > 0):
-                if(max_width_value > width_limit):
-                    max_width_value = width_limit
+        for column in limited_column:
+            self.alignment_multiple([column, start_row], [column, end_row], wrap = True)
 
-                    self.alignment_multiple([column_number, 1], [column_number, len(column)], wrap = True)
-            
-            width_dict[cell_column_letter] = max_width_value
 
+    def fit_width(self, start_range: any, end_range: any, rows: any, extra_width: int = 0, width_limit: int = 0):
+        start_column, start_row = Excel.convert_range(start_range)
+        end_column, end_row = Excel.convert_range(end_range)
+
+        width_tracker = WidthTracker()
+        for row in rows:
+            for column, value in enumerate(row[start_column - 1:end_column], start_column):
+                width_tracker.update(column, column, value)
 
-        for column, width in width_dict.items():
-            self.active_sheet.column_dimensions[column].width = (width + 1 + extra_width)
+        limited_column = self.apply_width(width_tracker, start_column, end_column, extra_width, width_limit)
+
+        # The rows are only written afterwards, so append_rows wraps the limited columns as their rows come in
+        wrap_columns = self.wrap_columns.setdefault(self.active_sheet, {})
+        for column in limited_column:
+            wrap_columns[column] = (start_row, end_row)
 
 
     def check_range(range: any):
@@ -226,30 +475,13 @@ class Excel():
         return new_value
 
     
-    def attributes_string(list_of_attributes: any):
-        attributes_string = ""
-        for i, attribute in enumerate(list_of_attributes):
-            if(i == 0):
-                attributes_string += attribute
-            
-            else:
-                attributes_string += f", {attribute}"
-
-        return attributes_string
-
-
     def change_cell_number_format_singular(self, range: any, number_format: str):
         column, row = Excel.convert_range(range)
         self.active_sheet.cell(row = row, column = column).number_format = number_format
 
 
     def change_cell_number_format_multiple(self, start_range: any, end_range: any, number_format: str):
-        start_column, start_row = Excel.convert_range(start_range)
-        end_column, end_row = Excel.convert_range(end_range)
-
-        for row in range(start_row, end_row + 1):
-            for column in range(start_column, end_column + 1):
-                self.active_sheet.cell(row = row, column = column).number_format = number_format
+        self.style_range(start_range, end_range, number_format = number_format)
 
 
     #region Get
@@ -292,13 +524,20 @@ class Excel():
 
 
     #region Write
+    def write_cell(self, row: int, column: int, value: any):
+        cell = self.active_sheet.cell(row = row, column = column)
+        self.width_tracker().replace(row, column, cell.value, value)
+
+        cell.value = value
+
+
     def write_value_singular(self, range: any, value: any):
         if(type(value) == list):
             raise TypeError("Use write_value_multiple function if the value type is a list")
 
         column, row = Excel.convert_range(range)
             
-        self.active_sheet.cell(row = row, column = column, value = value)
+        self.write_cell(row, column, value)
 
 
     def write_value_multiple(self, start_range: any, end_range: any, value: any):
@@ -314,14 +553,14 @@ class Excel():
             value_counter = 0
             for row in range(start_row, end_row + 1):
                 for column in range(start_column, end_column + 1):
-                    self.active_sheet.cell(row = row, column = column, value = value[value_counter])
+                    self.write_cell(row, column, value[value_counter])
                     value_counter += 1
 
 
         elif(type(value) in (str, int, bool, float)):
             for row in range(start_row, end_row + 1):
                 for column in range(start_column, end_column + 1):
-                    self.active_sheet.cell(row = row, column = column, value = value)       
+                    self.write_cell(row, column, value)
 
 
     def write_value_multiple_2d(self, start_range: any, value: any):
@@ -338,7 +577,7 @@ class Excel():
 
                 for x, row in enumerate(range(start_row, end_row)):
                     for y, column in enumerate(range(start_column, end_column)):
-                        self.active_sheet.cell(row = row, column = column, value = value[x][y])
+                        self.write_cell(row, column, value[x][y])
 
 
             elif(not value_is_valid):
@@ -347,6 +586,89 @@ class Excel():
         else:
             raise TypeError("Value must be a 2D list")
 
+    def append_rows(self, rows: any, style_spec: any = None):
+        if(style_spec == None):
+            row_style = RowStyle({})
+
+        elif(type(style_spec) == dict):
+            row_style = RowStyle(style_spec)
+
+        else:
+            row_style = style_spec
+
+        style_arrays = {}
+        for column in row_style.columns:
+            key = (row_style, column)
+
+            if(key not in self.style_arrays):
+                template_cell = WriteOnlyCell(self.active_sheet)
+                for attribute, style in row_style.columns.get(column).items():
+                    setattr(template_cell, attribute, style)
+
+                self.style_arrays[key] = template_cell._style
+
+            style_arrays[column] = self.style_arrays.get(key)
+
+
+        wrap_columns = self.wrap_columns.get(self.active_sheet, {})
+        wrap_style_arrays = {}
+        for column in wrap_columns:
+            key = (row_style, column, "wrap")
+
+            if(key not in self.style_arrays):
+                cell_style = dict(row_style.columns.get(column, {}))
+                cell_style["alignment"] = copy(cell_style.get("alignment", Alignment()))
+                cell_style["alignment"].wrap_text = True
+
+                template_cell = WriteOnlyCell(self.active_sheet)
+                for attribute, style in cell_style.items():
+                    setattr(template_cell, attribute, style)
+
+                self.style_arrays[key] = template_cell._style
+
+            wrap_style_arrays[column] = self.style_arrays.get(key)
+
+
+        width_tracker = None
+        if(not self.write_only):
+            width_tracker = self.width_tracker()
+
+        row_count = self.row_counts.get(self.active_sheet, 0) if self.write_only else self.active_sheet._current_row
+
+        style_width = max([*style_arrays, *wrap_style_arrays], default = 0)
+        for value in rows:
+            row_count += 1
+
+            row_style_arrays = style_arrays
+            if(wrap_style_arrays):
+                row_style_arrays = {**style_arrays, **{column: style_array for column, style_array in wrap_style_arrays.items() if wrap_columns[column][0] <= row_count <= wrap_columns[column][1]}}
+
+            row = []
+            for column in range(1, max(len(value), style_width) + 1):
+                cell_value = value[column - 1] if column <= len(value) else None
+                style_array = row_style_arrays.get(column)
+
+                if(style_array != None):
+                    row.append(Cell(self.active_sheet, row = 1, column = column, value = cell_value, style_array = style_array))
+
+                else:
+                    row.append(cell_value)
+
+
+            self.active_sheet.append(row)
+
+            if(width_tracker != None):
+                for column, cell_value in enumerate(value, 1):
+                    width_tracker.update(column, column, cell_value)
+
+
+        if(self.write_only):
+            self.row_counts[self.active_sheet] = row_count
+
+
+    def row_style(style_spec: dict):
+        return RowStyle(style_spec)
+
     #endregion Write
 
 
@@ -355,27 +677,143 @@ class Excel():
         start_column, start_row = Excel.convert_range(start_range)
         end_column, end_row = Excel.convert_range(end_range)
 
-        self.active_sheet.merge_cells(start_row = start_row, start_column = start_column, end_row = end_row, end_column = end_column)
+        if(self.write_only):
+            self.active_sheet.merged_cells.add(CellRange(min_col = start_column, min_row = start_row, max_col = end_column, max_row = end_row))
+
+        else:
+            width_tracker = self.width_tracker()
+            for row in range(start_row, end_row + 1):
+                for column in range(start_column, end_column + 1):
+                    if((row, column) != (start_row, start_column)):
+                        cell = self.active_sheet._cells.get((row, column))
+
+                        if(cell != None):
+                            width_tracker.replace(row, column, cell.value, None)
+
+            width_tracker.merge(start_row, start_column, end_column, self.active_sheet.cell(row = start_row, column = start_column).value)
+
+            self.active_sheet.merge_cells(start_row = start_row, start_column = start_column, end_row = end_row, end_column = end_column)
 
     
     def unmerge(self, start_range: any, end_range: any):
         start_column, start_row = Excel.convert_range(start_range)
         end_column, end_row = Excel.convert_range(end_range)
 
+        self.width_tracker().unmerge(start_row, start_column, self.active_sheet.cell(row = start_row, column = start_column).value)
+
         self.active_sheet.unmerge_cells(start_row = start_row, start_column = start_column, end_row = end_row, end_column = end_column)
 
     #endregion Merge & Unmerge
 
 
+    #region Style
+    def style_index(self, attribute: str, style: any):
+        key = (attribute, id(style))
+
+        style_index = self.style_indexes.get(key)
+        if(style_index == None):
+            if(attribute not in Excel.style_collections):
+                raise TypeError("Style attribute can only be font, fill, border, alignment")
+
+            collection, style_key = Excel.style_collections.get(attribute)
+            style_index = (style, style_key, getattr(self.workbook, collection).add(style))
+
+            self.style_indexes[key] = style_index
+
+        return style_index
+
+
+    def set_style(self, cell: any, attribute: str, style: any):
+        if(attribute == "number_format"):
+            cell.number_format = style
+
+        else:
+            if(cell._style == None):
+                cell._style = StyleArray()
+
+            style, style_key, index = self.style_index(attribute, style)
+            setattr(cell._style, style_key, index)
+
+
+    def set_cell_style(self, cell: any, cell_style: dict):
+        for attribute, style in cell_style.items():
+            self.set_style(cell, attribute, style)
+
+
+    def style_range(self, start_range: any, end_range: any, **attributes: any):
+        start_column, start_row = Excel.convert_range(start_range)
+        end_column, end_row = Excel.convert_range(end_range)
+
+        cell_style = Style.resolve(**attributes)
+
+        style_keys = []
+        for attribute, style in cell_style.items():
+            if(attribute != "number_format"):
+                style, style_key, index = self.style_index(attribute, style)
+                style_keys.append((style_key, index))
+
+        number_format = cell_style.get("number_format")
+
+        for row in range(start_row, end_row + 1):
+            for column in range(start_column, end_column + 1):
+                cell = self.active_sheet.cell(row = row, column = column)
+                if(cell._style == None):
+                    cell._style = StyleArray()
+
+                for style_key, index in style_keys:
+                    setattr(cell._style, style_key, index)
+
+                if(number_format != None):
+                    cell.number_format = number_format
+
+
+    def style_rows(self, start_row: int, end_row: int, **attributes: any):
+        cell_style = Style.resolve(**attributes)
+
+        for row in range(start_row, end_row + 1):
+            row_dimension = self.active_sheet.row_dimensions[row]
+
+            for attribute, style in cell_style.items():
+                setattr(row_dimension, attribute, style)
+
+
+        if(not self.write_only):
+            for (row, column), cell in self.active_sheet._cells.items():
+                if(start_row <= row <= end_row):
+                    self.set_cell_style(cell, cell_style)
+
+
+    def style_columns(self, start_column: any, end_column: any, **attributes: any):
+        if(type(start_column) == str):
+            start_column = Excel.check_and_convert_string_value(start_column)
+
+        if(type(end_column) == str):
+            end_column = Excel.check_and_convert_string_value(end_column)
+
+        cell_style = Style.resolve(**attributes)
+
+        for column in range(start_column, end_column + 1):
+            column_dimension = self.active_sheet.column_dimensions[get_column_letter(column)]
+
+            for attribute, style in cell_style.items():
+                setattr(column_dimension, attribute, style)
+
+
+        if(not self.write_only):
+            for (row, column), cell in self.active_sheet._cells.items():
+                if(start_column <= column <= end_column):
+                    self.set_cell_style(cell, cell_style)
+
+    #endregion Style
+
+
     #region Font
     def font_attributes(**attributes: any):
-        list_of_attributes = []
+        dict_of_attributes = {}
         if("font" in attributes):
             if(type(attributes.get("font")) == str):
                 font_name = attributes.get("font")
-                temp_attribute = f"name='{font_name}'"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["name"] = font_name
 
             else:
                 raise TypeError("Font data type needs to be a string")
@@ -383,9 +821,7 @@ class Excel():
         if("size" in attributes):
             if(type(attributes.get("size")) in (str, int)):
                 font_size = int(attributes.get("size"))
-                temp_attribute = f"size={font_size}"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["size"] = font_size
 
             else:
                 raise TypeError("Size data type needs to be a string or an integer")
@@ -393,9 +829,7 @@ class Excel():
         if("color" in attributes):
             if(type(attributes.get("color")) == str):
                 color_name = attributes.get("color")
-                temp_attribute = f"color='{color_name}'"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["color"] = color_name
 
             else:
                 raise TypeError("Color data type needs to be a string")
@@ -404,9 +838,7 @@ class Excel():
             if(type(attributes.get("underline")) == str):
                 underline_name = attributes.get("underline")
                 underline_name = (underline_name[0].lower() + underline_name[1:]).replace(" ", "")
-                temp_attribute = f"underline='{underline_name}'"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["underline"] = underline_name
 
             else:
                 raise TypeError("Underline data type needs to be a string")
@@ -414,9 +846,7 @@ class Excel():
         if("bold" in attributes):
             if(type(attributes.get("bold")) == bool):
                 is_bold = attributes.get("bold")
-                temp_attribute = f"bold={is_bold}"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["bold"] = is_bold
 
             else:
                 raise TypeError("Bold data type needs to be a boolean")
@@ -424,9 +854,7 @@ class Excel():
         if("italic" in attributes):
             if(type(attributes.get("italic")) == bool):
                 is_italic = attributes.get("italic")
-                temp_attribute = f"italic={is_italic}"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["italic"] = is_italic
             
             else:
                 raise TypeError("Italic data type needs to be a boolean")
@@ -434,35 +862,22 @@ class Excel():
         if("strike" in attributes):
             if(type(attributes.get("strike")) == bool):
                 is_strike = attributes.get("strike")
-                temp_attribute = f"strike={is_strike}"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["strike"] = is_strike
         
             else:
                 raise TypeError("Strike data type needs to be a boolean")
 
-        return Excel.attributes_string(list_of_attributes)
+        return dict_of_attributes
 
 
     def font_singular(self, cell_range: any, **attributes: any):
         column, row = Excel.convert_range(cell_range)
 
-        attributes_string = Excel.font_attributes(**attributes)
-
-        font = eval(f"Font({attributes_string})")
-        self.active_sheet.cell(row = row, column = column).font = font
+        self.set_style(self.active_sheet.cell(row = row, column = column), "font", Style.font(**attributes))
 
     
     def font_multiple(self, start_range: any, end_range: any, **attributes: any):
-        start_column, start_row = Excel.convert_range(start_range)
-        end_column, end_row = Excel.convert_range(end_range)
-
-        attributes_string = Excel.font_attributes(**attributes)
-
-        font = eval(f"Font({attributes_string})")
-        for row in range(start_row, end_row + 1):
-            for column in range(start_column, end_column + 1):
-                self.active_sheet.cell(row = row, column = column).font = font
+        self.style_range(start_range, end_range, font = Style.font(**attributes))
 
     
     #endregion Font
@@ -470,20 +885,16 @@ class Excel():
 
     #region Fill
     def fill_attributes(**attributes: str):
-        list_of_attributes = []
+        dict_of_attributes = {}
 
         if("type" in attributes):
             if(type(attributes.get("type")) == str):
                 fill_type = attributes.get("type")
                 fill_type = (fill_type[0].lower() + fill_type[1:]).replace(' ', '')
-                temp_attribute = f"fill_type='{fill_type}'"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["fill_type"] = fill_type
 
             elif(attributes.get("type") == None):
-                temp_attribute = f"fill_type=None"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["fill_type"] = None
 
             else:
                 raise TypeError("Type data type needs to be a string or None")
@@ -492,23 +903,19 @@ class Excel():
             if(type(attributes.get("main_color")) == str):
                 fill_color = attributes.get("main_color")
 
-                temp_attribute = f"start_color='{fill_color}'"
-                
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["start_color"] = fill_color
 
         if("second_color" in attributes):
             if(type(attributes.get("second_color")) == str):
                 fill_color = attributes.get("second_color")
                 
-                temp_attribute = f"end_color='{fill_color}'"
-                    
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["end_color"] = fill_color
 
-        return Excel.attributes_string(list_of_attributes)
+        return dict_of_attributes
 
 
     def shade_attributes(**attributes: str):
-        list_of_attributes = []
+        dict_of_attributes = {}
 
         if("shade" in attributes):
             if(type(attributes.get("shade")) != bool):
@@ -518,14 +925,10 @@ class Excel():
             if(type(attributes.get("type")) == str):
                 fill_type = attributes.get("type")
                 fill_type = (fill_type[0].lower() + fill_type[1:]).replace(' ', '')
-                temp_attribute = f"fill_type='{fill_type}'"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["fill_type"] = fill_type
 
             elif(attributes.get("type") == None):
-                temp_attribute = f"fill_type=None"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["fill_type"] = None
 
             else:
                 raise TypeError("Type data type needs to be a string or None")
@@ -533,56 +936,46 @@ class Excel():
         if("main_color" in attributes):
             if(type(attributes.get("main_color")) == str):
                 fill_color = attributes.get("main_color")
-                temp_attribute = f"end_color='{fill_color}'"
-                
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["end_color"] = fill_color
 
         if("second_color" in attributes):
             if(type(attributes.get("second_color")) == str):
                 fill_color = attributes.get("second_color")
-                temp_attribute = f"start_color='{fill_color}'"
-                    
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["start_color"] = fill_color
 
-        return Excel.attributes_string(list_of_attributes)
+        return dict_of_attributes
 
 
     def fill_singular(self, cell_range: any, **attributes: any):
         column, row = Excel.convert_range(cell_range)
-            
-        attributes_string = Excel.fill_attributes(**attributes)
 
-        self.active_sheet.cell(row = row, column = column).fill = eval(f"PatternFill({attributes_string})")
+        self.set_style(self.active_sheet.cell(row = row, column = column), "fill", Style.fill(**attributes))
 
     
     def fill_multiple(self, start_range: any, end_range: any, **attributes: any):
         start_column, start_row = Excel.convert_range(start_range)
         end_column, end_row = Excel.convert_range(end_range)
-            
-        main_attributes_string = Excel.fill_attributes(**attributes)
-        main_pattern_fill = eval(f"PatternFill({main_attributes_string})")
+
+        main_pattern_fill = Style.fill(**attributes)
 
         shade = False
         if("shade" in attributes):
             shade = attributes.get("shade")
 
         if(shade):    
-            second_attributes_string = Excel.shade_attributes(**attributes)
-            second_pattern_fill = eval(f"PatternFill({second_attributes_string})")
+            second_pattern_fill = Style.shade(**attributes)
 
             for row in range(start_row, end_row + 1):
                 for column in range(start_column, end_column + 1):
                     if(column % 2 != 0):
-                        self.active_sheet.cell(row = row, column = column).fill = main_pattern_fill
+                        self.set_style(self.active_sheet.cell(row = row, column = column), "fill", main_pattern_fill)
 
                     elif(column % 2 == 0):
-                        self.active_sheet.cell(row = row, column = column).fill = second_pattern_fill
+                        self.set_style(self.active_sheet.cell(row = row, column = column), "fill", second_pattern_fill)
 
 
         elif(not shade):
-            for row in range(start_row, end_row + 1):
-                for column in range(start_column, end_column + 1):
-                    self.active_sheet.cell(row = row, column = column).fill = main_pattern_fill
+            self.style_range(start_range, end_range, fill = main_pattern_fill)
     
 
     #endregion Fill
@@ -590,18 +983,16 @@ class Excel():
 
     #region Border
     def border_attributes(**attributes: any):
-        list_of_attributes = []
+        dict_of_attributes = {}
         if("style" in attributes):
             if(type(attributes.get("style")) == str):
                 if(attributes.get("style").lower() == "none"):
-                    temp_attribute = f"border_style=None"
+                    dict_of_attributes["border_style"] = None
 
                 else:
                     border_style = attributes.get("style").replace(" ", "")
                     border_style = border_style[0].lower() + border_style[1:]
-                    temp_attribute = f"border_style='{border_style}'"
-
-                list_of_attributes.append(temp_attribute)
+                    dict_of_attributes["border_style"] = border_style
 
             else:
                 raise TypeError("Style data type needs to be a string")
@@ -609,14 +1000,12 @@ class Excel():
         if("color" in attributes):
             if(type(attributes.get("color")) == str):
                 border_color = attributes.get("color")
-                temp_attribute = f"color='{border_color}'"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["color"] = border_color
 
             else:
                 raise TypeError("Color data type needs to be a string")
 
-        return Excel.attributes_string(list_of_attributes)
+        return dict_of_attributes
 
 
     def border_set(side, attribute):
@@ -649,34 +1038,20 @@ class Excel():
 
     def border_singular(self, cell_range: any, side: str, **attributes: any):
         column, row = Excel.convert_range(cell_range)
-            
-        attributes_string = Excel.border_attributes(**attributes)
-        
-        attribute = eval(f"Side({attributes_string})")
-        border = Excel.border_set(side, attribute)
-        self.active_sheet.cell(row = row, column = column).border = border
+
+        self.set_style(self.active_sheet.cell(row = row, column = column), "border", Style.border(side, **attributes))
 
     
     def border_multiple(self, start_range: any, end_range: any, side: str, **attributes: any):
-        start_column, start_row = Excel.convert_range(start_range)
-        end_column, end_row = Excel.convert_range(end_range)
-            
-        attributes_string = Excel.border_attributes(**attributes)
-        
-        attribute = eval(f"Side({attributes_string})")
-        border = Excel.border_set(side, attribute)
-
-        for row in range(start_row, end_row + 1):
-            for column in range(start_column, end_column + 1):
-                self.active_sheet.cell(row = row, column = column).border = border
+        self.style_range(start_range, end_range, border = Style.border(side, **attributes))
     
 
     def side_thick_border(self, start_range: any, end_range: any):
         start_column, start_row = Excel.convert_range(start_range)
         end_column, end_row = Excel.convert_range(end_range)
 
-        self.active_sheet.cell(row = start_row, column = start_column).border = Border(left=Side(style='thick'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-        self.active_sheet.cell(row = end_row, column = end_column).border = Border(left=Side(style='thin'), right=Side(style='thick'), top=Side(style='thin'), bottom=Side(style='thin'))
+        self.set_style(self.active_sheet.cell(row = start_row, column = start_column), "border", Style.side_thick_border("left"))
+        self.set_style(self.active_sheet.cell(row = end_row, column = end_column), "border", Style.side_thick_border("right"))
 
 
     #endregion
@@ -684,14 +1059,12 @@ class Excel():
 
     #region Alignment
     def alignment_attributes(**attributes: any):
-        list_of_attributes = []
+        dict_of_attributes = {}
         if("horizontal" in attributes):
             if(type(attributes.get("horizontal")) == str):
                 horizontal_type = attributes.get("horizontal")
                 horizontal_type = (horizontal_type[0].lower() + horizontal_type[1:]).replace(' ', '')
-                temp_attribute = f"horizontal='{horizontal_type}'"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["horizontal"] = horizontal_type
 
             else:
                 raise TypeError("Horizontal data type needs to be a string")
@@ -700,9 +1073,7 @@ class Excel():
             if(type(attributes.get("vertical")) == str):
                 vertical_type = attributes.get("vertical")
                 vertical_type = (vertical_type[0].lower() + vertical_type[1:]).replace(' ', '')
-                temp_attribute = f"vertical='{vertical_type}'"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["vertical"] = vertical_type
 
             else:
                 raise TypeError("Vertical data type needs to be a string")
@@ -710,9 +1081,7 @@ class Excel():
         if("rotation" in attributes):
             if(type(attributes.get("rotation")) in (str, int)):
                 rotate_degree = int(attributes.get("rotation"))
-                temp_attribute = f"text_rotation={rotate_degree}"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["text_rotation"] = rotate_degree
 
             else:
                 raise TypeError("Rotation data type needs to be a string or an integer")
@@ -720,9 +1089,7 @@ class Excel():
         if("indent" in attributes):
             if(type(attributes.get("indent")) in (str, int)):
                 indent_value = int(attributes.get("indent"))
-                temp_attribute = f"indent={indent_value}"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["indent"] = indent_value
 
             else:
                 raise TypeError("Indent data type needs to be a string or an integer")
@@ -730,9 +1097,7 @@ class Excel():
         if("wrap" in attributes):
             if(type(attributes.get("wrap")) == bool):
                 is_wrap = attributes.get("wrap")
-                temp_attribute = f"wrap_text={is_wrap}"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["wrap_text"] = is_wrap
 
             else:
                 raise TypeError("Wrap data type needs to be a boolean")
@@ -740,35 +1105,22 @@ class Excel():
         if("shrink" in attributes):
             if(type(attributes.get("shrink")) == bool):
                 is_shrink = attributes.get("shrink")
-                temp_attribute = f"shrink_to_fit={is_shrink}"
-
-                list_of_attributes.append(temp_attribute)
+                dict_of_attributes["shrink_to_fit"] = is_shrink
 
             else:
                 raise TypeError("Shrink data type needs to be a boolean")
 
-        return Excel.attributes_string(list_of_attributes)
+        return dict_of_attributes
     
 
     def alignment_singular(self, cell_range: any, **attributes: any):
         column, row = Excel.convert_range(cell_range)
 
-        attributes_string = Excel.alignment_attributes(**attributes)
-        
-        alignment = eval(f"Alignment({attributes_string})")
-        self.active_sheet.cell(row = row, column = column).alignment = alignment
+        self.set_style(self.active_sheet.cell(row = row, column = column), "alignment", Style.alignment(**attributes))
 
     
     def alignment_multiple(self, start_range: any, end_range: any, **attributes: any):
-        start_column, start_row = Excel.convert_range(start_range)
-        end_column, end_row = Excel.convert_range(end_range)
-
-        attributes_string = Excel.alignment_attributes(**attributes)
-
-        alignment = eval(f"Alignment({attributes_string})")
-        for row in range(start_row, end_row + 1):
-            for column in range(start_column, end_column + 1):
-                self.active_sheet.cell(row = row, column = column).alignment = alignment
+        self.style_range(start_range, end_range, alignment = Style.alignment(**attributes))
                 
     
     #endregion
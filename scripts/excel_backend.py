@@ -0,0 +1,450 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The Excel Backend file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+import openpyxl
+
+from openpyxl.cell import Cell
+from openpyxl.styles.numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_MAX_SIZE
+from openpyxl.utils import column_index_from_string
+from openpyxl.utils.cell import coordinate_from_string
+from openpyxl.worksheet.cell_range import MultiCellRange
+from openpyxl.worksheet.views import SheetView
+from io import BytesIO
+
+try:
+    import xlsxwriter
+
+except ImportError:
+    xlsxwriter = None
+
+
+class OpenpyxlBackend():
+    name = "openpyxl"
+
+
+    def workbook(write_only: bool = False):
+        return openpyxl.Workbook(write_only = write_only)
+
+
+    def save(workbook: any, target: any):
+        workbook.save(target)
+
+
+class XlsxWriterFormat():
+    underlines = {
+        "single": 1,
+        "double": 2,
+        "singleAccounting": 33,
+        "doubleAccounting": 34
+    }
+
+    patterns = [None, "solid", "mediumGray", "darkGray", "lightGray", "darkHorizontal", "darkVertical", "darkDown", "darkUp", "darkGrid", "darkTrellis", "lightHorizontal", "lightVertical", "lightDown", "lightUp", "lightGrid", "lightTrellis", "gray125", "gray0625"]
+
+    borders = [None, "thin", "medium", "dashed", "dotted", "thick", "double", "hair", "mediumDashed", "dashDot", "mediumDashDot", "dashDotDot", "mediumDashDotDot", "slantDashDot"]
+
+    horizontals = {
+        "general": None,
+        "centerContinuous": "center_across"
+    }
+
+    verticals = {
+        "center": "vcenter",
+        "justify": "vjustify",
+        "distributed": "vdistributed"
+    }
+
+
+    def color(color: any):
+        if(color == None or color.type != "rgb" or type(color.rgb) != str):
+            return None
+
+        return f"#{color.rgb[-6:].upper()}"
+
+
+    def font(font: any):
+        properties = {}
+
+        properties["font_name"] = font.name
+        properties["font_size"] = font.sz
+        properties["bold"] = font.b
+        properties["italic"] = font.i
+        properties["font_strikeout"] = font.strike
+        properties["underline"] = XlsxWriterFormat.underlines.get(font.u)
+        properties["font_color"] = XlsxWriterFormat.color(font.color)
+
+        if(font.vertAlign == "superscript"):
+            properties["font_script"] = 1
+
+        elif(font.vertAlign == "subscript"):
+            properties["font_script"] = 2
+
+        return properties
+
+
+    def fill(fill: any):
+        properties = {}
+
+        if(fill.patternType in XlsxWriterFormat.patterns):
+            properties["pattern"] = XlsxWriterFormat.patterns.index(fill.patternType)
+            properties["fg_color"] = XlsxWriterFormat.color(fill.fgColor)
+
+            if(fill.bgColor.rgb != "00000000"):
+                properties["bg_color"] = XlsxWriterFormat.color(fill.bgColor)
+
+        return properties
+
+
+    def border(border: any):
+        properties = {}
+
+        for side in ["left", "right", "top", "bottom"]:
+            border_side = getattr(border, side)
+
+            if(border_side != None and border_side.style in XlsxWriterFormat.borders):
+                properties[side] = XlsxWriterFormat.borders.index(border_side.style)
+                properties[f"{side}_color"] = XlsxWriterFormat.color(border_side.color)
+
+        return properties
+
+
+    def alignment(alignment: any):
+        properties = {}
+
+        if(alignment.horizontal != None):
+            properties["align"] = XlsxWriterFormat.horizontals.get(alignment.horizontal, alignment.horizontal)
+
+        if(alignment.vertical != None):
+            properties["valign"] = XlsxWriterFormat.verticals.get(alignment.vertical, alignment.vertical)
+
+        properties["text_wrap"] = alignment.wrap_text
+        properties["shrink"] = alignment.shrink_to_fit
+        properties["rotation"] = alignment.textRotation
+        properties["indent"] = alignment.indent
+
+        return properties
+
+
+    def properties(workbook: any, style_array: any):
+        properties = {}
+
+        if(style_array.fontId != 0):
+            properties.update(XlsxWriterFormat.font(workbook._fonts[style_array.fontId]))
+
+        if(style_array.fillId != 0):
+            properties.update(XlsxWriterFormat.fill(workbook._fills[style_array.fillId]))
+
+        if(style_array.borderId != 0):
+            properties.update(XlsxWriterFormat.border(workbook._borders[style_array.borderId]))
+
+        if(style_array.alignmentId != 0):
+            properties.update(XlsxWriterFormat.alignment(workbook._alignments[style_array.alignmentId]))
+
+        if(style_array.numFmtId != 0):
+            if(style_array.numFmtId in BUILTIN_FORMATS):
+                properties["num_format"] = BUILTIN_FORMATS.get(style_array.numFmtId)
+
+            else:
+                properties["num_format"] = workbook._number_formats[style_array.numFmtId - BUILTIN_FORMATS_MAX_SIZE]
+
+        return {key: value for key, value in properties.items() if value not in [None, False, 0]}
+
+
+class XlsxWriterSheet():
+    def __init__(self, renderer: any, worksheet: any):
+        self.renderer = renderer
+        self.worksheet = worksheet
+
+
+    def set_zoom(self, zoom_scale: any):
+        if(zoom_scale != None):
+            self.worksheet.set_zoom(zoom_scale)
+
+
+    def set_column(self, column: int, width: float = None, style_array: any = None):
+        # openpyxl stores the width as given while xlsxwriter adds the 5 pixel padding of the default font on top of it
+        if(width != None):
+            width = max(width - 5 / 7, 0)
+
+        self.worksheet.set_column(column - 1, column - 1, width, self.renderer.format(style_array))
+
+
+    def set_row(self, row: int, height: float = None, style_array: any = None):
+        self.worksheet.set_row(row - 1, height, self.renderer.format(style_array))
+
+
+    def write(self, row: int, column: int, value: any, style_array: any = None):
+        cell_format = self.renderer.format(style_array)
+
+        if(value == None):
+            self.worksheet.write_blank(row - 1, column - 1, None, cell_format)
+
+        else:
+            self.worksheet.write(row - 1, column - 1, value, cell_format)
+
+
+    def merge(self, merged_cells: any):
+        # Without data or format merge_range only registers the range, the cells written afterwards keep their own style
+        for merged_cell in merged_cells:
+            if(merged_cell.min_row != merged_cell.max_row or merged_cell.min_col != merged_cell.max_col):
+                self.worksheet.merge_range(merged_cell.min_row - 1, merged_cell.min_col - 1, merged_cell.max_row - 1, merged_cell.max_col - 1, "", None)
+
+
+    def add_image(self, image: any):
+        if(type(image.anchor) == str):
+            column, row = coordinate_from_string(image.anchor)
+            self.worksheet.insert_image(row - 1, column_index_from_string(column) - 1, "image.png", {"image_data": BytesIO(image._data())})
+
+
+class XlsxWriterRenderer():
+    def __init__(self, style_workbook: any, constant_memory: bool = False):
+        self.style_workbook = style_workbook
+        self.output = BytesIO()
+        self.workbook = xlsxwriter.Workbook(self.output, {"constant_memory": constant_memory, "strings_to_urls": False})
+        self.formats = {}
+
+
+    def add_sheet(self, title: str):
+        return XlsxWriterSheet(self, self.workbook.add_worksheet(title))
+
+
+    def format(self, style_array: any):
+        if(style_array == None):
+            return None
+
+        key = tuple(style_array)
+
+        if(key not in self.formats):
+            properties = XlsxWriterFormat.properties(self.style_workbook, style_array)
+            self.formats[key] = self.workbook.add_format(properties) if properties else None
+
+        return self.formats.get(key)
+
+
+    def render(self, workbook: any):
+        for worksheet in workbook.worksheets:
+            sheet = self.add_sheet(worksheet.title)
+            sheet.set_zoom(worksheet.sheet_view.zoomScale)
+
+            for column, dimension in worksheet.column_dimensions.items():
+                sheet.set_column(column_index_from_string(column), dimension.width if dimension.customWidth else None, dimension._style if dimension.has_style else None)
+
+            rows = {}
+            for (row, column) in sorted(worksheet._cells):
+                rows.setdefault(row, []).append(worksheet._cells.get((row, column)))
+
+            for row, dimension in worksheet.row_dimensions.items():
+                if(dimension.ht != None or dimension.has_style):
+                    sheet.set_row(row, dimension.ht, dimension._style if dimension.has_style else None)
+
+            sheet.merge(worksheet.merged_cells.ranges)
+
+            for row in sorted(rows):
+                for cell in rows.get(row):
+                    if(cell.value != None or cell.has_style):
+                        sheet.write(row, cell.column, cell.value, cell._style)
+
+            for image in worksheet._images:
+                sheet.add_image(image)
+
+
+    def close(self, target: any):
+        self.workbook.close()
+
+        if(hasattr(target, "write")):
+            target.write(self.output.getvalue())
+
+        else:
+            with open(target, "wb") as file:
+                file.write(self.output.getvalue())
+
+
+class XlsxWriterStreamSheet():
+    def __init__(self, workbook: any, title: str):
+        self.parent = workbook
+        self.sheet = None
+        self.sheet_title = title
+        self.column_dimensions = XlsxWriterDimensions()
+        self.row_dimensions = XlsxWriterDimensions()
+        self.merged_cells = MultiCellRange()
+        self.sheet_view = SheetView()
+        self.images = []
+        self.current_row = 0
+
+
+    @property
+    def title(self):
+        return self.sheet_title
+
+
+    @title.setter
+    def title(self, value: str):
+        if(self.sheet != None and value != self.sheet_title):
+            raise TypeError("Sheet title can not change after its first row is written with the xlsxwriter backend")
+
+        self.sheet_title = value
+
+
+    def append(self, row: any):
+        self.parent.add_sheets(self)
+        self.current_row += 1
+
+        # constant_memory writes a row out once the next one starts, so the height has to be set before the row like on openpyxl write-only sheets
+        row_dimension = self.row_dimensions.get(self.current_row)
+        if(row_dimension != None and row_dimension.height != None):
+            self.sheet.set_row(self.current_row, row_dimension.height)
+
+        for column, value in enumerate(row, 1):
+            if(type(value) == Cell):
+                self.sheet.write(self.current_row, column, value.value, value._style)
+
+            elif(value != None):
+                self.sheet.write(self.current_row, column, value)
+
+
+    def add_image(self, image: any, anchor: str = None):
+        if(anchor != None):
+            image.anchor = anchor
+
+        self.images.append(image)
+
+
+class XlsxWriterDimensions(dict):
+    def __missing__(self, key: any):
+        dimension = XlsxWriterDimension()
+        self[key] = dimension
+
+        return dimension
+
+
+class XlsxWriterDimension():
+    def __init__(self):
+        self.width = None
+        self.height = None
+
+
+class XlsxWriterStream():
+    def __init__(self):
+        self.style_workbook = openpyxl.Workbook(write_only = True)
+        self.renderer = XlsxWriterRenderer(self, constant_memory = True)
+        self.worksheets = []
+
+        self._fonts = self.style_workbook._fonts
+        self._fills = self.style_workbook._fills
+        self._borders = self.style_workbook._borders
+        self._alignments = self.style_workbook._alignments
+        self._number_formats = self.style_workbook._number_formats
+
+
+    @property
+    def sheetnames(self):
+        return [worksheet.title for worksheet in self.worksheets]
+
+
+    def __getitem__(self, title: str):
+        for worksheet in self.worksheets:
+            if(worksheet.title == title):
+                return worksheet
+
+        raise KeyError(f"Worksheet {title} does not exist")
+
+
+    def create_sheet(self, title: str = None):
+        if(title == None):
+            title = f"Sheet{len(self.worksheets) + 1}"
+
+        worksheet = XlsxWriterStreamSheet(self, title)
+        self.worksheets.append(worksheet)
+
+        return worksheet
+
+
+    def add_sheets(self, worksheet: any):
+        # xlsxwriter names a sheet when it is added, so sheets are added on their first row, together with every sheet created before them to keep the order
+        if(worksheet.sheet != None):
+            return
+
+        for created_worksheet in self.worksheets[:self.worksheets.index(worksheet) + 1]:
+            if(created_worksheet.sheet == None):
+                created_worksheet.sheet = self.renderer.add_sheet(created_worksheet.title)
+
+
+    def save(self, target: any):
+        if(self.worksheets):
+            self.add_sheets(self.worksheets[-1])
+
+        for worksheet in self.worksheets:
+            if(worksheet.merged_cells.ranges):
+                raise TypeError("Merged cells need Excel.new with the xlsxwriter backend, constant_memory has already written their rows")
+
+            worksheet.sheet.set_zoom(worksheet.sheet_view.zoomScale)
+
+            for column, dimension in worksheet.column_dimensions.items():
+                worksheet.sheet.set_column(column_index_from_string(column), dimension.width)
+
+            for image in worksheet.images:
+                worksheet.sheet.add_image(image)
+
+        self.renderer.close(target)
+
+
+class XlsxWriterBackend():
+    name = "xlsxwriter"
+
+
+    def workbook(write_only: bool = False):
+        if(xlsxwriter == None):
+            raise TypeError("Excel backend xlsxwriter needs the xlsxwriter package")
+
+        if(write_only):
+            return XlsxWriterStream()
+
+        return openpyxl.Workbook()
+
+
+    def save(workbook: any, target: any):
+        if(type(workbook) == XlsxWriterStream):
+            workbook.save(target)
+
+        else:
+            renderer = XlsxWriterRenderer(workbook)
+            renderer.render(workbook)
+            renderer.close(target)
+
+
+class ExcelBackend():
+    default = "openpyxl"
+
+    backends = {
+        "openpyxl": OpenpyxlBackend,
+        "xlsxwriter": XlsxWriterBackend
+    }
+
+
+    def get(name: str = None):
+        if(name == None):
+            name = ExcelBackend.default
+
+        if(name not in ExcelBackend.backends):
+            raise TypeError("Excel backend can only be openpyxl or xlsxwriter")
+
+        return ExcelBackend.backends.get(name)
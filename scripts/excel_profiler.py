@@ -0,0 +1,178 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The Excel Profiler file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+import inspect
+
+from contextvars import ContextVar
+from time import perf_counter
+
+from excel import Excel
+
+class ExcelProfiler():
+    enabled = False
+    originals = {}
+    default_records = {}
+
+    depth = ContextVar("excel_profiler_depth", default = 0)
+    records = ContextVar("excel_profiler_records", default = None)
+
+    operations = {
+        "write_value_singular": ["write", "cell"],
+        "write_value_multiple": ["write", "range"],
+        "write_value_multiple_2d": ["write", "grid"],
+        "append_rows": ["write", "rows"],
+        "font_singular": ["font", "cell"],
+        "font_multiple": ["font", "range"],
+        "fill_singular": ["fill", "cell"],
+        "fill_multiple": ["fill", "range"],
+        "border_singular": ["border", "cell"],
+        "border_multiple": ["border", "range"],
+        "side_thick_border": ["border", "range"],
+        "alignment_singular": ["alignment", "cell"],
+        "alignment_multiple": ["alignment", "range"],
+        "change_cell_number_format_singular": ["number_format", "cell"],
+        "change_cell_number_format_multiple": ["number_format", "range"],
+        "style_range": ["style", "range"],
+        "style_rows": ["style", "rows_span"],
+        "style_columns": ["style", "columns_span"],
+        "merge": ["merge", "range"],
+        "unmerge": ["merge", "range"],
+        "adjust_width": ["adjust_width", "range"],
+        "fit_width": ["adjust_width", "range"],
+        "save": ["save", "workbook"]
+    }
+
+
+    def enable():
+        if(ExcelProfiler.enabled):
+            return
+
+        for method_name, (operation, cell_count) in ExcelProfiler.operations.items():
+            original = Excel.__dict__.get(method_name)
+
+            ExcelProfiler.originals[method_name] = original
+            setattr(Excel, method_name, ExcelProfiler.wrap(original, operation, cell_count))
+
+        ExcelProfiler.enabled = True
+
+
+    def disable():
+        for method_name, original in ExcelProfiler.originals.items():
+            setattr(Excel, method_name, original)
+
+        ExcelProfiler.originals = {}
+        ExcelProfiler.enabled = False
+
+
+    def wrap(original: any, operation: str, cell_count: str):
+        signature = inspect.signature(original)
+
+        def profiled(*args, **kwargs):
+            # Only the outermost call is recorded, so font_multiple is not counted again as the style_range it delegates to
+            if(ExcelProfiler.depth.get() > 0):
+                return original(*args, **kwargs)
+
+            token = ExcelProfiler.depth.set(1)
+            start_time = perf_counter()
+
+            try:
+                return original(*args, **kwargs)
+
+            finally:
+                elapsed_time = perf_counter() - start_time
+                ExcelProfiler.depth.reset(token)
+
+                ExcelProfiler.record(operation, elapsed_time, ExcelProfiler.count(cell_count, signature.bind(*args, **kwargs).arguments))
+
+        profiled.__name__ = original.__name__
+        profiled.__wrapped__ = original
+
+        return profiled
+
+
+    def count(cell_count: str, arguments: dict):
+        if(cell_count == "cell"):
+            return 1
+
+        elif(cell_count == "range"):
+            start_column, start_row = Excel.convert_range(arguments.get("start_range"))
+            end_column, end_row = Excel.convert_range(arguments.get("end_range"))
+
+            return (abs(end_column - start_column) + 1) * (abs(end_row - start_row) + 1)
+
+        elif(cell_count == "grid"):
+            return sum(len(row) for row in arguments.get("value"))
+
+        elif(cell_count == "rows"):
+            rows = arguments.get("rows")
+
+            return sum(len(row) for row in rows) if type(rows) == list else 0
+
+        elif(cell_count == "rows_span"):
+            return abs(arguments.get("end_row") - arguments.get("start_row")) + 1
+
+        elif(cell_count == "columns_span"):
+            start_column, end_column = arguments.get("start_column"), arguments.get("end_column")
+
+            if(type(start_column) == str):
+                start_column = Excel.check_and_convert_string_value(start_column)
+
+            if(type(end_column) == str):
+                end_column = Excel.check_and_convert_string_value(end_column)
+
+            return abs(end_column - start_column) + 1
+
+        elif(cell_count == "workbook"):
+            return sum(len(getattr(worksheet, "_cells", {})) for worksheet in arguments.get("self").workbook.worksheets)
+
+        return 0
+
+
+    def start():
+        ExcelProfiler.records.set({})
+
+
+    def record(operation: str, elapsed_time: float, cells: int):
+        records = ExcelProfiler.records.get()
+        if(records == None):
+            records = ExcelProfiler.default_records
+
+        record = records.get(operation)
+        if(record == None):
+            record = records[operation] = {"count": 0, "time": 0.0, "cells": 0}
+
+        record["count"] += 1
+        record["time"] += elapsed_time
+        record["cells"] += cells
+
+
+    def summary():
+        records = ExcelProfiler.records.get()
+        if(records == None):
+            records = ExcelProfiler.default_records
+
+        return dict(sorted(records.items(), key = lambda item: item[1]["time"], reverse = True))
+
+
+    def server_timing(summary: dict):
+        return ", ".join(f"excel-{operation};dur={record['time'] * 1000:.3f};desc=\"{record['count']} calls, {record['cells']} cells\"" for operation, record in summary.items())
@@ -0,0 +1,72 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The Executor file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import threading
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from dependency import Dependency
+
+class Executor():
+    executor = None
+    processExecutor = None
+    processExecutorLock = threading.Lock()
+
+    def getExecutor():
+        if(Executor.executor == None):
+            Executor.executor = ThreadPoolExecutor(max_workers = Dependency.renderMaxWorkers, thread_name_prefix = "render")
+
+        return Executor.executor
+
+
+    def getProcessExecutor():
+        # Render threads ask for it concurrently, so only one of them builds the pool
+        with Executor.processExecutorLock:
+            if(Executor.processExecutor == None):
+                # forkserver children start from a clean single threaded server, never from the threaded uvicorn and pymongo process
+                Executor.processExecutor = ProcessPoolExecutor(max_workers = Dependency.renderMaxWorkers, mp_context = multiprocessing.get_context("forkserver"))
+
+        return Executor.processExecutor
+
+
+    async def run(function: any, *args, **kwargs):
+        # The context is copied so the Excel profiler still records into the request that started the render
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(Executor.getExecutor(), functools.partial(context.run, function, *args, **kwargs))
+
+
+    def shutdown():
+        if(Executor.executor != None):
+            Executor.executor.shutdown(wait = True)
+            Executor.executor = None
+
+        with Executor.processExecutorLock:
+            if(Executor.processExecutor != None):
+                Executor.processExecutor.shutdown(wait = True)
+                Executor.processExecutor = None
@@ -0,0 +1,89 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The Font Benchmark file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+import time
+
+from PIL import ImageFont
+
+from font_fitter import FontFitter
+
+class FontBenchmark:
+    fontPath = "calibri.ttf"
+    width = int(191 // 1.25)
+
+    names = [
+        ["Short", "Drs. Ali"],
+        ["Medium", "Sekretaris Dinas Ketenagakerjaan"],
+        ["Long", "Dr. H. Muhammad Abdurrahman Syahputra Wicaksono, S.E., M.Si., M.M."]
+    ]
+
+    repeat = 20
+
+
+    def stepFit(text, width, fontSize = 11):
+        def measure(fontSize):
+            left, top, right, bottom = ImageFont.truetype(FontBenchmark.fontPath, fontSize).getbbox(text)
+
+            return right
+
+        textWidth = measure(fontSize)
+
+        if width > textWidth:
+            while width > textWidth:
+                fontSize += 1
+                textWidth = measure(fontSize)
+
+        elif width < textWidth:
+            while width < textWidth:
+                fontSize -= 1
+                textWidth = measure(fontSize)
+
+        return fontSize
+
+
+    def run(fit):
+        timeArray = []
+        for _ in range(FontBenchmark.repeat):
+            startTime = time.perf_counter()
+            fontSize = fit()
+            timeArray.append(time.perf_counter() - startTime)
+
+        return min(timeArray), fontSize
+
+
+    def main():
+        print(f"{'Name':<10}{'Method':<16}{'Font Size':>10}{'Time (ms)':>14}")
+
+        for nameType, name in FontBenchmark.names:
+            stepTime, stepSize = FontBenchmark.run(lambda: FontBenchmark.stepFit(name, FontBenchmark.width))
+            coldTime, coldSize = FontBenchmark.run(lambda: FontFitter(FontBenchmark.fontPath).fit(name, FontBenchmark.width)[0])
+
+            fitter = FontFitter(FontBenchmark.fontPath)
+            warmTime, warmSize = FontBenchmark.run(lambda: fitter.fit(name, FontBenchmark.width)[0])
+
+            print(f"{nameType:<10}{'Step':<16}{stepSize:>10}{stepTime * 1000:>14.3f}")
+            print(f"{nameType:<10}{'Search (cold)':<16}{coldSize:>10}{coldTime * 1000:>14.3f}")
+            print(f"{nameType:<10}{'Search (warm)':<16}{warmSize:>10}{warmTime * 1000:>14.3f}")
+
+
+FontBenchmark.main() # Make sure you are on /scripts directory
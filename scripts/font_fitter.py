@@ -0,0 +1,114 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The Font Fitter file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+from PIL import ImageFont
+
+class FontFitter():
+    fitters = {}
+    measure_limit = 4096
+
+    def __init__(self, font_path: str):
+        self.font_path = font_path
+        self.fonts = {}
+        self.measures = {}
+
+
+    def get(font_path: str):
+        fitter = FontFitter.fitters.get(font_path)
+
+        if(fitter == None):
+            fitter = FontFitter(font_path)
+            FontFitter.fitters[font_path] = fitter
+
+        return fitter
+
+
+    def font(self, size: int):
+        font = self.fonts.get(size)
+
+        if(font == None):
+            font = ImageFont.truetype(self.font_path, size)
+            self.fonts[size] = font
+
+        return font
+
+
+    def measure(self, text: str, size: int):
+        key = (text, size)
+
+        measure = self.measures.get(key)
+        if(measure == None):
+            if(len(self.measures) >= FontFitter.measure_limit):
+                self.measures = {}
+
+            # The right and bottom edges match what ImageDraw.textsize used to return
+            left, top, right, bottom = self.font(size).getbbox(text)
+            measure = self.measures[key] = (right, bottom)
+
+        return measure
+
+
+    def fit(self, text: str, width: int, size: int = 11):
+        text_width = self.measure(text, size)[0]
+
+        # Short text grows until it reaches the width, long text shrinks until it fits, like the old one point steps.
+        # The search gallops away from the starting size first, so a name that is one point off costs a single measure
+        if(text_width < width):
+            step = 1
+            low, high = size, size + step
+            while(self.measure(text, high)[0] < width):
+                step *= 2
+                low, high = high, size + step
+
+            while(high - low > 1):
+                middle = (low + high) // 2
+
+                if(self.measure(text, middle)[0] < width):
+                    low = middle
+
+                else:
+                    high = middle
+
+            size = high
+
+        elif(text_width > width):
+            step = 1
+            low, high = max(size - step, 0), size
+            while(low > 0 and self.measure(text, low)[0] > width):
+                step *= 2
+                low, high = max(size - step, 0), low
+
+            while(high - low > 1):
+                middle = (low + high) // 2
+
+                if(self.measure(text, middle)[0] <= width):
+                    low = middle
+
+                else:
+                    high = middle
+
+            size = max(low, 1)
+
+        text_width, text_height = self.measure(text, size)
+
+        return size, self.font(size), text_width, text_height
@@ -28,105 +28,132 @@ from dependency import Dependency
 from excel import Excel
 from database import Database
 from utility import Utility
+from inventories.master.inventoryMaster import InventoryMaster
 
 class InventoryDemand():
-    def writeRaw(currentDate):
+    categoryRawHeaderValue = ["No.", "Peminta", "Kategori", "Dibuat", "Direspon", "Status"]
+    itemRawHeaderValue = ["No.", "Peminta", "Kategori", "Barang", "Satuan", "Dibuat", "Direspon", "Status"]
+
+    rawStyle = {
+        "categoryHeader": Excel.row_style({
+            "A:F": {"font": {"size": 12, "bold": True}, "alignment": {"vertical": "center", "horizontal": "center"}, "border": {"side": "all", "style": "thin"}}
+        }),
+        "categoryMain": Excel.row_style({
+            "A:F": {"alignment": {"vertical": "center", "horizontal": "center"}, "border": {"side": "all", "style": "thin"}},
+            "B:E": {"alignment": {"vertical": "center", "horizontal": "left"}}
+        }),
+        "itemHeader": Excel.row_style({
+            "A:H": {"font": {"size": 12, "bold": True}, "alignment": {"vertical": "center", "horizontal": "center"}, "border": {"side": "all", "style": "thin"}}
+        }),
+        "itemMain": Excel.row_style({
+            "A:H": {"alignment": {"vertical": "center", "horizontal": "center"}, "border": {"side": "all", "style": "thin"}},
+            "B:D": {"alignment": {"vertical": "center", "horizontal": "left"}},
+            "F:G": {"alignment": {"vertical": "center", "horizontal": "left"}}
+        })
+    }
+
+    def writeRaw(currentDate, inventoryDemandDocument = None, inventoryMasterDocument = None):
         filePath = f"../{Dependency.inventoryDemandFolderPath}/Mentah {currentDate}.xlsx"
 
-        Excel.create_file(filePath)
-        workbook = Excel(filePath)
+        workbook = Excel.stream(filePath, backend = Dependency.excelBackend)
         workbook.change_sheet_name("Sheet", "Kategori")
         workbook.set_zoom(85)
 
-        collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryDemand)
-        inventoryDemandDocument = collection.find_one({"tahun": 2022})
+        if(inventoryDemandDocument == None):
+            inventoryDemandDocument = InventoryDemand.getDemandDocument()
+
+        if(inventoryMasterDocument == None):
+            inventoryMasterDocument = InventoryMaster.getMasterDocument()
 
-        masterCollection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryMaster)
-        inventoryMasterDocument = masterCollection.find_one({"tahun": 2022})
+        categoryMainValue = InventoryDemand.getCategoryMainRawValue(inventoryDemandDocument)
+        workbook.fit_width("A1", ["F", len(categoryMainValue) + 1], [InventoryDemand.categoryRawHeaderValue] + categoryMainValue, extra_width = 1)
         
         InventoryDemand.writeCategoryHeaderRaw(workbook)
-        InventoryDemand.writeCategoryMainRaw(workbook, inventoryDemandDocument)
+        InventoryDemand.writeCategoryMainRaw(workbook, categoryMainValue)
 
-        workbook.create_sheet("Barang")
-        workbook.change_sheet("Barang")
+        workbook.change_sheet(workbook.create_sheet("Barang"))
         workbook.set_zoom(85)
 
+        itemMainValue = InventoryDemand.getItemMainRawValue(inventoryDemandDocument, inventoryMasterDocument)
+        workbook.fit_width("A1", ["H", len(itemMainValue) + 1], [InventoryDemand.itemRawHeaderValue] + itemMainValue, extra_width = 1)
+
         InventoryDemand.writeItemHeaderRaw(workbook)
-        InventoryDemand.writeItemMainRaw(workbook, inventoryDemandDocument, inventoryMasterDocument)
+        InventoryDemand.writeItemMainRaw(workbook, itemMainValue)
 
         workbook.save()
 
 
     def writeCategoryHeaderRaw(workbook):
-        workbook.write_value_multiple("A1", "F1", ["No.", "Peminta", "Kategori", "Dibuat", "Direspon", "Status"])
-        workbook.font_multiple("A1", "F1", size=12, bold=True)
-        workbook.alignment_multiple("A1", "F1", vertical="center", horizontal="center")
-        workbook.border_multiple("A1", "F1", "all", style="thin")
+        workbook.append_rows([InventoryDemand.categoryRawHeaderValue], InventoryDemand.rawStyle["categoryHeader"])
 
 
-    def writeCategoryMainRaw(workbook, inventoryDemandDocument):
-        rowCount = 2
+    def getCategoryMainRawValue(inventoryDemandDocument):
+        mainValue = []
         for categoryIndex, categoryObject in enumerate(inventoryDemandDocument.get("kategori")):
             status = Utility.convertStatus(categoryObject.get("status"))
 
-            mainValue = [
+            mainValue.append([
                 categoryIndex + 1,
                 categoryObject.get("username"),
                 categoryObject.get("kategori"),
                 categoryObject.get("created_at"),
                 categoryObject.get("responded_at"),
                 status,
-            ]
+            ])
 
-            workbook.write_value_multiple(["A", rowCount], ["F", rowCount], mainValue)
-            workbook.alignment_multiple(["A", rowCount], ["F", rowCount], vertical="center", horizontal="center")
-            workbook.alignment_multiple(["B", rowCount], ["E", rowCount], vertical="center", horizontal="left")
-            workbook.border_multiple(["A", rowCount], ["F", rowCount], "all", style="thin")
+        return mainValue
 
-            rowCount += 1
 
-        
-        workbook.adjust_width("A1", ["F", rowCount], extra_width=1)
+    def writeCategoryMainRaw(workbook, mainValue):
+        workbook.append_rows(mainValue, InventoryDemand.rawStyle["categoryMain"])
 
 
     def writeItemHeaderRaw(workbook):
-        workbook.write_value_multiple("A1", "H1", ["No.", "Peminta", "Kategori", "Barang", "Satuan", "Dibuat", "Direspon", "Status"])
-        workbook.font_multiple("A1", "H1", size=12, bold=True)
-        workbook.alignment_multiple("A1", "H1", vertical="center", horizontal="center")
-        workbook.border_multiple("A1", "H1", "all", style="thin")
+        workbook.append_rows([InventoryDemand.itemRawHeaderValue], InventoryDemand.rawStyle["itemHeader"])
 
 
-    def writeItemMainRaw(workbook, inventoryDemandDocument, inventoryMasterDocument):
-        rowCount = 2
+    def getItemMainRawValue(inventoryDemandDocument, inventoryMasterDocument):
+        masterIndex = InventoryMaster.getMasterIndex(inventoryMasterDocument)
+
+        mainValue = []
         for demandItemIndex, demandItemObject in enumerate(inventoryDemandDocument.get("barang")):
-            for masterCategoryObject in inventoryMasterDocument.get("kategori"):
-                if(masterCategoryObject.get("id") == demandItemObject.get("kategori_id")):
-                    print("test")
-                    status = Utility.convertStatus(demandItemObject.get("status"))
-
-                    mainValue = [
-                        demandItemIndex + 1,
-                        demandItemObject.get("username"),
-                        masterCategoryObject.get("kategori"),
-                        demandItemObject.get("barang"),
-                        demandItemObject.get("satuan"),
-                        demandItemObject.get("created_at"),
-                        demandItemObject.get("responded_at"),
-                        status
-                    ]
-    
-                    workbook.write_value_multiple(["A", rowCount], ["H", rowCount], mainValue)
-                    workbook.alignment_multiple(["A", rowCount], ["H", rowCount], vertical="center", horizontal="center")
-                    workbook.alignment_multiple(["B", rowCount], ["D", rowCount], vertical="center", horizontal="left")
-                    workbook.alignment_multiple(["F", rowCount], ["G", rowCount], vertical="center", horizontal="left")
-                    workbook.border_multiple(["A", rowCount], ["H", rowCount], "all", style="thin")
+            masterCategoryObject = masterIndex["kategori"].get(demandItemObject.get("kategori_id"))
+
+            if(masterCategoryObject != None):
+                status = Utility.convertStatus(demandItemObject.get("status"))
+
+                mainValue.append([
+                    demandItemIndex + 1,
+                    demandItemObject.get("username"),
+                    masterCategoryObject.get("kategori"),
+                    demandItemObject.get("barang"),
+                    demandItemObject.get("satuan"),
+                    demandItemObject.get("created_at"),
+                    demandItemObject.get("responded_at"),
+                    status
+                ])
 
-                    rowCount += 1
+        return mainValue
 
 
-        workbook.adjust_width("A1", ["H", rowCount], extra_width=1)
+    def writeItemMainRaw(workbook, mainValue):
+        workbook.append_rows(mainValue, InventoryDemand.rawStyle["itemMain"])
 
     
+    def getDemandDocument():
+        collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryDemand)
+        inventoryDemandDocument = collection.find_one({"tahun": 2022})
+
+        return inventoryDemandDocument
+
+
+    async def getDemandDocumentAsync():
+        collection = Database.getAsyncCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryDemand)
+        inventoryDemandDocument = await collection.find_one({"tahun": 2022})
+
+        return inventoryDemandDocument
+
+
     def updateOptionData():
         files = os.listdir("../spreadsheets/inventories/demand")
 
@@ -24,13 +24,19 @@
 import datetime
 import os
 
-from openpyxl.drawing.image import Image as ExcelImage
+from io import BytesIO
+
 from PIL import Image, ImageDraw, ImageFont
 
 from dependency import Dependency
-from excel import Excel
+from executor import Executor
+from excel import Excel, Style
+from layout import Layout
 from database import Database
 from utility import Utility
+from font_fitter import FontFitter
+from report_cache import ReportCache
+from inventories.master.inventoryValuation import InventoryValuation
 
 class Pillow():
     def __init__(self, filePath, size = None):
@@ -63,8 +69,17 @@ class Pillow():
         self.image.save(self.filePath)
 
 
+    def toBytes(self):
+        output = BytesIO()
+        self.image.save(output, format = "PNG")
+
+        return output.getvalue()
+
+
     def checkTextSize(self, text, font):
-        return self.draw.textsize(text, font=font)
+        left, top, right, bottom = self.draw.textbbox((0, 0), text, font=font)
+
+        return right, bottom
 
 
     def drawText(self, position, text, font, fill):
@@ -79,63 +94,99 @@ class InventoryMaster():
 
     # ------------------------------------ RAW ----------------------------------- #
 
-    def writeRaw(currentDate):
-        filePath = f"../{Dependency.inventoryMasterFolderPath}/Mentah {currentDate}.xlsx"
-
-        collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryMaster)
-        inventoryMasterDocument = collection.find_one({"tahun": 2022})
-
-        Excel.create_file(filePath)
-        workbook = Excel(filePath)
+    rawHeaderValue = [
+        "No.",
+        "Nama",
+        "Satuan",
+        "Harga Satuan Sebelum Pajak",
+        "Harga Satuan",
+        "Saldo Jumlah Satuan",
+        "Mutasi Barang Masuk Jumlah Satuan",
+        "Mutasi Barang Keluar Jumlah Satuan",
+        "Saldo Akhir Jumlah Satuan",
+        "Jumlah Permintaan",
+        "Dibuat",
+        "Diupdate",
+        "Keterangan",
+        "Aktif"
+    ]
+
+    rawStyle = {
+        "header": Excel.row_style({
+            "A:N": {"font": {"bold": True, "size": 12}, "alignment": {"horizontal": "center", "vertical": "center"}, "border": {"side": "all", "style": "thin"}},
+            "D:J": {"alignment": {"horizontal": "center", "vertical": "center", "wrap": True}}
+        }),
+        "category": Excel.row_style({
+            "A:N": {"font": {"bold": True}, "border": {"side": "all", "style": "thin"}},
+            "A": {"alignment": {"horizontal": "center", "vertical": "center"}},
+            "D:J": {"alignment": {"horizontal": "center", "vertical": "center", "wrap": True}},
+            "K:N": {"alignment": {"horizontal": "center", "vertical": "center"}}
+        }),
+        "item": Excel.row_style({
+            "A:N": {"font": {"size": 10}, "border": {"side": "all", "style": "thin"}},
+            "A": {"alignment": {"horizontal": "center", "vertical": "center"}},
+            "C": {"alignment": {"horizontal": "center", "vertical": "center"}},
+            "D:J": {"alignment": {"horizontal": "center", "vertical": "center", "wrap": True}},
+            "D:E": {"number_format": "#,##0"},
+            "K:N": {"alignment": {"horizontal": "center", "vertical": "center"}}
+        }),
+        "blank": Excel.row_style({
+            "A:N": {"border": {"side": "all", "style": "thin"}},
+            "D:J": {"alignment": {"horizontal": "center", "vertical": "center", "wrap": True}},
+            "K:N": {"alignment": {"horizontal": "center", "vertical": "center"}}
+        })
+    }
+
+    def writeRaw(currentDate, inventoryMasterDocument = None):
+        if(inventoryMasterDocument == None):
+            inventoryMasterDocument = InventoryMaster.getMasterDocument()
+
+        reportKey = InventoryMaster.getReportKey("Mentah", inventoryMasterDocument)
+        if(ReportCache.restore(reportKey, InventoryMaster.getReportPath("Mentah", currentDate))):
+            return
+
+        InventoryMaster.renderRaw(currentDate, InventoryMaster.getMainRawValue(inventoryMasterDocument))
+        ReportCache.store(reportKey, InventoryMaster.getReportPath("Mentah", currentDate))
+
+
+    def renderRaw(currentDate, mainValue):
+        filePath = InventoryMaster.getReportPath("Mentah", currentDate)
+
+        workbook = Excel.stream(filePath, backend = Dependency.excelBackend)
         workbook.change_sheet_name("Sheet", "Inventarisasi")
         workbook.set_zoom(85)
 
+        widthValue = [InventoryMaster.rawHeaderValue] + [rowValue for rowType, rowArray in mainValue for rowValue in rowArray]
+        # The header still counts for the width but keeps its alignment, only the rows below it wrap when A:C is limited
+        workbook.fit_width("A2", ["C", len(widthValue)], widthValue, extra_width = 1, width_limit = 40)
+        workbook.fit_width("D1", ["J", len(widthValue)], widthValue, extra_width = 1, width_limit = 15)
+        workbook.fit_width("K1", ["N", len(widthValue)], widthValue, extra_width = 1)
+
         InventoryMaster.writeHeaderRaw(workbook)
-        InventoryMaster.writeMainRaw(workbook, inventoryMasterDocument)
+        InventoryMaster.writeMainRaw(workbook, mainValue)
 
         workbook.save()
 
 
     def writeHeaderRaw(workbook):
-        headerValue = [
-            "No.",
-            "Nama",
-            "Satuan",
-            "Harga Satuan Sebelum Pajak",
-            "Harga Satuan",
-            "Saldo Jumlah Satuan",
-            "Mutasi Barang Masuk Jumlah Satuan",
-            "Mutasi Barang Keluar Jumlah Satuan",
-            "Saldo Akhir Jumlah Satuan",
-            "Jumlah Permintaan",
-            "Dibuat",
-            "Diupdate",
-            "Keterangan",
-            "Aktif"
-        ]
+        workbook.append_rows([InventoryMaster.rawHeaderValue], InventoryMaster.rawStyle["header"])
 
-        workbook.write_value_multiple("A1", "N1", headerValue)
-        workbook.font_multiple("A1", "N1", bold = True, size = 12)
-        workbook.alignment_multiple("A1", "N1", horizontal = "center", vertical = "center")
-        workbook.border_multiple("A1", "N1", "all", style="thin")
 
-
-    def writeMainRaw(workbook, inventoryMasterDocument):
-        rowCount = 2
+    def getMainRawValue(inventoryMasterDocument):
+        mainValue = []
 
         categoryCount = 1
         for categoryObject in inventoryMasterDocument.get("kategori"):
-            workbook.write_value_multiple(["A", rowCount], ["B", rowCount], [Utility.romanNumeral(categoryCount), categoryObject.get("kategori")])
-            workbook.write_value_multiple(["K", rowCount], ["L", rowCount], [categoryObject.get("created_at"), categoryObject.get("updated_at")])
-            workbook.write_value_singular(["N", rowCount], Utility.convertActive(categoryObject.get("active")))
-
+            categoryValue = [None] * 14
+            categoryValue[0] = Utility.romanNumeral(categoryCount)
+            categoryValue[1] = categoryObject.get("kategori")
+            categoryValue[10] = categoryObject.get("created_at")
+            categoryValue[11] = categoryObject.get("updated_at")
+            categoryValue[13] = Utility.convertActive(categoryObject.get("active"))
 
-            workbook.font_multiple(["A", rowCount], ["N", rowCount], bold = True)
-            workbook.alignment_singular(["A", rowCount], horizontal = "center", vertical = "center")
-            workbook.border_multiple(["A", rowCount], ["N", rowCount], "all", style="thin")
-
-            rowCount += 1
+            mainValue.append(["category", [categoryValue]])
 
+            itemArray = []
             itemCount = 1
             for itemObject in categoryObject.get("barang"):
                 itemValue = [
@@ -155,656 +206,598 @@ class InventoryMaster():
                     Utility.convertActive(itemObject.get("active"))
                 ]
 
-                workbook.write_value_multiple(["A", rowCount], ["N", rowCount], itemValue)
-
-                workbook.font_multiple(["A", rowCount], ["N", rowCount], size = 10)
-                workbook.alignment_singular(["A", rowCount], horizontal = "center", vertical="center")
-                workbook.alignment_multiple(["C", rowCount], ["J", rowCount], horizontal = "center", vertical="center")
-                workbook.border_multiple(["A", rowCount], ["N", rowCount], "all", style="thin")
-                workbook.change_cell_number_format_multiple(["D", rowCount], ["E", rowCount], '#,##0')
-
-                rowCount += 1
+                itemArray.append(itemValue)
                 itemCount += 1
 
 
-            workbook.border_multiple(["A", rowCount], ["N", rowCount], "all", style="thin")
-            rowCount += 1
+            mainValue.append(["item", itemArray])
+            mainValue.append(["blank", [[]]])
             categoryCount += 1
 
+        return mainValue
 
-        workbook.adjust_width("A1", ["C", rowCount], extra_width = 1, width_limit = 40)
-        workbook.alignment_singular("B1", horizontal = "center", vertical = "center")
 
-        workbook.adjust_width("D1", ["J", rowCount], extra_width = 1, width_limit = 15)
-        workbook.alignment_multiple("D1", ["J", rowCount], horizontal = "center", vertical = "center", wrap = True)
-
-        workbook.adjust_width("K1", ["N", rowCount], extra_width = 1)
-        workbook.alignment_multiple("K1", ["N", rowCount], horizontal = "center", vertical = "center")
+    def writeMainRaw(workbook, mainValue):
+        for rowType, rowArray in mainValue:
+            workbook.append_rows(rowArray, InventoryMaster.rawStyle[rowType])
 
 
     # ------------------------------------ INVENTORY ----------------------------------- #
 
-    def writeInventory(currentDate):
-        filePath = f"../{Dependency.inventoryMasterFolderPath}/Inventarisasi {currentDate}.xlsx"
+    inventoryLayout = Layout.compile({
+        "title": "Semester {semester}",
+        "zoom": 85,
+        "width": {"A": 59, "B": 320, "C": 87, "D": 68, "E": 106, "F": 141, "G": 77, "H": 109, "I": 141, "J": 71, "K": 116, "L": 141, "M": 73, "N": 111, "O": 141, "P": 69, "Q": 111, "R": 141},
+        "height": {4: 43, 5: 61},
+        "header": [
+            {"range": "A1", "value": "LAPORAN INVENTARISASI PERSEDIAAN SEMESTER {semester} TAHUN {tahun_akhir}", "merge": "R1", "font": {"bold": True, "size": 12}, "alignment": {"vertical": "top", "horizontal": "center"}},
+            {"range": "A2", "value": "PER {tanggal_akhir} {bulan_akhir} {tahun_akhir}", "upper": True, "merge": "R2", "alignment": {"vertical": "top", "horizontal": "center"}},
+            {"range": "A3", "value": "DINAS KETENAGAKERJAAN KOTA BALIKPAPAN", "alignment": {"vertical": "top", "horizontal": "left"}},
+            {"range": "A4:C4", "value": ["No", "Uraian Barang", "Satuan"]},
+            {"range": "D4", "value": "Saldo (Per {tanggal_awal} {bulan_awal} {tahun_awal})", "merge": "F4"},
+            {"range": "G4", "value": "Mutasi Barang Masuk (PISAH PPN)", "merge": "I4"},
+            {"range": "J4", "value": "Mutasi Barang Masuk", "merge": "L4"},
+            {"range": "M4", "value": "Mutasi Barang Keluar", "merge": "O4"},
+            {"range": "P4", "value": "Saldo Akhir (Per {tanggal_akhir} {bulan_akhir} {tahun_akhir})", "merge": "R4"},
+            {"range": "D5:F5", "value": ["Jumlah Satuan", "Harga Satuan (Rp)", "Jumlah (Rp)"]},
+            {"range": "G5:I5", "value": ["Jumlah Satuan", "Harga Satuan (Rp)", "Jumlah (Rp)"]},
+            {"range": "J5:L5", "value": ["Jumlah Satuan", "Harga Satuan (Rp)", "Jumlah (Rp)"]},
+            {"range": "M5:O5", "value": ["Jumlah Satuan", "Harga Satuan (Rp)", "Jumlah (Rp)"]},
+            {"range": "P5:R5", "value": ["Jumlah Satuan", "Harga Satuan (Rp)", "Jumlah (Rp)"]},
+            {"range": "A4", "merge": "A5"},
+            {"range": "B4", "merge": "B5"},
+            {"range": "C4", "merge": "C5"},
+            {"range": "A4:R5", "font": {"bold": True, "size": 10}, "alignment": {"vertical": "center", "horizontal": "center", "wrap": True}, "border": {"side": "all", "style": "thin"}}
+        ],
+        "body": {
+            "row": 6,
+            "rows": {
+                "category": {"style": {
+                    "A:R": {"border": {"side": "all", "style": "thin"}},
+                    "A:B": {"font": {"bold": True, "size": 10}},
+                    "A": {"alignment": {"vertical": "top", "horizontal": "center"}},
+                    "B": {"alignment": {"vertical": "top", "horizontal": "left"}}
+                }},
+                "item": {"style": {
+                    "A:R": {"font": {"size": 10}, "alignment": {"vertical": "top", "horizontal": "center"}, "border": {"side": "all", "style": "thin"}},
+                    "B": {"alignment": {"vertical": "top", "horizontal": "left", "wrap": True}},
+                    "E:F": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "H:I": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "K:L": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "N:O": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "Q:R": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"}
+                }},
+                "blank": {"style": {
+                    "A:R": {"border": {"side": "all", "style": "thin"}}
+                }},
+                "subTotal": {"style": {
+                    "A:R": {"font": {"size": 10, "bold": True}, "alignment": {"vertical": "top"}, "border": {"side": "all", "style": "thin"}},
+                    "F": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "I": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "L": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "O": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "R": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"}
+                }},
+                "total": {"style": {
+                    "A:R": {"alignment": {"vertical": "top"}, "border": {"side": "all", "style": "thin"}},
+                    "A:C": {"font": {"size": 10, "bold": True}},
+                    "D:R": {"font": {"size": 11, "bold": True}},
+                    "F": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "I": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "L": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "O": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "R": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"}
+                }}
+            }
+        },
+        "footer": [
+            {"range": "O2", "value": "Balikpapan, {tanggal_akhir} {bulan_akhir} {tahun_akhir}", "merge": "Q2", "alignment": {"horizontal": "center"}},
+            {"range": "B3", "value": "Kasubag Umum", "merge": "C3", "alignment": {"horizontal": "center"}},
+            {"range": "O3", "value": "Pengurus Barang Pengguna", "merge": "Q3", "alignment": {"horizontal": "center"}},
+            {"range": "B7", "field": "plt_kasubag_umum", "merge": "C7", "alignment": {"horizontal": "center"}},
+            {"range": "O7", "field": "pengurus_barang_pengguna", "merge": "Q7", "alignment": {"horizontal": "center"}},
+            {"range": "F8", "value": "Mengetahui,", "merge": "K8", "font": {"bold": True}, "alignment": {"horizontal": "center"}},
+            {"range": "F9", "value": "Kepala Dinas Ketenagakerjaan", "merge": "K9", "font": {"bold": True}, "alignment": {"horizontal": "center"}},
+            {"range": "B9", "image": "sekretaris_dinas", "size": [420, 89]},
+            {"range": "F10", "value": "Kota Balikpapan", "merge": "K10", "font": {"bold": True}, "alignment": {"horizontal": "center"}},
+            {"range": "F14", "field": "kepala_dinas_ketenagakerjaan", "merge": "K14", "font": {"bold": True}, "alignment": {"horizontal": "center"}}
+        ]
+    })
 
-        collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryMaster)
-        inventoryMasterDocument = collection.find_one({"tahun": 2022})
+    def writeInventory(currentDate, inventoryValuationDocument = None):
+        if(inventoryValuationDocument == None):
+            inventoryValuationDocument = InventoryMaster.getValuationDocument()
 
-        dependencyData = InventoryMaster.getTranslatedDependencyData()
+        reportKey = InventoryMaster.getReportKey("Inventarisasi", inventoryValuationDocument)
+        if(ReportCache.restore(reportKey, InventoryMaster.getReportPath("Inventarisasi", currentDate))):
+            return
 
-        Excel.create_file(filePath)
-        workbook = Excel(filePath)
-        workbook.change_sheet_name("Sheet", f"Semester {dependencyData['semester']}")
-        workbook.set_zoom(85)
+        InventoryMaster.renderInventory(currentDate, InventoryMaster.getTranslatedDependencyData(), InventoryMaster.getMainInventoryValue(InventoryValuation.getValuation(inventoryValuationDocument)))
+        ReportCache.store(reportKey, InventoryMaster.getReportPath("Inventarisasi", currentDate))
 
-        InventoryMaster.writeHeaderInventory(workbook, dependencyData)
-        InventoryMaster.writeMainInventory(workbook, inventoryMasterDocument, dependencyData)
-
-        setWidthArray = [
-            ["A", 59],
-            ["B", 320],
-            ["C", 87],
-            ["D", 68],
-            ["E", 106],
-            ["F", 141],
-            ["G", 77],
-            ["H", 109],
-            ["I", 141],
-            ["J", 71],
-            ["K", 116],
-            ["L", 141],
-            ["M", 73],
-            ["N", 111],
-            ["O", 141],
-            ["P", 69],
-            ["Q", 111],
-            ["R", 141]
-        ]
 
-        for setWidthItem in setWidthArray:
-            workbook.set_width(setWidthItem[0], setWidthItem[1])
+    def renderInventory(currentDate, dependencyData, mainValue):
+        filePath = InventoryMaster.getReportPath("Inventarisasi", currentDate)
 
+        workbook = Excel.new(filePath, backend = Dependency.excelBackend)
+        InventoryMaster.inventoryLayout.write(workbook, dependencyData, mainValue, InventoryMaster.footerImage)
 
-        setHeightArray = [
-            [4, 43],
-            [5, 61]
-        ]
+        workbook.save()
 
-        for setHeightItem in setHeightArray:
-            workbook.set_height(setHeightItem[0], setHeightItem[1])
 
+    def getMainInventoryValue(valuation):
+        mainValue = []
+
+        itemValue = valuation["barang"]
+        itemRowArray = list(zip(
+            itemValue["nama"],
+            itemValue["satuan"],
+            itemValue["saldo_jumlah_satuan"],
+            itemValue["harga_satuan"],
+            itemValue["saldo_jumlah"],
+            itemValue["mutasi_barang_masuk_jumlah_satuan"],
+            itemValue["harga_satuan_sebelum_pajak"],
+            itemValue["mutasi_barang_masuk_sebelum_pajak_jumlah"],
+            itemValue["mutasi_barang_masuk_jumlah_satuan"],
+            itemValue["harga_satuan"],
+            itemValue["mutasi_barang_masuk_jumlah"],
+            itemValue["mutasi_barang_keluar_jumlah_satuan"],
+            itemValue["harga_satuan"],
+            itemValue["mutasi_barang_keluar_jumlah"],
+            itemValue["saldo_akhir_jumlah_satuan"],
+            itemValue["harga_satuan"],
+            itemValue["saldo_akhir_jumlah"]
+        ))
 
-        workbook.save()
+        footerString = "Total"
+        for categoryIndex, categoryObject in enumerate(valuation["kategori"]):
+            romanNumeral = Utility.romanNumeral(categoryIndex + 1)
+            mainValue.append(["category", [[f"{romanNumeral}.", categoryObject["kategori"]]]])
 
+            mainValue.append(["item", [[itemIndex + 1, *itemRow] for itemIndex, itemRow in enumerate(itemRowArray[categoryObject["start"]:categoryObject["end"]])]])
 
-    def writeHeaderInventory(workbook, dependencyData):
-        workbook.write_value_multiple("A1", "A3", [f"LAPORAN INVENTARISASI PERSEDIAAN SEMESTER {dependencyData['semester']} TAHUN {dependencyData['tahun_akhir']}", f"PER {dependencyData['tanggal_akhir']} {(dependencyData['bulan_akhir']).upper()} {dependencyData['tahun_akhir']}", "DINAS KETENAGAKERJAAN KOTA BALIKPAPAN"])
-        workbook.write_value_multiple("A4", "C4", ["No", "Uraian Barang", "Satuan"])
+            if(categoryObject["barang"]):
+                mainValue.append(["blank", [[]]])
 
-        workbook.write_value_singular("D4", f"Saldo (Per {dependencyData['tanggal_awal']} {dependencyData['bulan_awal']} {dependencyData['tahun_awal']})")
-        workbook.write_value_singular("G4", "Mutasi Barang Masuk (PISAH PPN)")
-        workbook.write_value_singular("J4", "Mutasi Barang Masuk")
-        workbook.write_value_singular("M4", "Mutasi Barang Keluar")
-        workbook.write_value_singular("P4", f"Saldo Akhir (Per {dependencyData['tanggal_akhir']} {dependencyData['bulan_akhir']} {dependencyData['tahun_akhir']})")
+            subTotalValue = [None] * 18
+            subTotalValue[1] = f"SUB TOTAL {categoryObject['kategori']}"
+            subTotalValue[5] = categoryObject["saldo_jumlah"]
+            subTotalValue[8] = categoryObject["mutasi_barang_masuk_sebelum_pajak_jumlah"]
+            subTotalValue[11] = categoryObject["mutasi_barang_masuk_jumlah"]
+            subTotalValue[14] = categoryObject["mutasi_barang_keluar_jumlah"]
+            subTotalValue[17] = categoryObject["saldo_akhir_jumlah"]
 
-        d5O5Value = ["Jumlah Satuan", "Harga Satuan (Rp)", "Jumlah (Rp)"]
-        workbook.write_value_multiple("D5", "F5", d5O5Value)
-        workbook.write_value_multiple("G5", "I5", d5O5Value)
-        workbook.write_value_multiple("J5", "L5", d5O5Value)
-        workbook.write_value_multiple("M5", "O5", d5O5Value)
-        workbook.write_value_multiple("P5", "R5", d5O5Value)
+            mainValue.append(["subTotal", [subTotalValue]])
+            mainValue.append(["blank", [[]]])
 
-        workbook.merge("A1", "R1")
-        workbook.merge("A2", "R2")
+            footerString += f"+{romanNumeral}"
 
-        workbook.merge("A4", "A5")
-        workbook.merge("B4", "B5")
-        workbook.merge("C4", "C5")
 
-        workbook.merge("D4", "F4")
-        workbook.merge("G4", "I4")
-        workbook.merge("J4", "L4")
-        workbook.merge("M4", "O4")
-        workbook.merge("P4", "R4")
+        totalValue = [None] * 18
+        totalValue[0] = footerString
+        totalValue[5] = valuation["total"]["saldo_jumlah"]
+        totalValue[8] = valuation["total"]["mutasi_barang_masuk_sebelum_pajak_jumlah"]
+        totalValue[11] = valuation["total"]["mutasi_barang_masuk_jumlah"]
+        totalValue[14] = valuation["total"]["mutasi_barang_keluar_jumlah"]
+        totalValue[17] = valuation["total"]["saldo_akhir_jumlah"]
 
-        workbook.font_singular("A1", bold = True, size = 12)
-        workbook.alignment_singular("A1", vertical = "top", horizontal = "center")
+        mainValue.append(["total", [totalValue]])
 
-        workbook.alignment_singular("A2", vertical = "top", horizontal = "center")
+        return mainValue
 
-        workbook.alignment_singular("A3", vertical = "top", horizontal = "left")
 
-        workbook.font_multiple("A4", "R5", bold = True, size = 10)
-        workbook.alignment_multiple("A4", "R5", vertical = "center", horizontal = "center", wrap = True)
-        workbook.border_multiple("A4", "R5", "all", style = "thin")
+    # ------------------------------------ STOCK ----------------------------------- #
 
+    stockLayout = Layout.compile({
+        "title": "Stok Opname TW {semester} {tahun_akhir}",
+        "zoom": 85,
+        "width": {"A": 31, "B": 99, "C": 356, "D": 95, "E": 91, "F": 99, "G": 121, "H": 185, "I": 185},
+        "height": {6: 53},
+        "columns": [
+            {"range": "A:I", "fill": {"type": "solid", "main_color": "ffffff"}}
+        ],
+        "header": [
+            {"range": "B2", "value": "RINCIAN HASIL PEMERIKSAAN BARANG PERSEDIAAN (STOK OPNAME)", "merge": "H2", "font": {"bold": True, "size": 12}, "alignment": {"horizontal": "center", "vertical": "center"}},
+            {"range": "B3", "value": "TAHUN {tahun_akhir}", "merge": "H3", "font": {"bold": True, "size": 12}, "alignment": {"horizontal": "center", "vertical": "center"}},
+            {"range": "B4", "value": "Dinas Ketenagakerjaan Kota Balikpapan", "merge": "H4", "font": {"bold": True, "size": 14}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "B6:H6", "value": ["KODE", "NAMA REKENING/BARANG", "VOLUME", "SATUAN", "SATUAN HARGA", "NILAI", "KETERANGAN"], "font": {"bold": True, "size": 12}, "alignment": {"horizontal": "center", "vertical": "center", "wrap": True}, "border": {"side": "all", "style": "thick"}}
+        ],
+        "body": {
+            "row": 7,
+            "height": 40,
+            "rows": {
+                "blank": {"style": {
+                    "B:H": {"border": {"side": "all", "style": "thin"}},
+                    "B": {"border": Style.side_thick_border("left")},
+                    "H": {"border": Style.side_thick_border("right")}
+                }},
+                "title": {"merge": ["C:E"], "style": {
+                    "B:H": {"border": {"side": "all", "style": "thin"}},
+                    "B": {"border": Style.side_thick_border("left")},
+                    "C": {"font": {"bold": True}, "alignment": {"horizontal": "left", "vertical": "center"}},
+                    "H": {"border": Style.side_thick_border("right")}
+                }},
+                "category": {"merge": ["C:E"], "style": {
+                    "B:H": {"border": {"side": "all", "style": "thin"}},
+                    "B": {"font": {"bold": True}, "alignment": {"horizontal": "left", "vertical": "center", "wrap": True}, "border": Style.side_thick_border("left")},
+                    "C": {"font": {"bold": True}, "alignment": {"horizontal": "left", "vertical": "center"}},
+                    "G": {"font": {"bold": True}, "alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "H": {"border": Style.side_thick_border("right")}
+                }},
+                "item": {"style": {
+                    "B:H": {"border": {"side": "all", "style": "thin"}},
+                    "B": {"border": Style.side_thick_border("left")},
+                    "C:F": {"font": {"size": 10}},
+                    "G": {"font": {"size": 11}},
+                    "C": {"alignment": {"horizontal": "left", "vertical": "center"}},
+                    "D:E": {"alignment": {"horizontal": "center", "vertical": "center"}},
+                    "F:G": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "H": {"border": Style.side_thick_border("right")}
+                }},
+                "subTotal": {"style": {
+                    "B:H": {"border": {"side": "all", "style": "thin"}},
+                    "B": {"border": Style.side_thick_border("left")},
+                    "G": {"alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"},
+                    "H": {"border": Style.side_thick_border("right")}
+                }}
+            }
+        },
+        "overlay": [
+            {"range": "G9", "field": "saldoAkhirTotal", "font": {"bold": True}, "alignment": {"horizontal": "right", "vertical": "center"}, "number_format": "#,##0"}
+        ],
+        "footer": [
+            {"range": "E2", "value": "Balikpapan, {tanggal_akhir} {bulan_akhir} {tahun_akhir}", "merge": "H2", "font": {"bold": True}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "B4", "value": "KASUBAG PROGRAM DAN KEUANGAN", "merge": "C4", "font": {"bold": True}, "alignment": {"horizontal": "center", "vertical": "center"}},
+            {"range": "E4", "value": "Pengurus Barang Pengguna", "merge": "H4", "font": {"bold": True}, "alignment": {"horizontal": "center", "vertical": "center"}},
+            {"range": "B8", "field": "kasubag_program_dan_keuangan", "upper": True, "merge": "C8", "font": {"bold": True, "underline": "single"}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "E8", "field": "pengurus_barang_pengguna", "upper": True, "merge": "H8", "font": {"bold": True, "underline": "single"}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "D9", "value": "Mengetahui :", "merge": "E9", "font": {"bold": True}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "B11", "value": "KEPALA DINAS KETENAGAKERJAAN", "merge": "C11", "font": {"bold": True}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "E11", "value": "KASUBAG UMUM", "merge": "H11", "font": {"bold": True}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "B12", "value": "KOTA BALIKPAPAN", "merge": "C12", "font": {"bold": True}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "B16", "field": "kepala_dinas_ketenagakerjaan", "upper": True, "merge": "C16", "font": {"bold": True, "underline": "single"}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "E16", "field": "plt_kasubag_umum", "upper": True, "merge": "H16", "font": {"bold": True, "underline": "single"}, "alignment": {"horizontal": "center", "vertical": "bottom"}},
+            {"range": "C19", "image": "sekretaris_dinas", "size": [344, 73]}
+        ]
+    })
 
-    def writeMainInventory(workbook, inventoryMasterDocument, dependencyData): 
-        rowCount = 6
+    def writeStock(currentDate, inventoryValuationDocument = None):
+        if(inventoryValuationDocument == None):
+            inventoryValuationDocument = InventoryMaster.getValuationDocument()
 
-        footerString = "Total"
+        reportKey = InventoryMaster.getReportKey("Stok", inventoryValuationDocument)
+        if(ReportCache.restore(reportKey, InventoryMaster.getReportPath("Stok", currentDate))):
+            return
 
-        saldoJumlahTotal = 0
-        mutasiBarangMasukSebelumPajakJumlahTotal = 0
-        mutasiBarangMasukJumlahTotal = 0
-        mutasiBarangKeluarJumlahTotal = 0
-        saldoAkhirJumlahTotal = 0
-        categoryCount = 1
-        for categoryObject in inventoryMasterDocument.get("kategori"):
-            if(categoryObject.get("active")):
-                romanNumeral = Utility.romanNumeral(categoryCount)
-                workbook.write_value_singular(["A", rowCount], f"{romanNumeral}.")
-                workbook.write_value_singular(["B", rowCount], categoryObject.get("kategori"))
-
-                workbook.font_multiple(["A", rowCount], ["B", rowCount], bold = True, size = 10)
-                workbook.alignment_singular(["A", rowCount], vertical = "top", horizontal = "center")
-                workbook.alignment_singular(["B", rowCount], vertical = "top", horizontal = "left")
-                workbook.border_multiple(["A", rowCount], ["R", rowCount], "all", style = "thin")
-
-                rowCount += 1
-                categoryCount += 1
-
-                saldoJumlahSubTotal = 0
-                mutasiBarangMasukSebelumPajakJumlahSubTotal = 0
-                mutasiBarangMasukJumlahSubTotal = 0
-                mutasiBarangKeluarJumlahSubTotal = 0
-                saldoAkhirJumlahSubTotal = 0
-                itemCount = 1
-                for itemObject in categoryObject.get("barang"):
-                    if(itemObject.get("active")):
-                        hargaSatuanSebelumPajak = itemObject.get("harga_satuan_sebelum_pajak")
-                        hargaSatuan = itemObject.get("harga_satuan")
-
-                        saldoJumlahSatuan = itemObject.get("saldo_jumlah_satuan")
-                        saldoJumlah = saldoJumlahSatuan * hargaSatuan
-                        saldoJumlahSubTotal += saldoJumlah
-
-                        mutasiBarangMasukSebelumPajakJumlahSatuan = itemObject.get("mutasi_barang_masuk_jumlah_satuan")
-                        mutasiBarangMasukSebelumPajakJumlah = mutasiBarangMasukSebelumPajakJumlahSatuan * hargaSatuanSebelumPajak
-                        mutasiBarangMasukSebelumPajakJumlahSubTotal += mutasiBarangMasukSebelumPajakJumlah
-
-                        mutasiBarangMasukJumlahSatuan = itemObject.get("mutasi_barang_masuk_jumlah_satuan")
-                        mutasiBarangMasukJumlah = mutasiBarangMasukJumlahSatuan * hargaSatuan
-                        mutasiBarangMasukJumlahSubTotal += mutasiBarangMasukJumlah
-
-                        mutasiBarangKeluarJumlahSatuan = itemObject.get("mutasi_barang_keluar_jumlah_satuan")
-                        mutasiBarangKeluarJumlah = mutasiBarangKeluarJumlahSatuan * hargaSatuan
-                        mutasiBarangKeluarJumlahSubTotal += mutasiBarangKeluarJumlah
-
-                        saldoAkhirJumlahSatuan = itemObject.get("saldo_akhir_jumlah_satuan")
-                        saldoAkhirJumlah = saldoAkhirJumlahSatuan * hargaSatuan
-                        saldoAkhirJumlahSubTotal += saldoAkhirJumlah
-
-                        workbook.write_value_singular(["A", rowCount], itemCount)
-                        workbook.write_value_singular(["B", rowCount], itemObject.get("nama"))
-                        workbook.write_value_singular(["C", rowCount], itemObject.get("satuan"))
-
-                        workbook.write_value_singular(["D", rowCount], saldoJumlahSatuan)
-                        workbook.write_value_singular(["E", rowCount], hargaSatuan)
-                        workbook.write_value_singular(["F", rowCount], saldoJumlah)
-
-                        workbook.write_value_singular(["G", rowCount], mutasiBarangMasukSebelumPajakJumlahSatuan)
-                        workbook.write_value_singular(["H", rowCount], hargaSatuanSebelumPajak)
-                        workbook.write_value_singular(["I", rowCount], mutasiBarangMasukSebelumPajakJumlah)
-
-                        workbook.write_value_singular(["J", rowCount], mutasiBarangMasukJumlahSatuan)
-                        workbook.write_value_singular(["K", rowCount], hargaSatuan)
-                        workbook.write_value_singular(["L", rowCount], mutasiBarangMasukJumlah)
-
-                        workbook.write_value_singular(["M", rowCount], mutasiBarangKeluarJumlahSatuan)
-                        workbook.write_value_singular(["N", rowCount], hargaSatuan)
-                        workbook.write_value_singular(["O", rowCount], mutasiBarangKeluarJumlah)
-
-                        workbook.write_value_singular(["P", rowCount], saldoAkhirJumlahSatuan)
-                        workbook.write_value_singular(["Q", rowCount], hargaSatuan)
-                        workbook.write_value_singular(["R", rowCount], saldoAkhirJumlah)
-
-                        workbook.font_multiple(["A", rowCount], ["R", rowCount], size = 10)
-                        workbook.alignment_multiple(["A", rowCount], ["R", rowCount], vertical = "top", horizontal = "center")
-                        workbook.alignment_singular(["B", rowCount], vertical = "top", horizontal = "left", wrap = True)
-                        workbook.border_multiple(["A", rowCount], ["R", rowCount], "all", style = "thin")
-
-                        numberFormatArray = [
-                            ["E", "F"],
-                            ["H", "I"],
-                            ["K", "L"],
-                            ["N", "O"],
-                            ["Q", "R"]
-                        ]
-
-                        for numberFormatItem in numberFormatArray:
-                            workbook.alignment_multiple([numberFormatItem[0], rowCount], [numberFormatItem[1], rowCount], horizontal = "right", vertical = "center")
-                            workbook.change_cell_number_format_multiple([numberFormatItem[0], rowCount], [numberFormatItem[1], rowCount], '#,##0')
-
-
-                        rowCount += 1
-                        itemCount += 1
-        
+        mainValue, saldoAkhirTotal = InventoryMaster.getMainStockValue(InventoryValuation.getValuation(inventoryValuationDocument))
 
-                if(categoryObject.get("barang")):
-                    workbook.border_multiple(["A", rowCount], ["R", rowCount], "all", style = "thin")
-                    rowCount += 1
-                    
-                workbook.write_value_singular(["B", rowCount], f"SUB TOTAL {categoryObject.get('kategori')}")
-                workbook.write_value_singular(["F", rowCount], saldoJumlahSubTotal)
-                workbook.write_value_singular(["I", rowCount], mutasiBarangMasukSebelumPajakJumlahSubTotal)
-                workbook.write_value_singular(["L", rowCount], mutasiBarangMasukJumlahSubTotal)
-                workbook.write_value_singular(["O", rowCount], mutasiBarangKeluarJumlahSubTotal)
-                workbook.write_value_singular(["R", rowCount], saldoAkhirJumlahSubTotal)
-
-                workbook.font_multiple(["A", rowCount], ["R", rowCount], size = 10, bold = True)
-                workbook.alignment_multiple(["A", rowCount], ["R", rowCount], vertical = "top")
-                workbook.border_multiple(["A", rowCount], ["R", rowCount], "all", style = "thin")
-
-                numberFormatArray = ["F", "I", "L", "O", "R"]
-                for numberFormatItem in numberFormatArray:
-                    workbook.alignment_singular([numberFormatItem, rowCount], horizontal = "right", vertical = "center")
-                    workbook.change_cell_number_format_singular([numberFormatItem, rowCount], '#,##0')
-
-
-                if(categoryCount == 1):
-                    footerString += f" {romanNumeral}"
-
-                if(categoryCount != 1):
-                    footerString += f"+{romanNumeral}"
-
-                saldoJumlahTotal += saldoJumlahSubTotal
-                mutasiBarangMasukSebelumPajakJumlahTotal += mutasiBarangMasukSebelumPajakJumlahSubTotal
-                mutasiBarangMasukJumlahTotal += mutasiBarangMasukJumlahSubTotal
-                mutasiBarangKeluarJumlahTotal += mutasiBarangKeluarJumlahSubTotal
-                saldoAkhirJumlahTotal += saldoAkhirJumlahSubTotal
-
-                rowCount += 1
-                workbook.border_multiple(["A", rowCount], ["R", rowCount], "all", style = "thin")
-                rowCount += 1
-                
-
-        #region total
-
-        workbook.write_value_singular(["A", rowCount], footerString)
-
-        workbook.write_value_singular(["F", rowCount], saldoJumlahTotal)
-        workbook.write_value_singular(["I", rowCount], mutasiBarangMasukSebelumPajakJumlahTotal)
-        workbook.write_value_singular(["L", rowCount], mutasiBarangMasukJumlahTotal)
-        workbook.write_value_singular(["O", rowCount], mutasiBarangKeluarJumlahTotal)
-        workbook.write_value_singular(["R", rowCount], saldoAkhirJumlahTotal)
-
-        workbook.font_multiple(["A", rowCount], ["C", rowCount], size = 10, bold = True)
-        workbook.font_multiple(["D", rowCount], ["R", rowCount], size = 11, bold = True)
-        workbook.alignment_multiple(["A", rowCount], ["R", rowCount], vertical = "top")
-        workbook.border_multiple(["A", rowCount], ["R", rowCount], "all", style = "thin")
-
-        numberFormatArray = ["F", "I", "L", "O", "R"]
-        for numberFormatItem in numberFormatArray:
-            workbook.alignment_singular([numberFormatItem, rowCount], horizontal = "right", vertical = "center")
-            workbook.change_cell_number_format_singular([numberFormatItem, rowCount], '#,##0')
-
-        #endregion total
-
-        #region footer
-
-        rowCount += 2
-        workbook.write_value_singular(["O", rowCount], f"Balikpapan, {dependencyData['tanggal_akhir']} {dependencyData['bulan_akhir']} {dependencyData['tahun_akhir']}")
-        workbook.alignment_singular(["O", rowCount], horizontal = "center")
-        workbook.merge(["O", rowCount], ["Q", rowCount])
-
-        rowCount += 1
-        workbook.write_value_singular(["B", rowCount], "Kasubag Umum")
-        workbook.alignment_singular(["B", rowCount], horizontal = "center")
-        workbook.merge(["B", rowCount], ["C", rowCount])
-
-        workbook.write_value_singular(["O", rowCount], "Pengurus Barang Pengguna")
-        workbook.alignment_singular(["O", rowCount], horizontal = "center")
-        workbook.merge(["O", rowCount], ["Q", rowCount])
-
-        rowCount += 4
-        workbook.write_value_singular(["B", rowCount], dependencyData['plt_kasubag_umum'])
-        workbook.alignment_singular(["B", rowCount], horizontal = "center")
-        workbook.merge(["B", rowCount], ["C", rowCount])
-
-        workbook.write_value_singular(["O", rowCount], dependencyData['pengurus_barang_pengguna'])
-        workbook.alignment_singular(["O", rowCount], horizontal = "center")
-        workbook.merge(["O", rowCount], ["Q", rowCount])
-
-        rowCount += 1
-        workbook.write_value_singular(["F", rowCount], "Mengetahui,")
-        workbook.font_singular(["F", rowCount], bold = True)
-        workbook.alignment_singular(["F", rowCount], horizontal = "center")
-        workbook.merge(["F", rowCount], ["K", rowCount])
-
-        rowCount += 1
-        workbook.write_value_singular(["F", rowCount], "Kepala Dinas Ketenagakerjaan")
-        workbook.font_singular(["F", rowCount], bold = True)
-        workbook.alignment_singular(["F", rowCount], horizontal = "center")
-        workbook.merge(["F", rowCount], ["K", rowCount])
-
-        InventoryMaster.generateFooterImage(dependencyData["sekretaris_dinas"], (420, 89))
-        excelImage = ExcelImage("./media/master footer/Master Footer Image.png")
-        workbook.active_sheet.add_image(excelImage, f"B{rowCount}")
-
-        rowCount += 1
-        workbook.write_value_singular(["F", rowCount], "Kota Balikpapan")
-        workbook.font_singular(["F", rowCount], bold = True)
-        workbook.alignment_singular(["F", rowCount], horizontal = "center")
-        workbook.merge(["F", rowCount], ["K", rowCount])
+        InventoryMaster.renderStock(currentDate, InventoryMaster.getTranslatedDependencyData(), mainValue, saldoAkhirTotal)
+        ReportCache.store(reportKey, InventoryMaster.getReportPath("Stok", currentDate))
 
-        rowCount += 4
-        workbook.write_value_singular(["F", rowCount], dependencyData['kepala_dinas_ketenagakerjaan'])
-        workbook.font_singular(["F", rowCount], bold = True)
-        workbook.alignment_singular(["F", rowCount], horizontal = "center")
-        workbook.merge(["F", rowCount], ["K", rowCount])
 
-        #endregion footer
+    def renderStock(currentDate, dependencyData, mainValue, saldoAkhirTotal):
+        filePath = InventoryMaster.getReportPath("Stok", currentDate)
 
+        workbook = Excel.new(filePath, backend = Dependency.excelBackend)
+        InventoryMaster.stockLayout.write(workbook, {**dependencyData, "saldoAkhirTotal": saldoAkhirTotal}, mainValue, InventoryMaster.footerImage)
 
-    # ------------------------------------ STOCK ----------------------------------- #
+        workbook.save()
 
-    def writeStock(currentDate):
-        filePath = f"../{Dependency.inventoryMasterFolderPath}/Stok {currentDate}.xlsx"
 
-        collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryMaster)
-        inventoryMasterDocument = collection.find_one({"tahun": 2022})
+    def getMainStockValue(valuation):
+        mainValue = [
+            ["blank", [[]]],
+            ["title", [[None, None, "Persediaan"], [None, None, "Persediaan Bahan Pakai Habis"]]]
+        ]
+
+        itemValue = valuation["barang"]
+        itemRowArray = [[None, None, *itemRow] for itemRow in zip(itemValue["nama"], itemValue["saldo_akhir_jumlah_satuan"], itemValue["satuan"], itemValue["harga_satuan"], itemValue["saldo_akhir_jumlah"])]
+
+        for category in valuation["kategori"]:
+            saldoAkhirSubTotal = category["saldo_akhir_jumlah"]
+
+            mainValue.append(["category", [[None, category["rekening"], f"Persediaan {category['kategori']}", None, None, None, saldoAkhirSubTotal]]])
+            mainValue.append(["item", itemRowArray[category["start"]:category["end"]]])
+            mainValue.append(["subTotal", [[None, None, None, None, None, None, saldoAkhirSubTotal]]])
+            mainValue.append(["blank", [[]]])
+
+        return mainValue, valuation["total"]["saldo_akhir_jumlah"]
+
+    
+    # ------------------------------------ ALL ----------------------------------- #
+
+    def writeAll(currentDate, inventoryMasterDocument = None, inventoryValuationDocument = None):
+        if(inventoryMasterDocument == None):
+            inventoryMasterDocument = InventoryMaster.getMasterDocument()
+
+        if(inventoryValuationDocument == None):
+            inventoryValuationDocument = InventoryMaster.getValuationDocument()
 
         dependencyData = InventoryMaster.getTranslatedDependencyData()
+        valuation = InventoryValuation.getValuation(inventoryValuationDocument)
 
-        Excel.create_file(filePath)
-        workbook = Excel(filePath)
-        workbook.change_sheet_name("Sheet", f"Stok Opname TW {dependencyData['semester']} {dependencyData['tahun_akhir']}")
-        workbook.set_zoom(85)
+        mainStockValue, saldoAkhirTotal = InventoryMaster.getMainStockValue(valuation)
 
-        InventoryMaster.writeHeaderStock(workbook, dependencyData)
-        heightRowCount = InventoryMaster.writeMainStock(workbook, inventoryMasterDocument, dependencyData)
-
-        setWidthArray = [
-            ["A", 31],
-            ["B", 99],
-            ["C", 356],
-            ["D", 95],
-            ["E", 91],
-            ["F", 99],
-            ["G", 121],
-            ["H", 185],
-            ["I", 185]
+        renderArray = [
+            ["Mentah", InventoryMaster.renderRaw, currentDate, InventoryMaster.getMainRawValue(inventoryMasterDocument)],
+            ["Inventarisasi", InventoryMaster.renderInventory, currentDate, dependencyData, InventoryMaster.getMainInventoryValue(valuation)],
+            ["Stok", InventoryMaster.renderStock, currentDate, dependencyData, mainStockValue, saldoAkhirTotal]
         ]
 
-        for setWidthItem in setWidthArray:
-            workbook.set_width(setWidthItem[0], setWidthItem[1])
+        reportDocument = {"Mentah": inventoryMasterDocument, "Inventarisasi": inventoryValuationDocument, "Stok": inventoryValuationDocument}
+        renderArray = [[InventoryMaster.getReportKey(reportName, reportDocument[reportName]), reportName, *renderItem] for reportName, *renderItem in renderArray]
+        renderArray = [renderItem for renderItem in renderArray if not ReportCache.restore(renderItem[0], InventoryMaster.getReportPath(renderItem[1], currentDate))]
 
+        if(not renderArray):
+            return
 
-        setHeightArray = [
-            [6, 53]
-        ]
+        # Each workbook is rendered in a process of the shared pool, so the bundle takes about as long as the slowest report when RENDER_MAX_WORKERS allows it
+        futureArray = [Executor.getProcessExecutor().submit(*renderItem[2:]) for renderItem in renderArray]
 
-        for setHeightItem in setHeightArray:
-            workbook.set_height(setHeightItem[0], setHeightItem[1])
+        for future in futureArray:
+            future.result()
 
-        
-        for setHeightItem in [[x, 40] for x in range(7, heightRowCount + 1)]:
-            workbook.set_height(setHeightItem[0], setHeightItem[1])
+        for reportKey, reportName, *_ in renderArray:
+            ReportCache.store(reportKey, InventoryMaster.getReportPath(reportName, currentDate))
 
 
-        workbook.fill_multiple(["A", 1], ["I", heightRowCount], type = "solid", main_color = "ffffff")
-    
-        workbook.save()
+    # ------------------------------------ REPORT ----------------------------------- #
 
+    rawLayoutVersion = 2
 
-    def writeHeaderStock(workbook, dependencyData):
-        workbook.write_value_singular("B2", "RINCIAN HASIL PEMERIKSAAN BARANG PERSEDIAAN (STOK OPNAME)")
-        workbook.font_singular("B2", bold = True, size = 12)
-        workbook.alignment_singular("B2", horizontal = "center", vertical = "center")
-        workbook.merge("B2", "H2")
-
-        workbook.write_value_singular("B3", f"TAHUN {dependencyData['tahun_akhir']}")
-        workbook.font_singular("B3", bold = True, size = 12)
-        workbook.alignment_singular("B3", horizontal = "center", vertical = "center")
-        workbook.merge("B3", "H3")
-
-        workbook.write_value_singular("B4", "Dinas Ketenagakerjaan Kota Balikpapan")
-        workbook.font_singular("B4", bold = True, size = 14)
-        workbook.alignment_singular("B4", horizontal = "center", vertical = "bottom")
-        workbook.merge("B4", "H4")
-
-        workbook.write_value_multiple("B6", "H6", ["KODE", "NAMA REKENING/BARANG", "VOLUME", "SATUAN", "SATUAN HARGA", "NILAI", "KETERANGAN"])
-        workbook.font_multiple("B6", "H6", bold = True, size = 12)
-        workbook.alignment_multiple("B6", "H6", horizontal = "center", vertical = "center", wrap = True)
-        workbook.border_multiple("B6", "H6", "all", style = "thick")
-
-
-    def writeMainStock(workbook, inventoryMasterDocument, dependencyData):
-        rowCount = 7
-
-        InventoryMaster.borderSideThick(workbook, ["B", rowCount], ["H", rowCount])
-        rowCount += 1
-
-        InventoryMaster.borderSideThick(workbook, ["B", rowCount], ["H", rowCount])
-        workbook.write_value_singular(["C", rowCount], "Persediaan")
-        workbook.font_singular(["C", rowCount], bold = True)
-        workbook.alignment_singular(["C", rowCount], horizontal = "left", vertical = "center")
-        workbook.merge(["C", rowCount], ["E", rowCount])
-        rowCount += 1
-
-        InventoryMaster.borderSideThick(workbook, ["B", rowCount], ["H", rowCount])
-        workbook.write_value_singular(["C", rowCount], "Persediaan Bahan Pakai Habis")
-        workbook.font_singular(["C", rowCount], bold = True)
-        workbook.alignment_singular(["C", rowCount], horizontal = "left",  vertical = "center")
-        workbook.merge(["C", rowCount], ["E", rowCount])
-        rowCount += 1
-
-        saldoAkhirTotal = 0
-        categoryCount = 0
-        for category in inventoryMasterDocument["kategori"]:
-            if(category["active"] == True):
-                InventoryMaster.borderSideThick(workbook, ["B", rowCount], ["H", rowCount])
-                workbook.write_value_multiple(["B", rowCount], ["C", rowCount], [category["rekening"], f"Persediaan {category['kategori']}"])
-                workbook.font_multiple(["B", rowCount], ["C", rowCount], bold = True)
-                workbook.alignment_singular(["B", rowCount], horizontal = "left", vertical = "center", wrap = True)
-                workbook.alignment_singular(["C", rowCount], horizontal = "left", vertical = "center")
-                workbook.merge(["C", rowCount], ["E", rowCount])
-                categoryCount += 1
-                rowCount += 1
-
-                saldoAkhirSubTotal = 0
-                itemCount = 0
-                for item in category["barang"]:
-                    if(item["active"] == True):
-                        InventoryMaster.borderSideThick(workbook, ["B", rowCount], ["H", rowCount])
-
-                        value = [
-                            item["nama"],
-                            item["saldo_akhir_jumlah_satuan"],
-                            item["satuan"],
-                            item["harga_satuan"],
-                            item["saldo_akhir_jumlah_satuan"] * item["harga_satuan"]
-                        ]
-
-                        workbook.write_value_multiple(["C", rowCount], ["G", rowCount], value)
-                       
-                        workbook.font_multiple(["C", rowCount], ["F", rowCount], size = 10)
-                        workbook.font_singular(["G", rowCount], size = 11)
-
-                        workbook.alignment_singular(["C", rowCount], horizontal = "left", vertical = "center")
-                        workbook.alignment_multiple(["D", rowCount], ["E", rowCount], horizontal = "center", vertical = "center")
-                        workbook.alignment_multiple(["F", rowCount], ["G", rowCount], horizontal = "right", vertical = "center")
-                        workbook.change_cell_number_format_multiple(["F", rowCount], ["G", rowCount], '#,##0')
-
-                        saldoAkhirSubTotal += value[4]
-                        itemCount += 1
-                        categoryCount += 1
-                        rowCount += 1
-
-
-                saldoAkhirSubTotalTop = rowCount - itemCount - 1
-                workbook.write_value_singular(["G", saldoAkhirSubTotalTop], saldoAkhirSubTotal)
-                workbook.font_singular(["G", saldoAkhirSubTotalTop], bold = True)
-                workbook.alignment_singular(["G", saldoAkhirSubTotalTop], horizontal = "right",  vertical = "center")
-                workbook.change_cell_number_format_singular(["G", saldoAkhirSubTotalTop], '#,##0')
-
-                InventoryMaster.borderSideThick(workbook, ["B", rowCount], ["H", rowCount])
-                workbook.write_value_singular(["G", rowCount], saldoAkhirSubTotal)
-                workbook.alignment_singular(["G", rowCount], horizontal = "right",  vertical = "center")
-                workbook.change_cell_number_format_singular(["G", rowCount], '#,##0')
-                categoryCount += 1
-                rowCount += 1
-
-                InventoryMaster.borderSideThick(workbook, ["B", rowCount], ["H", rowCount])
-                saldoAkhirTotal += saldoAkhirSubTotal
-                categoryCount += 1
-                rowCount += 1
-        
+    def getReportPath(reportName, currentDate):
+        return f"../{Dependency.inventoryMasterFolderPath}/{reportName} {currentDate}.xlsx"
 
-        heightRowCount = rowCount
-
-        saldoAkhirTotalTop = rowCount - categoryCount - 1
-        workbook.write_value_singular(["G", saldoAkhirTotalTop], saldoAkhirTotal)
-        workbook.font_singular(["G", saldoAkhirTotalTop], bold = True)
-        workbook.alignment_singular(["G", saldoAkhirTotalTop], horizontal = "right",  vertical = "center")
-        workbook.change_cell_number_format_singular(["G", saldoAkhirTotalTop], '#,##0')
-        rowCount += 1
-
-        #region footer
-
-        workbook.write_value_singular(["E", rowCount], f"Balikpapan, {dependencyData['tanggal_akhir']} {dependencyData['bulan_akhir']} {dependencyData['tahun_akhir']}")
-        workbook.font_singular(["E", rowCount], bold = True)
-        workbook.alignment_singular(["E", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["E", rowCount], ["H", rowCount])
-        rowCount += 2
-
-        workbook.write_value_singular(["B", rowCount], "KASUBAG PROGRAM DAN KEUANGAN")
-        workbook.font_singular(["B", rowCount], bold = True)
-        workbook.alignment_singular(["B", rowCount], horizontal = "center", vertical = "center")
-        workbook.merge(["B", rowCount], ["C", rowCount])
-
-        workbook.write_value_singular(["E", rowCount], "Pengurus Barang Pengguna")
-        workbook.font_singular(["E", rowCount], bold = True)
-        workbook.alignment_singular(["E", rowCount], horizontal = "center", vertical = "center")
-        workbook.merge(["E", rowCount], ["H", rowCount])
-        rowCount += 4
-
-        workbook.write_value_singular(["B", rowCount], f"{dependencyData['kasubag_program_dan_keuangan'].upper()}")
-        workbook.font_singular(["B", rowCount], bold = True, underline = "single")
-        workbook.alignment_singular(["B", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["B", rowCount], ["C", rowCount])
-
-        workbook.write_value_singular(["E", rowCount], f"{dependencyData['pengurus_barang_pengguna'].upper()}")
-        workbook.font_singular(["E", rowCount], bold = True, underline = "single")
-        workbook.alignment_singular(["E", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["E", rowCount], ["H", rowCount])
-        rowCount += 1
-
-        workbook.write_value_singular(["D", rowCount], f"Mengetahui :")
-        workbook.font_singular(["D", rowCount], bold = True)
-        workbook.alignment_singular(["D", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["D", rowCount], ["E", rowCount])
-        rowCount += 2
-
-        workbook.write_value_singular(["B", rowCount], "KEPALA DINAS KETENAGAKERJAAN")
-        workbook.font_singular(["B", rowCount], bold = True)
-        workbook.alignment_singular(["B", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["B", rowCount], ["C", rowCount])
-
-        workbook.write_value_singular(["E", rowCount], "KASUBAG UMUM")
-        workbook.font_singular(["E", rowCount], bold = True)
-        workbook.alignment_singular(["E", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["E", rowCount], ["H", rowCount])
-        rowCount += 1
-
-        workbook.write_value_singular(["B", rowCount], "KOTA BALIKPAPAN")
-        workbook.font_singular(["B", rowCount], bold = True)
-        workbook.alignment_singular(["B", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["B", rowCount], ["C", rowCount])
-        rowCount += 4
-
-        workbook.write_value_singular(["B", rowCount], f"{dependencyData['kepala_dinas_ketenagakerjaan'].upper()}")
-        workbook.font_singular(["B", rowCount], bold = True, underline = "single")
-        workbook.alignment_singular(["B", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["B", rowCount], ["C", rowCount])
-
-        workbook.write_value_singular(["E", rowCount], f"{dependencyData['plt_kasubag_umum'].upper()}")
-        workbook.font_singular(["E", rowCount], bold = True, underline = "single")
-        workbook.alignment_singular(["E", rowCount], horizontal = "center", vertical = "bottom")
-        workbook.merge(["E", rowCount], ["H", rowCount])
-        rowCount += 3
-
-        InventoryMaster.generateFooterImage(dependencyData["sekretaris_dinas"], (344, 73))
-        excelImage = ExcelImage("./media/master footer/Master Footer Image.png")
-        workbook.active_sheet.add_image(excelImage, f"C{rowCount}")
-
-        #endregion footer
-
-        return heightRowCount
 
-    
-    def borderSideThick(workbook, start_range, end_range):
-        workbook.border_multiple(start_range, end_range, "all", style = "thin")
+    def getReportKey(reportName, inventoryMasterDocument):
+        if(reportName == "Mentah"):
+            return ReportCache.key(reportName, InventoryMaster.rawLayoutVersion, inventoryMasterDocument)
+
+        elif(reportName == "Inventarisasi"):
+            return ReportCache.key(reportName, InventoryMaster.inventoryLayout.version, inventoryMasterDocument, InventoryMaster.getTranslatedDependencyData())
 
-        workbook.side_thick_border(start_range, end_range)
+        return ReportCache.key(reportName, InventoryMaster.stockLayout.version, inventoryMasterDocument, InventoryMaster.getTranslatedDependencyData())
 
 
     # ------------------------------------ UTILITY ----------------------------------- #
 
-    def generateFooterImage(text, finalSize):
-        middleHeaderMasterFooterObject = Pillow("./media/master footer/Middle Header Master Footer Image.png")
-        middleTemplateMasterFooterObject = Pillow("./media/master footer/Middle Template Master Footer Image.png", (191, 77))
+    footerTemplates = {}
+    footerImages = {}
 
-        fontSize = 11
-        font = ImageFont.truetype("calibri.ttf", fontSize)
-        
-        textWidthRange = int(middleTemplateMasterFooterObject.width // 1.25)
-        textWidth, textHeight = middleTemplateMasterFooterObject.checkTextSize(text, font)
+    def footerImage(text, finalSize):
+        key = (text, tuple(finalSize))
+
+        imageData = InventoryMaster.footerImages.get(key)
+        if(imageData == None):
+            imageData = InventoryMaster.generateFooterImage(text, finalSize)
+            InventoryMaster.footerImages[key] = imageData
+
+        # Every workbook gets its own buffer because openpyxl closes the image buffer once it is saved
+        return BytesIO(imageData)
 
-        if textWidthRange > textWidth:
-            while textWidthRange > textWidth:
-                fontSize += 1
-                font = ImageFont.truetype("calibri.ttf", fontSize)
 
-                textWidth, textHeight = middleTemplateMasterFooterObject.checkTextSize(text, font)
+    def getFooterTemplate(templateName):
+        template = InventoryMaster.footerTemplates.get(templateName)
 
+        if(template == None):
+            template = Pillow(f"./media/master footer/{templateName}.png")
+            template.image.load()
 
-        elif textWidthRange < textWidth:
-            while textWidthRange < textWidth:
-                fontSize -= 1
-                font = ImageFont.truetype("calibri.ttf", fontSize)
+            InventoryMaster.footerTemplates[templateName] = template
 
-                textWidth, textHeight = middleTemplateMasterFooterObject.checkTextSize(text, font)
+        return template
 
 
+    def generateFooterImage(text, finalSize):
+        middleHeaderMasterFooterObject = InventoryMaster.getFooterTemplate("Middle Header Master Footer Image")
+        middleTemplateMasterFooterObject = Pillow(None, (191, 77))
+
+        textWidthRange = int(middleTemplateMasterFooterObject.width // 1.25)
+        fontSize, font, textWidth, textHeight = FontFitter.get("calibri.ttf").fit(text, textWidthRange, 11)
+
         middleTemplateMasterFooterObject.drawText((8, (middleTemplateMasterFooterObject.height - textHeight)//2), text, font, "black")
         middleTemplateMasterFooterObject.drawLine((0, 0, middleTemplateMasterFooterObject.width-1, 0), "black", 1)
         middleTemplateMasterFooterObject.drawLine((0, 0, 0, middleTemplateMasterFooterObject.height-1), "black", 1)
         middleTemplateMasterFooterObject.drawLine((middleTemplateMasterFooterObject.width-1, 0, middleTemplateMasterFooterObject.width-1, middleTemplateMasterFooterObject.height-1), "black", 1)
         middleTemplateMasterFooterObject.drawLine((0, middleTemplateMasterFooterObject.height-1, middleTemplateMasterFooterObject.width-1, middleTemplateMasterFooterObject.height-1), "black", 1)
-        middleTemplateMasterFooterObject.save()
 
-        middleMasterFooterObject = Pillow("./media/master footer/Middle Master Footer Image.png", (middleHeaderMasterFooterObject.width, (middleHeaderMasterFooterObject.height + middleTemplateMasterFooterObject.height - 1)))
+        middleMasterFooterObject = Pillow(None, (middleHeaderMasterFooterObject.width, (middleHeaderMasterFooterObject.height + middleTemplateMasterFooterObject.height - 1)))
         middleMasterFooterObject.image.paste(middleTemplateMasterFooterObject.image, (0, (middleMasterFooterObject.height - middleTemplateMasterFooterObject.height)))
         middleMasterFooterObject.image.paste(middleHeaderMasterFooterObject.image, (0, (middleMasterFooterObject.height -  middleHeaderMasterFooterObject.height - middleTemplateMasterFooterObject.height + 1)))
 
-        middleMasterFooterObject.save()
+        leftMasterFooterObject = InventoryMaster.getFooterTemplate("Left Master Footer Image")
+        rightMasterFooterObject = InventoryMaster.getFooterTemplate("Right Master Footer Image")
 
-        leftMasterFooterObject = Pillow("./media/master footer/Left Master Footer Image.png")
-        rightMasterFooterObject = Pillow("./media/master footer/Right Master Footer Image.png")
-
-        masterFooterObject = Pillow("./media/master footer/Master Footer Image.png", ((leftMasterFooterObject.width + middleMasterFooterObject.width + rightMasterFooterObject.width - 2), 113))
+        masterFooterObject = Pillow(None, ((leftMasterFooterObject.width + middleMasterFooterObject.width + rightMasterFooterObject.width - 2), 113))
         masterFooterObject.image.paste(rightMasterFooterObject.image, ((masterFooterObject.width - rightMasterFooterObject.width), 0))
         masterFooterObject.image.paste(middleMasterFooterObject.image, ((masterFooterObject.width - middleMasterFooterObject.width - rightMasterFooterObject.width + 1), 0))
         masterFooterObject.image.paste(leftMasterFooterObject.image, ((masterFooterObject.width - leftMasterFooterObject.width - middleMasterFooterObject.width - rightMasterFooterObject.width + 2), 0))
 
         masterFooterObject.resize(finalSize)
-        masterFooterObject.save()
+
+        return masterFooterObject.toBytes()
+
+
+    # ------------------------------------ DOCUMENT ----------------------------------- #
+
+    masterDocuments = {}
+
+    masterVersionCategoryFields = ["kategori", "rekening", "active"]
+    masterVersionItemFields = ["nama", "satuan", "keterangan", "active"]
+
+    def getMasterVersionPipeline(year):
+        # updated_at only has a one second resolution and is not bumped by every write, so the version also carries the counts, the text fields and active flags as they are and the sum of every amount
+        itemSums = {field: {"$sum": {"$map": {"input": {"$ifNull": ["$kategori", []]}, "as": "kategori", "in": {"$sum": f"$$kategori.barang.{field}"}}}} for field in ["jumlah_permintaan", *InventoryValuation.itemFields]}
+
+        return [
+            {"$match": {"tahun": year}},
+            {"$project": {
+                "kategori": {"$size": {"$ifNull": ["$kategori", []]}},
+                "barang": {"$sum": {"$map": {"input": {"$ifNull": ["$kategori", []]}, "as": "kategori", "in": {"$size": {"$ifNull": ["$$kategori.barang", []]}}}}},
+                "kategoriUpdatedAt": {"$max": "$kategori.updated_at"},
+                "barangUpdatedAt": {"$max": {"$map": {"input": {"$ifNull": ["$kategori", []]}, "as": "kategori", "in": {"$max": "$$kategori.barang.updated_at"}}}},
+                "fields": {"$map": {
+                    "input": {"$ifNull": ["$kategori", []]},
+                    "as": "kategori",
+                    "in": {
+                        **{field: f"$$kategori.{field}" for field in InventoryMaster.masterVersionCategoryFields},
+                        "barang": {"$map": {"input": {"$ifNull": ["$$kategori.barang", []]}, "as": "barang", "in": {field: f"$$barang.{field}" for field in InventoryMaster.masterVersionItemFields}}}
+                    }
+                }},
+                **itemSums
+            }}
+        ]
+
+
+    def getValuationPipeline(year):
+        # Inventory and stock reports only read active rows and these fields, the rest of the document is never sent
+        itemProjection = {field: f"$$barang.{field}" for field in ["nama", "satuan", "active", *InventoryValuation.itemFields]}
+
+        return [
+            {"$match": {"tahun": year}},
+            {"$project": {
+                "_id": False,
+                "tahun": True,
+                "kategori": {"$map": {
+                    "input": {"$filter": {"input": {"$ifNull": ["$kategori", []]}, "as": "kategori", "cond": {"$eq": ["$$kategori.active", True]}}},
+                    "as": "kategori",
+                    "in": {
+                        "id": "$$kategori.id",
+                        "kategori": "$$kategori.kategori",
+                        "rekening": "$$kategori.rekening",
+                        "active": "$$kategori.active",
+                        "jumlah_barang": {"$size": {"$ifNull": ["$$kategori.barang", []]}},
+                        "barang": {"$map": {
+                            "input": {"$filter": {"input": {"$ifNull": ["$$kategori.barang", []]}, "as": "barang", "cond": {"$eq": ["$$barang.active", True]}}},
+                            "as": "barang",
+                            "in": itemProjection
+                        }}
+                    }
+                }}
+            }}
+        ]
+
+
+    def getMasterDocument(year = 2022, pipeline = None):
+        collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryMaster)
+
+        masterVersion = next(collection.aggregate(InventoryMaster.getMasterVersionPipeline(year)), None)
+
+        cachedMaster = InventoryMaster.masterDocuments.get((year, pipeline))
+        if(cachedMaster != None and masterVersion != None and cachedMaster[0] == masterVersion):
+            return cachedMaster[1]
+
+        if(pipeline == None):
+            inventoryMasterDocument = collection.find_one({"tahun": year})
+
+        else:
+            inventoryMasterDocument = next(collection.aggregate(pipeline(year)), None)
+
+        InventoryMaster.masterDocuments[(year, pipeline)] = [masterVersion, inventoryMasterDocument]
+
+        return inventoryMasterDocument
+
+
+    async def getMasterDocumentAsync(year = 2022, pipeline = None):
+        collection = Database.getAsyncCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryMaster)
+
+        masterVersionCursor = await collection.aggregate(InventoryMaster.getMasterVersionPipeline(year))
+        masterVersionArray = await masterVersionCursor.to_list(1)
+        masterVersion = masterVersionArray[0] if masterVersionArray else None
+
+        cachedMaster = InventoryMaster.masterDocuments.get((year, pipeline))
+        if(cachedMaster != None and masterVersion != None and cachedMaster[0] == masterVersion):
+            return cachedMaster[1]
+
+        if(pipeline == None):
+            inventoryMasterDocument = await collection.find_one({"tahun": year})
+
+        else:
+            inventoryMasterCursor = await collection.aggregate(pipeline(year))
+            inventoryMasterArray = await inventoryMasterCursor.to_list(1)
+            inventoryMasterDocument = inventoryMasterArray[0] if inventoryMasterArray else None
+
+        InventoryMaster.masterDocuments[(year, pipeline)] = [masterVersion, inventoryMasterDocument]
+
+        return inventoryMasterDocument
+
+
+    def getValuationDocument(year = 2022):
+        return InventoryMaster.getMasterDocument(year, InventoryMaster.getValuationPipeline)
+
+
+    async def getValuationDocumentAsync(year = 2022):
+        return await InventoryMaster.getMasterDocumentAsync(year, InventoryMaster.getValuationPipeline)
+
+
+    # ------------------------------------ INDEX ----------------------------------- #
+
+    masterIndex = [None, None]
+
+    def getMasterIndex(inventoryMasterDocument):
+        # Cached master documents are shared objects, so the index is rebuilt only when a new snapshot comes in
+        indexedDocument, index = InventoryMaster.masterIndex
+        if(indexedDocument is inventoryMasterDocument):
+            return index
+
+        index = {"kategori": {}, "barang": {}}
+        for categoryObject in inventoryMasterDocument.get("kategori"):
+            index["kategori"][categoryObject.get("id")] = categoryObject
+
+            for itemObject in categoryObject.get("barang"):
+                index["barang"][(categoryObject.get("id"), itemObject.get("id"))] = itemObject
+
+
+        InventoryMaster.masterIndex = [inventoryMasterDocument, index]
+
+        return index
 
 
     # ------------------------------------ DEPENDENCY ----------------------------------- #
 
+    dependencyCache = None
+
     def getDependencyData():
-        collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryDependency)
-        inventoryDependencyDocument = collection.find_one({"id": 1}, { "id": False, "_id": False })
+        if(InventoryMaster.dependencyCache == None):
+            collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryDependency)
+            inventoryDependencyDocument = collection.find_one({"id": 1}, { "id": False, "_id": False })
 
-        return inventoryDependencyDocument
+            if(inventoryDependencyDocument == None):
+                return None
+
+            InventoryMaster.setDependencyData(inventoryDependencyDocument)
+
+        return InventoryMaster.dependencyCache[0]
+
+
+    async def getDependencyDataAsync():
+        if(InventoryMaster.dependencyCache == None):
+            collection = Database.getAsyncCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryDependency)
+            inventoryDependencyDocument = await collection.find_one({"id": 1}, { "id": False, "_id": False })
+
+            if(inventoryDependencyDocument == None):
+                return None
+
+            InventoryMaster.setDependencyData(inventoryDependencyDocument)
+
+        return InventoryMaster.dependencyCache[0]
 
 
     def getTranslatedDependencyData():
-        rawDependencyData = InventoryMaster.getDependencyData()
+        InventoryMaster.getDependencyData()
 
+        return InventoryMaster.dependencyCache[1]
+
+
+    def setDependencyData(rawDependencyData):
+        dependencyData = InventoryMaster.translateDependencyData(rawDependencyData)
+
+        InventoryMaster.dependencyCache = [rawDependencyData, dependencyData]
+        InventoryMaster.footerImages = {}
+        Utility.writeJSON("./json/master_dependency_data.json", dependencyData)
+
+
+    def translateDependencyData(rawDependencyData):
         dependencyData = {
             "semester": Utility.romanNumeral(rawDependencyData.get("semester")),
             "tanggal_awal": rawDependencyData.get("tanggal_awal"),
@@ -820,7 +813,6 @@ class InventoryMaster():
             "kepala_dinas_ketenagakerjaan": rawDependencyData.get("kepala_dinas_ketenagakerjaan")
         }
 
-        Utility.writeJSON("./json/master_dependency_data.json", dependencyData)
         return dependencyData
 
     
@@ -853,6 +845,7 @@ class InventoryMaster():
 
         collection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryDependency)
         collection.replace_one({"id": dependencyData["id"]}, dependencyData, upsert=True)
+        InventoryMaster.setDependencyData({key: value for key, value in dependencyData.items() if key not in ("id", "_id")})
 
         return {"success": True}
 
@@ -0,0 +1,99 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The InventoryValuation file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+from operator import itemgetter
+
+import numpy
+
+class InventoryValuation():
+    itemFields = [
+        "saldo_jumlah_satuan",
+        "mutasi_barang_masuk_jumlah_satuan",
+        "mutasi_barang_keluar_jumlah_satuan",
+        "saldo_akhir_jumlah_satuan",
+        "harga_satuan_sebelum_pajak",
+        "harga_satuan"
+    ]
+
+    amountFields = [
+        "saldo_jumlah",
+        "mutasi_barang_masuk_sebelum_pajak_jumlah",
+        "mutasi_barang_masuk_jumlah",
+        "mutasi_barang_keluar_jumlah",
+        "saldo_akhir_jumlah"
+    ]
+
+    getItemValue = itemgetter("nama", "satuan", *itemFields)
+
+    def getValuation(inventoryMasterDocument):
+        categoryArray = []
+        itemArray = []
+
+        for categoryObject in inventoryMasterDocument.get("kategori"):
+            if(categoryObject.get("active")):
+                startIndex = len(itemArray)
+                itemArray.extend(InventoryValuation.getItemValue(itemObject) for itemObject in categoryObject.get("barang") if itemObject.get("active"))
+
+                categoryArray.append({
+                    "id": categoryObject.get("id"),
+                    "kategori": categoryObject.get("kategori"),
+                    "rekening": categoryObject.get("rekening"),
+                    "barang": categoryObject.get("jumlah_barang", len(categoryObject.get("barang"))) > 0,
+                    "start": startIndex,
+                    "end": len(itemArray)
+                })
+
+
+        itemColumn = list(zip(*itemArray)) if itemArray else [()] * (len(InventoryValuation.itemFields) + 2)
+        itemValue = numpy.array(itemColumn[2:]) if itemArray else numpy.zeros((len(InventoryValuation.itemFields), 0), dtype = numpy.int64)
+
+        saldoJumlahSatuan, mutasiBarangMasukJumlahSatuan, mutasiBarangKeluarJumlahSatuan, saldoAkhirJumlahSatuan, hargaSatuanSebelumPajak, hargaSatuan = itemValue
+
+        amountValue = numpy.stack([
+            saldoJumlahSatuan * hargaSatuan,
+            mutasiBarangMasukJumlahSatuan * hargaSatuanSebelumPajak,
+            mutasiBarangMasukJumlahSatuan * hargaSatuan,
+            mutasiBarangKeluarJumlahSatuan * hargaSatuan,
+            saldoAkhirJumlahSatuan * hargaSatuan
+        ])
+
+        # numpy.add.at and cumsum add in item order, so float prices give the same sums as adding them one by one
+        categoryIndex = numpy.repeat(numpy.arange(len(categoryArray)), [categoryObject["end"] - categoryObject["start"] for categoryObject in categoryArray])
+        subTotalValue = numpy.zeros((len(categoryArray), len(InventoryValuation.amountFields)), dtype = amountValue.dtype)
+        numpy.add.at(subTotalValue, categoryIndex, amountValue.T)
+
+        totalValue = subTotalValue.cumsum(axis = 0)[-1] if len(categoryArray) else subTotalValue.sum(axis = 0)
+
+        for categoryObject, categorySubTotal in zip(categoryArray, subTotalValue.tolist()):
+            categoryObject.update(zip(InventoryValuation.amountFields, categorySubTotal))
+
+        return {
+            "kategori": categoryArray,
+            "barang": {
+                "nama": list(itemColumn[0]),
+                "satuan": list(itemColumn[1]),
+                **dict(zip(InventoryValuation.itemFields, itemValue.tolist())),
+                **dict(zip(InventoryValuation.amountFields, amountValue.tolist()))
+            },
+            "total": dict(zip(InventoryValuation.amountFields, totalValue.tolist()))
+        }
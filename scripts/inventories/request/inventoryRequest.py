@@ -22,41 +22,61 @@
 """
 
 import os
+import copy
+import zipfile
 import datetime
+import threading
+
+from io import BytesIO
 
 from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from dependency import Dependency
+from executor import Executor
 from excel import Excel
 from database import Database
 from utility import Utility
+from inventories.master.inventoryMaster import InventoryMaster
 
 
 class InventoryRequest():
-    def writeRaw(currentDate):
+    rawHeaderValue = ["No.", "Peminta", "Kategori", "Barang", "Jumlah", "Satuan", "Keterangan", "Dibuat", "Direspon", "Status"]
+
+    rawStyle = {
+        "header": Excel.row_style({
+            "A:J": {"font": {"size": 12, "bold": True}, "alignment": {"vertical": "center", "horizontal": "center"}, "border": {"side": "all", "style": "thin"}}
+        }),
+        "main": Excel.row_style({
+            "A:J": {"border": {"side": "all", "style": "thin"}, "alignment": {"vertical": "center", "horizontal": "center"}},
+            "B:D": {"alignment": {"vertical": "center", "horizontal": "left"}},
+            "G:I": {"alignment": {"vertical": "center", "horizontal": "left"}}
+        })
+    }
+
+    def writeRaw(currentDate, inventoryRequestDocument = None, inventoryMasterDocument = None):
         filePath = f"../{Dependency.inventoryRequestFolderPath}/Mentah {currentDate}.xlsx"
 
-        Excel.create_file(filePath)
-        workbook = Excel(filePath)
+        workbook = Excel.stream(filePath, backend = Dependency.excelBackend)
         workbook.change_sheet_name("Sheet", "Seluruh")
         workbook.set_zoom(85)
 
-        requestCollection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryRequest)
-        inventoryRequestDocument = requestCollection.find_one({"tahun": 2022})
+        if(inventoryRequestDocument == None):
+            inventoryRequestDocument = InventoryRequest.getRequestDocument()
 
-        masterCollection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryMaster)
-        inventoryMasterDocument = masterCollection.find_one({"tahun": 2022})
+        if(inventoryMasterDocument == None):
+            inventoryMasterDocument = InventoryMaster.getMasterDocument()
 
         userData = Utility.readJSON("./json/request_user_data.json")
 
-        InventoryRequest.writeHeaderRaw(workbook)
-        InventoryRequest.writeMainRaw(workbook, inventoryRequestDocument, inventoryMasterDocument)
+        # Every request shows up on "Seluruh", its user sheet and its date sheet, so its row is joined once and shared
+        rawRows = {}
+
+        InventoryRequest.writeSheetRaw(workbook, inventoryRequestDocument, inventoryMasterDocument, rawRows)
 
         for userObject in userData:
-            workbook.create_sheet(userObject.get("username"))
-            workbook.change_sheet(userObject.get("username"))
+            workbook.change_sheet(workbook.create_sheet(userObject.get("username")))
             workbook.set_zoom(85)
 
             requestData = { "barang": [] }
@@ -66,86 +86,187 @@ class InventoryRequest():
                     requestData.get("barang").append(requestObject)
 
 
-            InventoryRequest.writeHeaderRaw(workbook)
-            InventoryRequest.writeMainRaw(workbook, requestData, inventoryMasterDocument)
+            InventoryRequest.writeSheetRaw(workbook, requestData, inventoryMasterDocument, rawRows)
 
             for dateObject in userObject.get("date"):
                 dateName = f'{userObject.get("username")} {"".join(dateObject.get("date").split("-"))}'
-                workbook.create_sheet(dateName)
-                workbook.change_sheet(dateName)
+                workbook.change_sheet(workbook.create_sheet(dateName))
                 workbook.set_zoom(85)
 
-                InventoryRequest.writeHeaderRaw(workbook)
-                InventoryRequest.writeMainRaw(workbook, { "barang": dateObject.get("request") }, inventoryMasterDocument)
+                InventoryRequest.writeSheetRaw(workbook, { "barang": dateObject.get("request") }, inventoryMasterDocument, rawRows)
                     
 
         workbook.save()
 
 
+    def writeSheetRaw(workbook, requestData, masterData, rawRows = None):
+        mainValue = InventoryRequest.getMainRawValue(requestData, masterData, rawRows)
+
+        workbook.fit_width("A1", ["J", len(mainValue) + 1], [InventoryRequest.rawHeaderValue] + mainValue, extra_width = 2)
+
+        InventoryRequest.writeHeaderRaw(workbook)
+        InventoryRequest.writeMainRaw(workbook, mainValue)
+
+
     def writeHeaderRaw(workbook):
-        workbook.write_value_multiple("A1", "J1", ["No.", "Peminta", "Kategori", "Barang", "Jumlah", "Satuan", "Keterangan", "Dibuat", "Direspon", "Status"])
-        workbook.font_multiple("A1", "J1", size = 12, bold = True)
-        workbook.alignment_multiple("A1", "J1", vertical = "center", horizontal = "center")
-        workbook.border_multiple("A1", "J1", "all", style = "thin")
+        workbook.append_rows([InventoryRequest.rawHeaderValue], InventoryRequest.rawStyle["header"])
 
-    
-    def writeMainRaw(workbook, requestData, masterData):
-        rowCount = 2
+
+    rawRequestFields = ["username", "kategori_id", "barang_id", "total", "deskripsi", "created_at", "responded_at", "status"]
+
+    def getMainRawValue(requestData, masterData, rawRows = None):
+        if(rawRows == None):
+            rawRows = {}
+
+        masterIndex = InventoryMaster.getMasterIndex(masterData)
+
+        mainValue = []
         for requestItemIndex, requestItemObject in enumerate(requestData.get("barang")):
-            for masterCategoryObject in masterData.get("kategori"):
-                if(requestItemObject.get("kategori_id") == masterCategoryObject.get("id")):
-                    for masterItemObject in masterCategoryObject.get("barang"):
-                        if(requestItemObject.get("barang_id") == masterItemObject.get("id")):
-                            status = Utility.convertStatus(requestItemObject.get("status"))
-
-                            mainValue = [
-                                requestItemIndex + 1,
-                                requestItemObject.get("username"),
-                                masterCategoryObject.get("kategori"),
-                                masterItemObject.get("nama"),
-                                requestItemObject.get("total"),
-                                masterItemObject.get("satuan"),
-                                requestItemObject.get("deskripsi"),
-                                requestItemObject.get("created_at"),
-                                requestItemObject.get("responded_at"),
-                                status
-                            ]
-            
-                            workbook.write_value_multiple(["A", rowCount], ["J", rowCount], mainValue)
-                            workbook.border_multiple(["A", rowCount], ["J", rowCount], "all", style="thin")
-                            workbook.alignment_multiple(["A", rowCount], ["J", rowCount], vertical="center", horizontal="center")
+            # Keyed by every field the row reads, since user sheets come from request_user_data.json rather than the document
+            rawKey = tuple(requestItemObject.get(field) for field in InventoryRequest.rawRequestFields)
+
+            if(rawKey not in rawRows):
+                rawRows[rawKey] = InventoryRequest.getRawRow(requestItemObject, masterIndex)
+
+            rawRow = rawRows[rawKey]
+            if(rawRow != None):
+                mainValue.append([requestItemIndex + 1, *rawRow])
+
+        return mainValue
+
+
+    def getRawRow(requestItemObject, masterIndex):
+        masterCategoryObject = masterIndex["kategori"].get(requestItemObject.get("kategori_id"))
+        masterItemObject = masterIndex["barang"].get((requestItemObject.get("kategori_id"), requestItemObject.get("barang_id")))
+
+        if(masterCategoryObject == None or masterItemObject == None):
+            return None
+
+        return [
+            requestItemObject.get("username"),
+            masterCategoryObject.get("kategori"),
+            masterItemObject.get("nama"),
+            requestItemObject.get("total"),
+            masterItemObject.get("satuan"),
+            requestItemObject.get("deskripsi"),
+            requestItemObject.get("created_at"),
+            requestItemObject.get("responded_at"),
+            Utility.convertStatus(requestItemObject.get("status"))
+        ]
+
+    
+    def writeMainRaw(workbook, mainValue):
+        workbook.append_rows(mainValue, InventoryRequest.rawStyle["main"])
+
+
+    def writeFilter(currentDate, inventoryRequestDocument, inventoryMasterDocument = None):
+        filePath = f"../{Dependency.inventoryRequestFolderPath}/Filter {currentDate}.xlsx"
+
+        workbook = Excel.stream(filePath, backend = Dependency.excelBackend)
+        workbook.change_sheet_name("Sheet", "Filter")
+        workbook.set_zoom(85)
+
+        if(inventoryMasterDocument == None):
+            inventoryMasterDocument = InventoryMaster.getMasterDocument()
 
-                            workbook.alignment_multiple(["B", rowCount], ["D", rowCount], vertical="center", horizontal="left")
-                            workbook.alignment_multiple(["G", rowCount], ["I", rowCount], vertical="center", horizontal="left")
+        InventoryRequest.writeSheetRaw(workbook, inventoryRequestDocument, inventoryMasterDocument)
 
-                            rowCount += 1
+        workbook.save()
+
+
+    userTemplatePath = "./media/User Request Template.docx"
+    userTemplate = None
+
+    def writeUser(userId, dateId, inventoryMasterDocument = None):
+        if(inventoryMasterDocument == None):
+            inventoryMasterDocument = InventoryMaster.getMasterDocument()
+
+        optionData = Utility.readJSON("./json/request_option_data.json")
+        userData = Utility.readJSON("./json/request_user_data.json")
+
+        userOption = {userObject.get("id"): userObject for userObject in optionData}[userId]
+        dateOption = {dateObject.get("id"): dateObject for dateObject in userOption.get("date")}[dateId]
 
+        usernameValue = userOption.get("name")
+        dateValue = dateOption.get("date")
 
-        workbook.adjust_width("A1", ["J", rowCount], extra_width=2)
+        requestArray = InventoryRequest.getUserIndex(userData).get((usernameValue, dateValue.split(" ")[0]), [])
+        userValue = InventoryRequest.getUserValue(requestArray, InventoryMaster.getMasterIndex(inventoryMasterDocument))
 
+        document = InventoryRequest.renderUser([usernameValue, dateValue, userValue])
+        document.save(f"../{Dependency.inventoryRequestFolderPath}/{InventoryRequest.getUserFileName(usernameValue, dateValue)}")
 
-    def writeUser(userId, dateId):
-        masterCollection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryMaster)
-        inventoryMasterDocument = masterCollection.find_one({"tahun": 2022})
+
+    def writeUserAll(currentDate, inventoryMasterDocument = None):
+        if(inventoryMasterDocument == None):
+            inventoryMasterDocument = InventoryMaster.getMasterDocument()
 
         optionData = Utility.readJSON("./json/request_option_data.json")
         userData = Utility.readJSON("./json/request_user_data.json")
 
-        for userObject in optionData:
-            if(userObject.get("id") == userId):
-                usernameValue = userObject.get("name")
+        userIndex = InventoryRequest.getUserIndex(userData)
+        masterIndex = InventoryMaster.getMasterIndex(inventoryMasterDocument)
 
+        renderArray = []
+        for userObject in optionData:
+            # The first option is the raw export, every other one is a user with its request dates
+            if(userObject.get("id") != 1):
                 for dateObject in userObject.get("date"):
-                    if(dateObject.get("id") == dateId):
-                        dateValue = dateObject.get("date")
+                    usernameValue = userObject.get("name")
+                    dateValue = dateObject.get("date")
 
+                    requestArray = userIndex.get((usernameValue, dateValue.split(" ")[0]), [])
+                    renderArray.append([usernameValue, dateValue, InventoryRequest.getUserValue(requestArray, masterIndex)])
+
+
+        filePath = f"../{Dependency.inventoryRequestFolderPath}/Pengguna {currentDate}.zip"
+
+        # The shared pool workers outlive the request, so each parses the template on its first document and only clones it afterwards
+        with zipfile.ZipFile(filePath, "w", zipfile.ZIP_DEFLATED) as archive:
+            for renderItem, documentBytes in zip(renderArray, Executor.getProcessExecutor().map(InventoryRequest.renderUserBytes, renderArray, chunksize = 8)):
+                archive.writestr(InventoryRequest.getUserFileName(renderItem[0], renderItem[1]), documentBytes)
 
-        splittedDate = Utility.slugifyDate(dateValue).split("-")
 
-        fileTemplate = "./media/User Request Template.docx"
-        filePath = f"../{Dependency.inventoryRequestFolderPath}/{usernameValue} {Utility.slugifyDate(dateValue)}.docx"
+    def getUserFileName(usernameValue, dateValue):
+        return f"{usernameValue} {Utility.slugifyDate(dateValue)}.docx"
 
-        document = Document(fileTemplate)
+
+    def getUserIndex(userData):
+        return {(userObject.get("username"), dateObject.get("date")): dateObject.get("request") for userObject in userData for dateObject in userObject.get("date")}
+
+
+    def getUserValue(requestArray, masterIndex):
+        userValue = []
+        for requestIndex, requestObject in enumerate(requestArray):
+            itemObject = masterIndex["barang"].get((requestObject.get("kategori_id"), requestObject.get("barang_id")))
+            if(itemObject != None):
+                itemName = itemObject.get("nama")
+                itemUnit = itemObject.get("satuan")
+
+            userValue.append([
+                requestIndex + 1,
+                itemName,
+                requestObject.get("total"),
+                itemUnit,
+                requestObject.get("deskripsi")
+            ])
+
+        return userValue
+
+
+    def getUserTemplate():
+        if(InventoryRequest.userTemplate == None):
+            InventoryRequest.userTemplate = Document(InventoryRequest.userTemplatePath)
+
+        return InventoryRequest.userTemplate
+
+
+    def renderUser(renderItem):
+        usernameValue, dateValue, userValue = renderItem
+
+        splittedDate = Utility.slugifyDate(dateValue).split("-")
+
+        document = copy.deepcopy(InventoryRequest.getUserTemplate())
 
         for paragraph in document.paragraphs:
             if("Balikpapan" in paragraph.text):
@@ -154,115 +275,225 @@ class InventoryRequest():
         
         document.paragraphs[len(document.paragraphs) - 2].add_run(f"{' ' * 90} {usernameValue}")
 
-        for userObject in userData:
-            if(userObject.get("username") == usernameValue):
-                for dateObject in userObject.get("date"):
-                    if(dateObject.get("date") == dateValue.split(" ")[0]):
+        table = document.tables[0]
+        for _ in range(len(userValue) - (len(table.rows) - 1)):
+            table.add_row()
 
-                        requestCount = 0
-                        for requestIndex, requestObject in enumerate(dateObject.get("request")):
-                            requestCount += 1
+        tableRows = table.rows
+        for rowIndex, value in enumerate(userValue, 1):
+            # Row.cells rebuilds the cell grid on every access, so it is read once per row
+            rowCells = tableRows[rowIndex].cells
 
+            for i in range(len(value)):
+                rowCells[i].text = str(value[i])
 
-                        while requestCount > len(document.tables[0].rows) - 1:
-                            document.tables[0].add_row()
+                for paragraph in rowCells[i].paragraphs:
+                    for run in paragraph.runs:
+                        run.font.size = Pt(10)
 
-                        rowCount = 1
-                        for requestIndex, requestObject in enumerate(dateObject.get("request")):
-                            for categoryObject in inventoryMasterDocument.get("kategori"):
-                                if(categoryObject.get("id") == requestObject.get("kategori_id")):
-                                    for itemObject in categoryObject.get("barang"):
-                                        if(itemObject.get("id") == requestObject.get("barang_id")):
-                                            itemName = itemObject.get("nama")
-                                            itemUnit = itemObject.get("satuan")
 
+            cellCenterList = [0, 2, 3]
+            for cell in cellCenterList:
+                for paragraph in rowCells[cell].paragraphs:
+                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-                            row = document.tables[0].rows[rowCount]
 
-                            value = [
-                                requestIndex + 1,
-                                itemName,
-                                requestObject.get("total"),
-                                itemUnit,
-                                requestObject.get("deskripsi")
-                            ]
+        return document
 
-                            for i in range(len(value)):
-                                row.cells[i].text = str(value[i])
-      
-                                for paragraph in row.cells[i].paragraphs:
-                                    for run in paragraph.runs:
-                                        run.font.size = Pt(10)
-                            
-                            
-                            cellCenterList = [0, 2, 3]
-                            for cell in cellCenterList:
-                                for paragraph in row.cells[cell].paragraphs:
-                                    paragraph.alignment= WD_ALIGN_PARAGRAPH.CENTER
 
+    def renderUserBytes(renderItem):
+        documentBuffer = BytesIO()
+        InventoryRequest.renderUser(renderItem).save(documentBuffer)
 
-                            rowCount += 1
+        return documentBuffer.getvalue()
 
 
-        document.save(filePath)
+    def getRequestDocument():
+        requestCollection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryRequest)
+        inventoryRequestDocument = requestCollection.find_one({"tahun": 2022})
+
+        return inventoryRequestDocument
+
+
+    async def getRequestDocumentAsync():
+        requestCollection = Database.getAsyncCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryRequest)
+        inventoryRequestDocument = await requestCollection.find_one({"tahun": 2022})
+
+        return inventoryRequestDocument
+
+
+    def getFilterPipeline(usernameArray = None, startDate = None, endDate = None, statusArray = None):
+        conditionArray = []
+        if(usernameArray):
+            conditionArray.append({"$in": ["$$barang.username", usernameArray]})
+
+        # created_at is stored as "YYYY-MM-DD HH:MM:SS", so the range is compared as strings up to the day after the end date
+        for date, operator, dayOffset in [[startDate, "$gte", 0], [endDate, "$lt", 1]]:
+            if(date != None):
+                try:
+                    boundDate = datetime.datetime.strptime(date, "%Y-%m-%d") + datetime.timedelta(days = dayOffset)
+
+                except ValueError:
+                    raise TypeError("Filter date must be a string with the YYYY-MM-DD format")
+
+                conditionArray.append({operator: ["$$barang.created_at", boundDate.strftime("%Y-%m-%d")]})
+
+        if(statusArray):
+            conditionArray.append({"$in": ["$$barang.status", statusArray]})
+
+        return [
+            {"$match": {"tahun": 2022}},
+            {"$project": {
+                "_id": False,
+                "barang": {"$filter": {"input": "$barang", "as": "barang", "cond": {"$and": conditionArray}}}
+            }}
+        ]
 
 
-    def updateUserData():
+    def getFilterDocument(usernameArray = None, startDate = None, endDate = None, statusArray = None):
         requestCollection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryRequest)
-        inventoryRequestDocument = requestCollection.find_one({"tahun": 2022})
 
-        usernameArray = []
-        for requestMain in inventoryRequestDocument.get("barang"):
-            if(requestMain.get("status") == 1):
-                if(requestMain.get("username") not in usernameArray):
-                    usernameArray.append(requestMain.get("username"))
+        return next(requestCollection.aggregate(InventoryRequest.getFilterPipeline(usernameArray, startDate, endDate, statusArray)), None)
 
 
-        userData = []
-        for usernameIndex, usernameItem in enumerate(usernameArray):
-            newUserObject = {
-                "id": usernameIndex + 1,
-                "username": usernameItem,
-                "date": []
-            }
+    async def getFilterDocumentAsync(usernameArray = None, startDate = None, endDate = None, statusArray = None):
+        requestCollection = Database.getAsyncCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryRequest)
 
-            userData.append(newUserObject)
+        requestFilterCursor = await requestCollection.aggregate(InventoryRequest.getFilterPipeline(usernameArray, startDate, endDate, statusArray))
+        requestFilterArray = await requestFilterCursor.to_list(1)
 
+        return requestFilterArray[0] if requestFilterArray else None
 
-        for userObject in userData:
-            dateArray = []
-            for requestMain in inventoryRequestDocument.get("barang"):
-                if(requestMain.get("status") == 1):
-                    if(requestMain.get("username") == userObject.get("username")):
-                        createdAt = (requestMain.get("created_at").split(" "))[0]
-                        
-                        if(createdAt not in dateArray):
-                            dateArray.append(createdAt)
 
+    # Accepted requests behind the last written user data by id, kept to merge later changes into
+    acceptedRequests = None
+    userDataLock = threading.Lock()
+
+    def updateUserData(inventoryRequestDocument = None):
+        if(inventoryRequestDocument == None):
+            inventoryRequestDocument = InventoryRequest.getRequestDocument()
+
+        with InventoryRequest.userDataLock:
+            acceptedRequestArray = [requestMain for requestMain in inventoryRequestDocument.get("barang") if requestMain.get("status") == 1]
+
+            Utility.writeJSON("./json/request_user_data.json", InventoryRequest.groupUserData(acceptedRequestArray))
+            InventoryRequest.acceptedRequests = {requestMain.get("id"): requestMain for requestMain in acceptedRequestArray}
+
+
+    def updateUserDataIncremental(requestChangeDocument = None):
+        if(InventoryRequest.acceptedRequests == None):
+            return InventoryRequest.updateUserData()
+
+        if(requestChangeDocument == None):
+            requestChangeDocument = InventoryRequest.getRequestChangeDocument()
+
+        # The aggregation has nothing to return without a request document, so the full rebuild decides what the user data is
+        if(requestChangeDocument == None):
+            return InventoryRequest.updateUserData()
+
+        with InventoryRequest.userDataLock:
+            changedRequests = {}
+            for requestMain in requestChangeDocument.get("barang"):
+                acceptedRequest = InventoryRequest.acceptedRequests.get(requestMain.get("id"))
+
+                if(acceptedRequest == None or {key: value for key, value in acceptedRequest.items() if key != "internal_id"} != requestMain):
+                    changedRequests[requestMain.get("id")] = requestMain
 
-            for dateIndex, dateItem in enumerate(dateArray):
+
+            # A cancelled request goes back to status 0 without a timestamp, so only a full rebuild can drop it
+            newRequestCount = len([requestId for requestId in changedRequests if requestId not in InventoryRequest.acceptedRequests])
+            isComplete = len(InventoryRequest.acceptedRequests) + newRequestCount == requestChangeDocument.get("accepted")
+
+            if(isComplete and changedRequests):
+                acceptedRequests = {**InventoryRequest.acceptedRequests, **changedRequests}
+
+                # Requests are only ever appended with the next id, so the id order is the document order a full rebuild walks
+                acceptedRequestArray = sorted(acceptedRequests.values(), key = lambda requestMain: requestMain.get("id"))
+
+                Utility.writeJSON("./json/request_user_data.json", InventoryRequest.groupUserData(acceptedRequestArray))
+                InventoryRequest.acceptedRequests = acceptedRequests
+
+
+        if(not isComplete):
+            InventoryRequest.updateUserData()
+
+
+    def groupUserData(acceptedRequestArray):
+        # Users, their dates and the requests of each date keep the order in which they first appear in the document
+        userData = []
+        userIndex = {}
+        for requestMain in acceptedRequestArray:
+            username = requestMain.get("username")
+            createdAt = (requestMain.get("created_at").split(" "))[0]
+
+            if(username not in userIndex):
+                newUserObject = {
+                    "id": len(userData) + 1,
+                    "username": username,
+                    "date": []
+                }
+
+                userData.append(newUserObject)
+                userIndex[username] = [newUserObject, {}]
+
+            userObject, dateIndex = userIndex[username]
+
+            if(createdAt not in dateIndex):
                 newDateObject = {
-                    "id": dateIndex + 1,
-                    "date": dateItem,
+                    "id": len(userObject.get("date")) + 1,
+                    "date": createdAt,
                     "request": []
                 }
 
                 userObject.get("date").append(newDateObject)
+                dateIndex[createdAt] = newDateObject
 
-        
-        for requestMain in inventoryRequestDocument.get("barang"):
-            if(requestMain.get("status") == 1):
-                for userObject in userData:
-                    if(requestMain.get("username") == userObject.get("username")):
-                        for dateObject in userObject.get("date"):
-                            if((requestMain.get("created_at").split(" "))[0]) == dateObject.get("date"):
-                                newRequestObject = requestMain
-                                newRequestObject["internal_id"] = len(dateObject.get("request")) + 1
+            dateObject = dateIndex[createdAt]
+
+            newRequestObject = requestMain
+            newRequestObject["internal_id"] = len(dateObject.get("request")) + 1
+
+            dateObject.get("request").append(newRequestObject)
+
+
+        return userData
+
+
+    def getRequestWatermark():
+        if(not InventoryRequest.acceptedRequests):
+            return None
+
+        return max(requestMain.get("responded_at") or "" for requestMain in InventoryRequest.acceptedRequests.values())
+
+
+    def getRequestChangePipeline(watermark):
+        # The newest accepted request is sent again as well, so a request responded in the same second is not missed
+        return [
+            {"$match": {"tahun": 2022}},
+            {"$project": {
+                "_id": False,
+                "accepted": {"$size": {"$filter": {"input": "$barang", "as": "barang", "cond": {"$eq": ["$$barang.status", 1]}}}},
+                "barang": {"$filter": {"input": "$barang", "as": "barang", "cond": {"$and": [{"$eq": ["$$barang.status", 1]}, {"$gte": ["$$barang.responded_at", watermark]}]}}}
+            }}
+        ]
+
+
+    def getRequestChangeDocument():
+        requestCollection = Database.getCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryRequest)
+
+        return next(requestCollection.aggregate(InventoryRequest.getRequestChangePipeline(InventoryRequest.getRequestWatermark())), None)
+
+
+    async def getRequestChangeDocumentAsync():
+        if(InventoryRequest.acceptedRequests == None):
+            return None
 
-                                dateObject.get("request").append(newRequestObject)
+        requestCollection = Database.getAsyncCollection(Dependency.mongoDBURI, Dependency.databaseInventory, Dependency.collectionInventoryRequest)
 
+        requestChangeCursor = await requestCollection.aggregate(InventoryRequest.getRequestChangePipeline(InventoryRequest.getRequestWatermark()))
+        requestChangeArray = await requestChangeCursor.to_list(1)
 
-        Utility.writeJSON("./json/request_user_data.json", userData) 
+        return requestChangeArray[0] if requestChangeArray else None
 
 
     def updateOptionData():
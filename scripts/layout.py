@@ -0,0 +1,196 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The Layout file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+import hashlib
+import json
+
+from excel import Excel, Style
+
+class Layout():
+    style_attributes = ["font", "fill", "border", "alignment", "number_format"]
+
+
+    def __init__(self, layout_spec: dict):
+        self.version = hashlib.sha256(json.dumps(layout_spec, sort_keys = True, default = str).encode()).hexdigest()
+        self.title = layout_spec.get("title")
+        self.zoom = layout_spec.get("zoom")
+        self.widths = [[column, width] for column, width in layout_spec.get("width", {}).items()]
+        self.heights = [[row, height] for row, height in layout_spec.get("height", {}).items()]
+        self.columns = [Layout.compile_columns(column_spec) for column_spec in layout_spec.get("columns", [])]
+
+        self.header = [Layout.compile_cell(cell_spec) for cell_spec in layout_spec.get("header", [])]
+        self.overlay = [Layout.compile_cell(cell_spec) for cell_spec in layout_spec.get("overlay", [])]
+        self.footer = [Layout.compile_cell(cell_spec) for cell_spec in layout_spec.get("footer", [])]
+
+        body_spec = layout_spec.get("body", {})
+        self.body_row = body_spec.get("row", 1)
+        self.body_height = body_spec.get("height")
+        self.body = {row_type: Layout.compile_row(row_spec) for row_type, row_spec in body_spec.get("rows", {}).items()}
+
+
+    def compile(layout_spec: dict):
+        return Layout(layout_spec)
+
+
+    def convert_range(range: any):
+        if(type(range) == str and ":" in range):
+            start_range, end_range = range.split(":")
+
+        else:
+            start_range, end_range = range, range
+
+        start_column, start_row = Excel.convert_range(start_range)
+        end_column, end_row = Excel.convert_range(end_range)
+
+        return start_column, start_row, end_column, end_row
+
+
+    def compile_value(cell_spec: dict, value: any):
+        if("field" in cell_spec):
+            return ["field", cell_spec.get("field"), cell_spec.get("upper", False)]
+
+        elif(type(value) == str and "{" in value):
+            return ["format", value, cell_spec.get("upper", False)]
+
+        return ["value", value, cell_spec.get("upper", False)]
+
+
+    def compile_cell(cell_spec: dict):
+        start_column, start_row, end_column, end_row = Layout.convert_range(cell_spec.get("range"))
+
+        cells = []
+        if("value" in cell_spec or "field" in cell_spec):
+            value = cell_spec.get("value")
+
+            if(type(value) == list):
+                positions = [[row, column] for row in range(start_row, end_row + 1) for column in range(start_column, end_column + 1)]
+
+                if(len(positions) != len(value)):
+                    raise TypeError("Value list length must match the range size")
+
+                cells = [[row, column, Layout.compile_value(cell_spec, cell_value)] for (row, column), cell_value in zip(positions, value)]
+
+            else:
+                cells = [[start_row, start_column, Layout.compile_value(cell_spec, value)]]
+
+        cell_style = Style.resolve(**{attribute: cell_spec.get(attribute) for attribute in Layout.style_attributes if attribute in cell_spec})
+
+        merge = None
+        if("merge" in cell_spec):
+            merge_column, merge_row = Excel.convert_range(cell_spec.get("merge"))
+            merge = [merge_row, merge_column]
+
+        image = None
+        if("image" in cell_spec):
+            image = [cell_spec.get("image"), tuple(cell_spec.get("size"))]
+
+        return [cells, [start_row, start_column, end_row, end_column], cell_style, merge, image]
+
+
+    def compile_row(row_spec: dict):
+        merges = []
+        for merge_range in row_spec.get("merge", []):
+            start_column, end_column = merge_range.split(":")
+            merges.append([Excel.check_and_convert_string_value(start_column), Excel.check_and_convert_string_value(end_column)])
+
+        return [Excel.row_style(row_spec.get("style", {})), merges]
+
+
+    def compile_columns(column_spec: dict):
+        start_column, end_column = column_spec.get("range").split(":")
+        cell_style = Style.resolve(**{attribute: column_spec.get(attribute) for attribute in Layout.style_attributes if attribute in column_spec})
+
+        return [start_column, end_column, cell_style]
+
+
+    def value(template: list, context: dict):
+        kind, value, upper = template
+
+        if(kind == "field"):
+            value = context.get(value)
+
+        elif(kind == "format"):
+            value = value.format_map(context)
+
+        if(upper and type(value) == str):
+            value = value.upper()
+
+        return value
+
+
+    def write_cells(self, workbook: Excel, compiled_cells: list, context: dict, row_offset: int, image: any):
+        for cells, (start_row, start_column, end_row, end_column), cell_style, merge, image_spec in compiled_cells:
+            for row, column, template in cells:
+                workbook.write_cell(row + row_offset, column, Layout.value(template, context))
+
+            if(cell_style):
+                workbook.style_range([start_column, start_row + row_offset], [end_column, end_row + row_offset], **cell_style)
+
+            if(merge != None):
+                workbook.merge([start_column, start_row + row_offset], [merge[1], merge[0] + row_offset])
+
+            if(image_spec != None and image != None):
+                field, size = image_spec
+                workbook.add_image(image(context.get(field), size), [start_column, start_row + row_offset])
+
+
+    def write_body(self, workbook: Excel, groups: list):
+        row = self.body_row
+        for row_type, rows in groups:
+            row_style, merges = self.body.get(row_type)
+            workbook.append_rows(rows, row_style)
+
+            for start_column, end_column in merges:
+                for index in range(len(rows)):
+                    workbook.merge([start_column, row + index], [end_column, row + index])
+
+            row += len(rows)
+
+        return row - 1
+
+
+    def write(self, workbook: Excel, context: dict, groups: list, image: any = None):
+        if(self.title != None):
+            workbook.change_sheet_name(workbook.active_sheet.title, self.title.format_map(context))
+
+        if(self.zoom != None):
+            workbook.set_zoom(self.zoom)
+
+        self.write_cells(workbook, self.header, context, 0, image)
+        body_end = self.write_body(workbook, groups)
+        self.write_cells(workbook, self.overlay, context, 0, image)
+        self.write_cells(workbook, self.footer, context, body_end, image)
+
+        for column, width in self.widths:
+            workbook.set_width(column, width)
+
+        for row, height in self.heights:
+            workbook.set_height(row, height)
+
+        if(self.body_height != None):
+            # The spacer row between the body and the footer keeps the body height as well
+            for row in range(self.body_row, body_end + 2):
+                workbook.set_height(row, self.body_height)
+
+        for start_column, end_column, cell_style in self.columns:
+            workbook.style_columns(start_column, end_column, **cell_style)
@@ -0,0 +1,170 @@
+"""
+ # administrare - web platform for internal data management
+ # Copyright (C) 2022 astrantialabs
+ #
+ # This program is free software: you can redistribute it and/or modify
+ # it under the terms of the GNU General Public License as published by
+ # the Free Software Foundation, either version 3 of the License, or
+ # (at your option) any later version.
+ #
+ # This program is distributed in the hope that it will be useful,
+ # but WITHOUT ANY WARRANTY; without even the implied warranty of
+ # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ # GNU General Public License for more details.
+ #
+ # You should have received a copy of the GNU General Public License
+ # along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+ # @fileoverview The Report Cache file.
+ # @author Rizky Irswanda <rizky.irswanda115@gmail.com>
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from collections import OrderedDict
+
+import bson
+
+from dependency import Dependency
+
+class ReportCache():
+    enabled = Dependency.reportCacheEnabled
+    entries = OrderedDict()
+    size = 0
+    hits = 0
+    misses = 0
+    loaded = False
+    lock = threading.Lock()
+
+    digests = OrderedDict()
+    digest_limit = 8
+
+    def folder_path():
+        return f"../{Dependency.reportCacheFolderPath}"
+
+
+    def load():
+        folder_path = ReportCache.folder_path()
+        os.makedirs(folder_path, exist_ok = True)
+
+        # The modification time is refreshed on every hit, so it keeps the LRU order across restarts
+        file_array = []
+        for file_name in os.listdir(folder_path):
+            if(file_name.endswith(".tmp") or file_name.startswith(".")):
+                continue
+
+            file_stat = os.stat(os.path.join(folder_path, file_name))
+            file_array.append([file_stat.st_mtime, os.path.splitext(file_name)[0], os.path.join(folder_path, file_name), file_stat.st_size])
+
+        for _, key, path, size in sorted(file_array):
+            ReportCache.entries[key] = [path, size]
+            ReportCache.size += size
+
+        ReportCache.loaded = True
+
+
+    def digest(value: any):
+        # Cached documents are shared and never modified, so the digest of the same object can be reused
+        cached_digest = ReportCache.digests.get(id(value))
+        if(cached_digest != None and cached_digest[0] is value):
+            return cached_digest[1]
+
+        if(isinstance(value, dict)):
+            value_digest = hashlib.sha256(bson.encode(value)).hexdigest()
+
+        else:
+            value_digest = hashlib.sha256(json.dumps(value, sort_keys = True, default = str).encode()).hexdigest()
+
+        ReportCache.digests[id(value)] = [value, value_digest]
+        if(len(ReportCache.digests) > ReportCache.digest_limit):
+            ReportCache.digests.popitem(last = False)
+
+        return value_digest
+
+
+    def key(report_type: str, layout_version: any, *inputs: any):
+        key_value = [report_type, str(layout_version), Dependency.excelBackend] + [ReportCache.digest(value) for value in inputs]
+
+        return hashlib.sha256("|".join(key_value).encode()).hexdigest()
+
+
+    def replace(source_path: str, target_path: str):
+        temporary_path = os.path.join(ReportCache.folder_path(), f".{os.path.basename(target_path)}.{threading.get_ident()}.tmp")
+
+        try:
+            os.link(source_path, temporary_path)
+
+        except OSError:
+            shutil.copyfile(source_path, temporary_path)
+
+        os.replace(temporary_path, target_path)
+
+
+    def restore(key: str, file_path: str):
+        if(not ReportCache.enabled):
+            return False
+
+        with ReportCache.lock:
+            if(not ReportCache.loaded):
+                ReportCache.load()
+
+            entry = ReportCache.entries.get(key)
+            if(entry != None and not os.path.exists(entry[0])):
+                ReportCache.entries.pop(key)
+                ReportCache.size -= entry[1]
+                entry = None
+
+            if(entry != None):
+                ReportCache.replace(entry[0], file_path)
+                os.utime(entry[0])
+
+                ReportCache.entries.move_to_end(key)
+                ReportCache.hits += 1
+
+                return True
+
+            ReportCache.misses += 1
+
+        # A report file may still be linked to a cached file, so it is unlinked instead of being overwritten in place
+        if(os.path.exists(file_path)):
+            os.remove(file_path)
+
+        return False
+
+
+    def store(key: str, file_path: str):
+        if(not ReportCache.enabled):
+            return
+
+        with ReportCache.lock:
+            if(not ReportCache.loaded):
+                ReportCache.load()
+
+            cache_path = os.path.join(ReportCache.folder_path(), f"{key}{os.path.splitext(file_path)[1]}")
+            ReportCache.replace(file_path, cache_path)
+
+            previous_entry = ReportCache.entries.pop(key, None)
+            if(previous_entry != None):
+                ReportCache.size -= previous_entry[1]
+
+            cache_size = os.path.getsize(cache_path)
+            ReportCache.entries[key] = [cache_path, cache_size]
+            ReportCache.size += cache_size
+
+            while(ReportCache.size > Dependency.reportCacheMaxSize and len(ReportCache.entries) > 1):
+                _, (evicted_path, evicted_size) = ReportCache.entries.popitem(last = False)
+                ReportCache.size -= evicted_size
+
+                if(os.path.exists(evicted_path)):
+                    os.remove(evicted_path)
+
+
+    def statistics():
+        with ReportCache.lock:
+            return {"hits": ReportCache.hits, "misses": ReportCache.misses, "entries": len(ReportCache.entries), "size": ReportCache.size}
@@ -50,6 +50,8 @@ class Test:
 
         #             InventoryRequest.writeUser(userId, dateId)
 
+        # InventoryRequest.writeUserAll(Utility.currentDate())
+
 
         # InventoryDemand.writeRaw(Utility.currentDate())
         InventoryDemand.updateOptionData()
@@ -24,6 +24,8 @@
 import datetime
 import json
 import calendar
+import os
+import tempfile
 
 class Utility():
     def romanNumeral(number):
@@ -106,6 +108,23 @@ class Utility():
 
     
     def writeJSON(path, data):
-        with open(path, "w") as outfile:
-            outfile.write(json.dumps(data, indent = 4))
+        content = json.dumps(data, indent = 4)
+
+        if(os.path.exists(path)):
+            with open(path) as infile:
+                if(infile.read() == content):
+                    return
+
+        # The file is replaced in one step, so a reader never sees a half written file
+        fileDescriptor, temporaryPath = tempfile.mkstemp(dir = os.path.dirname(path) or ".", suffix = ".tmp")
+        try:
+            with os.fdopen(fileDescriptor, "w") as outfile:
+                outfile.write(content)
+
+            os.chmod(temporaryPath, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+            os.replace(temporaryPath, path)
+
+        except:
+            os.remove(temporaryPath)
+            raise
 
@@ -221,6 +221,7 @@ export class MasterInventoryService {
                             );
                         } else if (status == 2) {
                             master_item_object.jumlah_permintaan -= total;
+                            master_item_object.updated_at = currentDate();
                         }
                     }
                 });
@@ -1366,11 +1367,9 @@ export class MasterInventoryService {
     @Cron(CronExpression.EVERY_DAY_AT_MIDNIGHT)
     public async masterScheduledDownload() {
         const current_date = slugifyDate(currentDate());
-        const rawResponse = await pythonAxiosInstance.post(`/__api/inventory/master/download/raw/${current_date}`);
-        const inventoryResponse = await pythonAxiosInstance.post(`/__api/inventory/master/download/inventory/${current_date}`);
-        const stockResponse = await pythonAxiosInstance.post(`/__api/inventory/master/download/stock/${current_date}`);
+        const allResponse = await pythonAxiosInstance.post(`/__api/inventory/master/download/all/${current_date}`);
 
-        if (rawResponse.data.success && inventoryResponse.data.success && stockResponse.data.success) {
+        if (allResponse.data.success) {
             pythonAxiosInstance.post("/__api/inventory/master/update/option");
         }
     }
@@ -21,7 +21,7 @@
  * @author Rizky Irswanda <rizky.irswanda115@gmail.com>
  */
 
-import { RequestBarangExtended, RequestCreateBarang } from "@/shared/typings/types/inventory";
+import { RequestBarangExtended, RequestCreateBarang, RequestParameterFilter } from "@/shared/typings/types/inventory";
 import { Body, Controller, Get, Logger, Param, ParseIntPipe, Post, Put, StreamableFile, UseInterceptors, Response } from "@nestjs/common";
 import { RequestInventoryService } from "./request-inventory.service";
 import { RequestBarang } from "./schema/request-inventory.schema";
@@ -125,4 +125,14 @@ export class RequestInventoryController {
     ): Promise<StreamableFile> {
         return await this.requestInventoryService.requestDownloadByUserIdAndDateId(user_id, date_id, res);
     }
+
+    @Get("download/user/all")
+    public async requestDownloadUserAll(@Response({ passthrough: true }) res: any): Promise<StreamableFile> {
+        return await this.requestInventoryService.requestDownloadUserAll(res);
+    }
+
+    @Post("download/filter")
+    public async requestDownloadFilter(@Body() body: RequestParameterFilter, @Response({ passthrough: true }) res: any): Promise<StreamableFile> {
+        return await this.requestInventoryService.requestDownloadFilter(body, res);
+    }
 }
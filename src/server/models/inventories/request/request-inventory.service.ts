@@ -23,7 +23,7 @@
 
 import { ResponseFormat } from "@/server/common/interceptors/response-format.interceptor";
 import { ResponseObject } from "@/shared/typings/interfaces/inventory.interface";
-import { JumlahData, RequestBarangExtended, RequestCreateBarang } from "@/shared/typings/types/inventory";
+import { JumlahData, RequestBarangExtended, RequestCreateBarang, RequestParameterFilter } from "@/shared/typings/types/inventory";
 import { currentDate, responseFormat, slugifyDate } from "@/shared/utils/util";
 import { readJSON } from "@/shared/utils/json";
 import { Injectable, StreamableFile } from "@nestjs/common";
@@ -460,6 +460,40 @@ export class RequestInventoryService {
         }
     }
 
+    public async requestDownloadUserAll(res: any): Promise<StreamableFile> {
+        const option_response = await pythonAxiosInstance.post("/__api/inventory/request/update/option");
+
+        if (option_response.data.success) {
+            const current_date = slugifyDate(currentDate());
+            const response = await pythonAxiosInstance.post(`/__api/inventory/request/download/user/all/${current_date}`);
+
+            if (response.data.success) {
+                const file = createReadStream(join(process.cwd(), `spreadsheets/inventories/request/Pengguna ${current_date}.zip`));
+                res.set({
+                    "Content-Type": "application/zip",
+                    "Content-Disposition": `attachment; filename="Laporan Pengguna Permintaan Barang ${current_date}.zip"`,
+                });
+
+                return new StreamableFile(file);
+            }
+        }
+    }
+
+    public async requestDownloadFilter(filter: RequestParameterFilter, res: any): Promise<StreamableFile> {
+        const current_date = slugifyDate(currentDate());
+        const response = await pythonAxiosInstance.post(`/__api/inventory/request/download/filter/${current_date}`, filter);
+
+        if (response.data.success) {
+            const file = createReadStream(join(process.cwd(), `spreadsheets/inventories/request/Filter ${current_date}.xlsx`));
+            res.set({
+                "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                "Content-Disposition": `attachment; filename="Laporan Filter Permintaan Barang ${current_date}.xlsx"`,
+            });
+
+            return new StreamableFile(file);
+        }
+    }
+
     @Cron(CronExpression.EVERY_DAY_AT_MIDNIGHT)
     public async requestScheduledDownload() {
         const current_date = slugifyDate(currentDate());
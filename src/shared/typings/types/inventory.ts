@@ -58,6 +58,13 @@ export type RequestCreateBarang = {
     deskripsi: string | null;
 };
 
+export type RequestParameterFilter = {
+    username: string[];
+    tanggal_awal: string | null;
+    tanggal_akhir: string | null;
+    status: number[];
+};
+
 export type MasterParameterKategori = {
     kategori: string;
     rekening: string | null;